@@ -0,0 +1,39 @@
+"""
+Gunicorn configuration for the CryptoBot web dashboard
+Usage: gunicorn -c gunicorn_conf.py
+"""
+
+import os
+
+wsgi_app = "web.app:app"
+bind = "0.0.0.0:8779"
+
+# The trading bot runs inside the dashboard process, so more than one worker
+# would mean more than one bot trading the same account. Concurrency comes
+# from threads (or green threads when SOCKETIO_ASYNC_MODE=gevent/eventlet,
+# which is opt-in; see the note at the top of web/app.py).
+workers = 1
+ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "threading")
+if ASYNC_MODE == "gevent":
+    # WebSocket-capable gevent worker from gevent-websocket
+    worker_class = "geventwebsocket.gunicorn.workers.GeventWebSocketWorker"
+    worker_connections = 1024
+elif ASYNC_MODE == "eventlet":
+    worker_class = "eventlet"
+    worker_connections = 1000
+else:
+    worker_class = "gthread"
+    threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+# Manual screener runs and Claude analysis can take a while
+timeout = 180
+graceful_timeout = 30
+
+accesslog = None
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    """Start the trading bot once the worker has loaded the app"""
+    from web.app import autostart_bot
+    autostart_bot()
@@ -10,6 +10,7 @@ import numpy as np
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from anthropic import Anthropic
+from src.utils import json_dumps
 
 
 def convert_numpy_types(obj: Any) -> Any:
@@ -443,7 +444,7 @@ Return ONLY valid JSON, no additional text."""
                 f.write(f"\n{'=' * 80}\n")
                 f.write(f"Analysis at {datetime.now().isoformat()}\n")
                 f.write(f"{'-' * 80}\n")
-                f.write(json.dumps(analysis, indent=2))
+                f.write(json_dumps(analysis, indent=True))
                 f.write(f"\n{'=' * 80}\n")
 
         except Exception as e:
@@ -11,6 +11,8 @@ import json
 import requests
 import logging
 import jwt
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -45,6 +47,7 @@ class CoinbaseClient:
 
         self.base_url = self.BASE_URL_SANDBOX if sandbox else self.BASE_URL_LIVE
         self.logger = logging.getLogger("CryptoBot.Coinbase")
+        self.session = self._create_session()
 
         # Detect authentication type
         self.is_cdp_key = self.api_key and self.api_key.startswith("organizations/")
@@ -59,6 +62,30 @@ class CoinbaseClient:
             self.logger.info(f"API Key starts with: {self.api_key[:20]}...")
             self.logger.info(f"Using base URL: {self.base_url}")
 
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session so TLS connections are reused across calls
+
+        Returns:
+            Configured requests session
+        """
+        # Retry's default allowed methods exclude POST, so orders are never resent
+        retry = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers.update({
+            "User-Agent": "CryptoBot/1.0",
+            "Connection": "keep-alive"
+        })
+        return session
+
     def _generate_jwt_token(self, uri: str) -> str:
         """
         Generate JWT token for CDP API authentication
@@ -71,11 +98,12 @@ class CoinbaseClient:
         """
         import secrets
 
-        # Debug: Check if key looks like PEM format
-        self.logger.debug(f"Private key starts with: {self.api_secret[:30]}...")
-        self.logger.debug(f"Private key length: {len(self.api_secret)}")
-        self.logger.debug(f"Has BEGIN marker: {'BEGIN EC PRIVATE KEY' in self.api_secret}")
-        self.logger.debug(f"Has END marker: {'END EC PRIVATE KEY' in self.api_secret}")
+        # Debug: Check if key looks like PEM format (runs on every request, so gate it)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Private key starts with: %s...", self.api_secret[:30])
+            self.logger.debug("Private key length: %d", len(self.api_secret))
+            self.logger.debug("Has BEGIN marker: %s", 'BEGIN EC PRIVATE KEY' in self.api_secret)
+            self.logger.debug("Has END marker: %s", 'END EC PRIVATE KEY' in self.api_secret)
 
         # Build JWT
         now = int(time.time())
@@ -153,11 +181,11 @@ class CoinbaseClient:
         if self.is_cdp_key:
             # CDP API Key - Use JWT authentication
             uri = f"{method} {self.base_url.replace('https://', '')}{endpoint}"
-            self.logger.debug(f"Generating JWT for URI: {uri}")
+            self.logger.debug("Generating JWT for URI: %s", uri)
 
             try:
                 token = self._generate_jwt_token(uri)
-                self.logger.debug(f"JWT token generated (first 30 chars): {token[:30]}...")
+                self.logger.debug("JWT token generated (first 30 chars): %.30s...", token)
 
                 headers = {
                     "Authorization": f"Bearer {token}",
@@ -173,12 +201,12 @@ class CoinbaseClient:
             if data:
                 body = json.dumps(data)
 
-            self.logger.debug(f"Request: {method} {endpoint}")
-            self.logger.debug(f"Timestamp: {timestamp}")
-            self.logger.debug(f"Message to sign: {timestamp}{method}{endpoint}{body}")
+            self.logger.debug("Request: %s %s", method, endpoint)
+            self.logger.debug("Timestamp: %s", timestamp)
+            self.logger.debug("Message to sign: %s%s%s%s", timestamp, method, endpoint, body)
 
             signature = self._generate_signature(timestamp, method, endpoint, body)
-            self.logger.debug(f"Signature (first 20 chars): {signature[:20]}...")
+            self.logger.debug("Signature (first 20 chars): %.20s...", signature)
 
             headers = {
                 "CB-ACCESS-KEY": self.api_key,
@@ -189,16 +217,16 @@ class CoinbaseClient:
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = self.session.get(url, headers=headers, params=params, timeout=30)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                response = self.session.post(url, headers=headers, json=data, timeout=30)
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=30)
+                response = self.session.delete(url, headers=headers, timeout=30)
             else:
                 self.logger.error(f"Unsupported HTTP method: {method}")
                 return None
 
-            self.logger.debug(f"Response status: {response.status_code}")
+            self.logger.debug("Response status: %s", response.status_code)
             response.raise_for_status()
             return response.json()
 
@@ -356,6 +384,34 @@ class CoinbaseClient:
         )
         return response
 
+    def get_prices_batch(self, product_ids: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several products in a single request
+
+        Args:
+            product_ids: Product IDs (e.g., ["BTC-USD", "ETH-USD"])
+
+        Returns:
+            Dictionary mapping product ID to price (products without a price are omitted)
+        """
+        if not product_ids:
+            return {}
+
+        response = self._make_request(
+            "GET",
+            "/api/v3/brokerage/products",
+            params={"product_ids": list(product_ids)}
+        )
+
+        prices = {}
+        if response and "products" in response:
+            for product in response["products"]:
+                try:
+                    prices[product["product_id"]] = float(product["price"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+        return prices
+
     def get_current_price(self, product_id: str) -> Optional[float]:
         """
         Get current price for a product
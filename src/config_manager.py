@@ -7,6 +7,7 @@ import json
 import os
 from typing import Dict, Any, Optional
 import logging
+import threading
 from copy import deepcopy
 
 
@@ -22,6 +23,7 @@ class ConfigManager:
         "max_positions": 3,
         "max_position_pct": 0.25,
         "check_interval_sec": 3600,
+        "ws_ticker_enabled": True,  # Stream prices over WebSocket (REST fallback)
         "verbose": True,
 
         # Fee Management
@@ -217,6 +219,9 @@ class ConfigManager:
         self.config = deepcopy(self.DEFAULT_CONFIG)
         self.logger = logging.getLogger("CryptoBot.Config")
 
+        # Guards self.config when one instance is shared across request threads
+        self._lock = threading.RLock()
+
         # Load config if exists
         if os.path.exists(config_path):
             self.load()
@@ -236,8 +241,10 @@ class ConfigManager:
                 loaded_config = json.load(f)
 
             # Merge with defaults (in case new fields were added)
-            self.config = deepcopy(self.DEFAULT_CONFIG)
-            self.config.update(loaded_config)
+            config = deepcopy(self.DEFAULT_CONFIG)
+            config.update(loaded_config)
+            with self._lock:
+                self.config = config
 
             self.logger.info(f"Loaded config from {self.config_path}")
             return self.config
@@ -258,7 +265,7 @@ class ConfigManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
 
-            with open(self.config_path, 'w') as f:
+            with self._lock, open(self.config_path, 'w') as f:
                 json.dump(self.config, f, indent=2)
 
             self.logger.info(f"Saved config to {self.config_path}")
@@ -284,7 +291,8 @@ class ConfigManager:
             True if successful
         """
         try:
-            self.config[key] = value
+            with self._lock:
+                self.config[key] = value
             self.logger.info(f"Updated config: {key} = {value}")
             return True
         except Exception as e:
@@ -302,7 +310,8 @@ class ConfigManager:
             True if successful
         """
         try:
-            self.config.update(updates)
+            with self._lock:
+                self.config.update(updates)
             self.logger.info(f"Updated {len(updates)} config values")
             return True
         except Exception as e:
@@ -325,7 +334,8 @@ class ConfigManager:
 
         try:
             preset = self.PRESETS[preset_name]
-            self.config.update(preset)
+            with self._lock:
+                self.config.update(preset)
             self.logger.info(f"Applied {preset_name} preset")
             return True
 
@@ -385,7 +395,8 @@ class ConfigManager:
 
     def get_all(self) -> Dict[str, Any]:
         """Get entire configuration dictionary"""
-        return deepcopy(self.config)
+        with self._lock:
+            return deepcopy(self.config)
 
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults"""
@@ -5,9 +5,12 @@ Includes caching to minimize API calls
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import time
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 from src.utils import RateLimiter
@@ -20,57 +23,219 @@ class DataCollector:
     COINMARKETCAP_URL = "https://pro-api.coinmarketcap.com/v1"  # Requires API key (free tier: 10k calls/month)
     CRYPTOCOMPARE_URL = "https://min-api.cryptocompare.com/data"  # Free, 100k calls/month
 
-    def __init__(self, coinbase_client, cache_minutes: int = 60):
+    # Minimum cache lifetimes for slow-moving market indicators (seconds).
+    # These only change every few hours, so they are held at least this long
+    # even when cache_minutes is tuned down for fresher candles.
+    FEAR_GREED_TTL_SEC = 1800
+    BTC_DOMINANCE_TTL_SEC = 3600
+
+    # Forced Fear & Greed refreshes (use_cache=False) within this window share
+    # the last fetch, so several open health checks don't hammer alternative.me
+    FEAR_GREED_REFRESH_SEC = 60
+
+    # Streamed ticker prices older than this fall back to REST
+    WS_MAX_AGE_SEC = 10
+
+    # Price cache lifetimes (seconds) by how the price is used
+    TTL_POSITION = 2.0    # Exit decisions on open positions
+    TTL_SNAPSHOT = 15.0   # Market context / key coin snapshot
+    TTL_SCREENER = 60.0   # Screener scoring
+
+    # Floor on every price lookup, so callers polling the same product within
+    # this window (dashboard polls, enrichment, close) share one network call
+    PRICE_MEMO_SEC = 2.0
+
+    def __init__(self, coinbase_client, cache_minutes: int = 60, ticker=None):
         """
         Initialize data collector
 
         Args:
             coinbase_client: CoinbaseClient instance
             cache_minutes: Cache duration in minutes
+            ticker: PriceTicker instance for streamed prices (optional)
         """
         self.coinbase = coinbase_client
         self.cache_minutes = cache_minutes
+        self.ticker = ticker
         self.logger = logging.getLogger("CryptoBot.DataCollector")
 
+        # Keep-alive connections for the market data APIs (Fear & Greed, CryptoCompare)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
         # Cache
         self.cache = {}
         self.cache_timestamps = {}
 
-    def _is_cache_valid(self, key: str) -> bool:
-        """Check if cached data is still valid"""
+        # Price cache: product_id -> (price, time.monotonic() when fetched)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self._price_lock = threading.Lock()
+
+        # Price requests in flight, shared by concurrent callers for the same product
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _is_cache_valid(self, key: str, min_ttl_sec: float = 0) -> bool:
+        """
+        Check if cached data is still valid
+
+        Args:
+            key: Cache key
+            min_ttl_sec: Minimum lifetime for this key, overrides a shorter cache_minutes
+
+        Returns:
+            True if the cached entry can be used
+        """
         if key not in self.cache_timestamps:
             return False
 
         age = datetime.now() - self.cache_timestamps[key]
-        return age.total_seconds() < (self.cache_minutes * 60)
+        return age.total_seconds() < max(self.cache_minutes * 60, min_ttl_sec)
 
     def _set_cache(self, key: str, data: Any):
         """Set cache with timestamp"""
         self.cache[key] = data
         self.cache_timestamps[key] = datetime.now()
 
-    def get_current_price(self, product_id: str, use_cache: bool = True) -> Optional[float]:
+    def _price_max_age(self, use_cache: bool, max_age_sec: Optional[float]) -> float:
+        """Resolve the legacy use_cache flag into a cache lifetime in seconds"""
+        if max_age_sec is None:
+            max_age_sec = self.cache_minutes * 60 if use_cache else 0
+        return max(max_age_sec, self.PRICE_MEMO_SEC)
+
+    def _get_cached_price(self, product_id: str, max_age_sec: float) -> Optional[float]:
+        """Get a streamed or cached price no older than max_age_sec"""
+        # Streamed price is fresher than anything cached or polled
+        if self.ticker is not None:
+            price = self.ticker.get_price(product_id, self.WS_MAX_AGE_SEC)
+            if price:
+                return price
+
+        entry = self._price_cache.get(product_id)
+        if entry is not None and time.monotonic() - entry[1] < max_age_sec:
+            return entry[0]
+        return None
+
+    def _store_price(self, product_id: str, price: float):
+        """Cache a freshly fetched price"""
+        with self._price_lock:
+            self._price_cache[product_id] = (price, time.monotonic())
+
+    def invalidate_price(self, product_id: str):
+        """
+        Drop the cached price for a product (e.g. after an order fills)
+
+        Args:
+            product_id: Product ID (e.g., BTC-USD)
+        """
+        with self._price_lock:
+            self._price_cache.pop(product_id, None)
+
+    def _fetch_price(self, product_id: str) -> Optional[float]:
+        """
+        Fetch a price from Coinbase, collapsing concurrent requests into one
+
+        Callers asking for a product that is already being fetched wait for
+        that request instead of issuing their own.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(product_id)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[product_id] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            price = self.coinbase.get_current_price(product_id)
+            if price:
+                self._store_price(product_id, price)
+            future.set_result(price)
+            return price
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(product_id, None)
+
+    def get_current_price(self, product_id: str, use_cache: bool = True,
+                          max_age_sec: Optional[float] = None) -> Optional[float]:
         """
         Get current price from Coinbase
 
         Args:
             product_id: Product ID (e.g., BTC-USD)
-            use_cache: Use cached price if available
+            use_cache: Use cached price if available (ignored when max_age_sec is given)
+            max_age_sec: Maximum acceptable age of a cached price (see TTL_* constants)
 
         Returns:
             Current price
         """
-        cache_key = f"price_{product_id}"
+        max_age_sec = self._price_max_age(use_cache, max_age_sec)
 
-        if use_cache and self._is_cache_valid(cache_key):
-            return self.cache[cache_key]
+        price = self._get_cached_price(product_id, max_age_sec)
+        if price:
+            return price
 
-        price = self.coinbase.get_current_price(product_id)
+        return self._fetch_price(product_id)
 
-        if price:
-            self._set_cache(cache_key, price)
+    def get_current_prices(self, product_ids: List[str], use_cache: bool = True,
+                           max_age_sec: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """
+        Get current prices for several products
 
-        return price
+        Streamed and cached prices are used first, the rest are fetched with
+        one batch request; anything the batch call misses is fetched per
+        product concurrently.
+
+        Args:
+            product_ids: Product IDs (e.g., ["BTC-USD", "ETH-USD"])
+            use_cache: Use cached prices if available (ignored when max_age_sec is given)
+            max_age_sec: Maximum acceptable age of a cached price (see TTL_* constants)
+
+        Returns:
+            Dictionary mapping product ID to price (None if unavailable)
+        """
+        product_ids = list(dict.fromkeys(product_ids))
+        if not product_ids:
+            return {}
+
+        max_age_sec = self._price_max_age(use_cache, max_age_sec)
+
+        prices = {}
+        for product_id in product_ids:
+            price = self._get_cached_price(product_id, max_age_sec)
+            if price:
+                prices[product_id] = price
+
+        missing = [product_id for product_id in product_ids if product_id not in prices]
+        if len(missing) > 1:
+            try:
+                batch = self.coinbase.get_prices_batch(missing)
+                for product_id, price in batch.items():
+                    self._store_price(product_id, price)
+                prices.update(batch)
+            except Exception as e:
+                self.logger.warning(f"Batch price request failed, fetching individually: {e}")
+            missing = [product_id for product_id in missing if product_id not in prices]
+
+        if not missing:
+            return {product_id: prices.get(product_id) for product_id in product_ids}
+
+        def fetch(product_id):
+            try:
+                return self.get_current_price(product_id, max_age_sec=max_age_sec)
+            except Exception as e:
+                self.logger.error(f"Error fetching price for {product_id}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            prices.update(zip(missing, executor.map(fetch, missing)))
+
+        return {product_id: prices.get(product_id) for product_id in product_ids}
 
     def get_historical_candles(self, product_id: str, granularity: str = "ONE_HOUR",
                               days: int = 30) -> Optional[pd.DataFrame]:
@@ -171,7 +336,7 @@ class DataCollector:
 
         try:
             # Get current price
-            current_price = self.get_current_price(product_id)
+            current_price = self.get_current_price(product_id, max_age_sec=self.TTL_SCREENER)
             if not current_price:
                 return None
 
@@ -210,20 +375,30 @@ class DataCollector:
             self.logger.error(f"Error calculating price changes for {product_id}: {e}")
             return None
 
-    def get_fear_greed_index(self) -> Optional[Dict]:
+    def get_fear_greed_index(self, use_cache: bool = True) -> Optional[Dict]:
         """
         Get Fear & Greed Index from alternative.me
 
+        Args:
+            use_cache: Use the cached index if available; when False, only a
+                value fetched within FEAR_GREED_REFRESH_SEC is reused
+
         Returns:
             Dictionary with fear/greed data
         """
         cache_key = "fear_greed"
 
-        if self._is_cache_valid(cache_key):
+        if use_cache:
+            fresh = self._is_cache_valid(cache_key, self.FEAR_GREED_TTL_SEC)
+        else:
+            fetched_at = self.cache_timestamps.get(cache_key)
+            fresh = fetched_at is not None and \
+                (datetime.now() - fetched_at).total_seconds() < self.FEAR_GREED_REFRESH_SEC
+        if fresh:
             return self.cache[cache_key]
 
         try:
-            response = requests.get(self.FEAR_GREED_URL, timeout=10)
+            response = self.session.get(self.FEAR_GREED_URL, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -253,7 +428,7 @@ class DataCollector:
         """
         cache_key = "btc_dominance"
 
-        if self._is_cache_valid(cache_key):
+        if self._is_cache_valid(cache_key, self.BTC_DOMINANCE_TTL_SEC):
             return self.cache[cache_key]
 
         try:
@@ -264,7 +439,7 @@ class DataCollector:
                 "tsym": "USD"
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -311,7 +486,7 @@ class DataCollector:
                 "tsym": "USD"
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -390,12 +565,15 @@ class DataCollector:
         """Clear all cached data"""
         self.cache.clear()
         self.cache_timestamps.clear()
+        with self._price_lock:
+            self._price_cache.clear()
         self.logger.info("Cleared data cache")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return {
             "cached_items": len(self.cache),
+            "cached_prices": len(self._price_cache),
             "oldest_cache": min(self.cache_timestamps.values()) if self.cache_timestamps else None,
             "newest_cache": max(self.cache_timestamps.values()) if self.cache_timestamps else None
         }
@@ -3,13 +3,15 @@ Performance Tracker for CryptoBot
 Tracks trades, calculates metrics, and generates reports
 """
 
-import json
 import csv
+import bisect
+import io
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 import os
 import pytz
+from src.utils import json_dumps, json_loads
 
 
 class PerformanceTracker:
@@ -38,6 +40,12 @@ class PerformanceTracker:
         if not os.path.exists(self.trade_log_file):
             self._initialize_trade_log()
 
+        # Metrics only change when the trade log does: (log mtime_ns, size) -> metrics
+        self._metrics_cache: Optional[tuple] = None
+
+        # Time index over the trade log: ((log mtime_ns, size), trades, entry epochs)
+        self._trade_index: Optional[tuple] = None
+
     def _initialize_trade_log(self):
         """Create trade log CSV with headers"""
         with open(self.trade_log_file, 'w', newline='') as f:
@@ -76,6 +84,8 @@ class PerformanceTracker:
                     trade_data.get('notes', '')
                 ])
 
+            self._metrics_cache = None
+            self._trade_index = None
             self.logger.info(f"Logged trade: {trade_data.get('side')} {trade_data.get('product_id')}")
 
         except Exception as e:
@@ -83,26 +93,171 @@ class PerformanceTracker:
 
     def get_all_trades(self) -> List[Dict]:
         """Get all trades from log"""
-        trades = []
+        return list(self.iter_trades())
 
+    def iter_trades(self) -> Iterator[Dict]:
+        """
+        Iterate over trades in the log without loading it all into memory
+
+        Yields:
+            Trade rows, oldest first
+        """
         try:
             with open(self.trade_log_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    trades.append(row)
+                yield from csv.DictReader(f)
 
         except Exception as e:
             self.logger.error(f"Error reading trade log: {e}")
 
-        return trades
+    def get_trades_since(self, cutoff: datetime) -> List[Dict]:
+        """
+        Get trades logged at or after a point in time
+
+        The trade log is indexed by timestamp once per change, so repeated
+        calls binary-search the index instead of parsing every row. The
+        returned trade dicts are shared and must not be modified.
+
+        Args:
+            cutoff: Earliest trade time (naive values are taken as US/Eastern)
+
+        Returns:
+            Trades at or after cutoff, oldest first
+        """
+        if cutoff.tzinfo is None:
+            cutoff = self.timezone.localize(cutoff)
+
+        trades, epochs = self._get_trade_index()
+        return trades[bisect.bisect_left(epochs, cutoff.timestamp()):]
+
+    def summarize_closed_trades(self, trades: List[Dict]) -> Dict:
+        """
+        Count wins and losses among closed trades in one pass
+
+        SELL rows carry the realized P&L; pnl_pct is logged in percent.
+
+        Args:
+            trades: Trade rows, e.g. from get_trades_since()
+
+        Returns:
+            Dictionary with closed, wins, losses and avg_loss_pct
+        """
+        closed = wins = losses = 0
+        loss_pct_sum = 0.0
+        for t in trades:
+            if t.get('side') != 'SELL':
+                continue
+            closed += 1
+            pnl = float(t.get('net_pnl') or 0)
+            if pnl > 0:
+                wins += 1
+            elif pnl < 0:
+                losses += 1
+                loss_pct_sum += float(t.get('pnl_pct') or 0)
+
+        return {
+            "closed": closed,
+            "wins": wins,
+            "losses": losses,
+            "avg_loss_pct": loss_pct_sum / losses if losses else 0.0
+        }
+
+    def _get_trade_index(self) -> Tuple[List[Dict], List[float]]:
+        """All trades in time order, with their timestamps as epoch seconds"""
+        try:
+            st = os.stat(self.trade_log_file)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return [], []
+
+        cached = self._trade_index
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        rows = []
+        for trade in self.iter_trades():
+            try:
+                epoch = datetime.fromisoformat(trade['timestamp']).timestamp()
+            except (KeyError, TypeError, ValueError):
+                epoch = 0.0
+            rows.append((epoch, trade))
+
+        # The log is appended in time order; only sort if that was violated
+        if any(rows[i][0] > rows[i + 1][0] for i in range(len(rows) - 1)):
+            rows.sort(key=lambda row: row[0])
+
+        trades = [trade for _, trade in rows]
+        epochs = [epoch for epoch, _ in rows]
+        self._trade_index = (key, trades, epochs)
+        return trades, epochs
+
+    def get_recent_trades(self, n: int = 10) -> List[Dict]:
+        """
+        Get the last n trades, reading only the tail of the log
+
+        Args:
+            n: Number of trades to return
+
+        Returns:
+            List of up to n trades, oldest first
+        """
+        if n <= 0:
+            return []
+
+        try:
+            with open(self.trade_log_file, 'rb') as f:
+                header = f.readline().decode('utf-8').strip()
+                data_start = f.tell()
+
+                # Read backwards in blocks until we have n complete lines
+                f.seek(0, os.SEEK_END)
+                pos = f.tell()
+                block_size = 8192
+                chunk = b''
+                while pos > data_start and chunk.count(b'\n') <= n:
+                    read_size = min(block_size, pos - data_start)
+                    pos -= read_size
+                    f.seek(pos)
+                    chunk = f.read(read_size) + chunk
+
+                # Unless the block starts right after a line break, its first line is partial
+                if pos > data_start:
+                    f.seek(pos - 1)
+                    if f.read(1) != b'\n':
+                        chunk = chunk[chunk.find(b'\n') + 1:]
+
+            # Parse with the csv module so quoted multi-line notes stay intact
+            text = header + '\n' + chunk.decode('utf-8')
+            trades = list(csv.DictReader(io.StringIO(text, newline='')))
+            return trades[-n:]
+
+        except Exception as e:
+            self.logger.error(f"Error reading trade log: {e}")
+            return []
 
     def calculate_metrics(self) -> Dict:
         """
-        Calculate performance metrics
+        Calculate performance metrics, reusing the last result until the trade log changes
 
         Returns:
             Dictionary of metrics
         """
+        try:
+            st = os.stat(self.trade_log_file)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+
+        cached = self._metrics_cache
+        if key is not None and cached is not None and cached[0] == key:
+            return dict(cached[1])
+
+        metrics = self._calculate_metrics()
+        if key is not None:
+            self._metrics_cache = (key, metrics)
+        return dict(metrics)
+
+    def _calculate_metrics(self) -> Dict:
+        """Calculate performance metrics from the full trade log"""
         trades = self.get_all_trades()
 
         if not trades:
@@ -204,8 +359,8 @@ class PerformanceTracker:
             # Load existing snapshots
             snapshots = []
             if os.path.exists(self.performance_file):
-                with open(self.performance_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.performance_file, 'rb') as f:
+                    data = json_loads(f.read())
                     snapshots = data.get('snapshots', [])
 
             # Add new snapshot
@@ -213,7 +368,7 @@ class PerformanceTracker:
 
             # Save
             with open(self.performance_file, 'w') as f:
-                json.dump({'snapshots': snapshots}, f, indent=2)
+                f.write(json_dumps({'snapshots': snapshots}, indent=True))
 
             self.logger.info("Saved performance snapshot")
 
@@ -224,11 +379,13 @@ class PerformanceTracker:
         """Generate daily performance report"""
         trades = self.get_all_trades()
 
-        # Filter today's trades (in Eastern timezone)
+        # Filter today's trades (in Eastern timezone). Timestamps are logged as
+        # Eastern ISO strings, so the date is their "YYYY-MM-DD" prefix
         today = datetime.now(self.timezone).date()
+        today_str = today.isoformat()
         today_trades = [
             t for t in trades
-            if datetime.fromisoformat(t['timestamp']).date() == today
+            if t['timestamp'][:10] == today_str
         ]
 
         daily_pnl = sum([float(t.get('net_pnl', 0)) for t in today_trades if t.get('net_pnl')])
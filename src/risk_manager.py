@@ -5,17 +5,22 @@ Handles position sizing, stop losses, and risk controls
 
 import logging
 import os
-import json
 import shutil
 from typing import Dict, Optional, List, Tuple
 from datetime import datetime
+import numpy as np
 import pytz
-from src.utils import calculate_fees, calculate_position_size, calculate_break_even_price
+from src.utils import calculate_fees, calculate_position_size, calculate_break_even_price, calculate_pnl_batch, json_dumps, json_loads
 
 
 class Position:
     """Represents an open trading position"""
 
+    __slots__ = (
+        "product_id", "quantity", "entry_price", "entry_fee", "timestamp",
+        "tp_hit", "original_quantity", "peak_price", "peak_pnl_pct"
+    )
+
     def __init__(self, product_id: str, quantity: float, entry_price: float,
                  entry_fee: float, timestamp: datetime):
         """
@@ -67,6 +72,7 @@ class RiskManager:
 
         # Track positions
         self.positions: Dict[str, Position] = {}
+        self.position_count = 0  # Kept in step with self.positions
 
         # Initialize capital and metrics BEFORE loading positions
         # (These will be overwritten by _load_positions if saved state exists)
@@ -115,7 +121,7 @@ class RiskManager:
 
         # Check position count
         max_positions = self.config.get("max_positions", 3)
-        if len(self.positions) >= max_positions:
+        if self.position_count >= max_positions:
             return False, f"Max positions ({max_positions}) reached"
 
         # Check minimum trade size
@@ -193,6 +199,7 @@ class RiskManager:
         )
 
         self.positions[product_id] = position
+        self.position_count = len(self.positions)
 
         # Deduct cost from simulated capital (entry cost + fees)
         position_cost = (quantity * entry_price) + entry_fee
@@ -277,6 +284,7 @@ class RiskManager:
 
         # Remove position
         del self.positions[product_id]
+        self.position_count = len(self.positions)
 
         # Save positions to disk
         self._save_positions()
@@ -443,6 +451,41 @@ class RiskManager:
             "break_even_price": self.get_break_even_price(product_id)
         }
 
+    def get_positions_pnl(self, prices: Dict[str, float]) -> Dict[str, Dict]:
+        """
+        Get current P&L for several positions in one vectorized pass
+
+        Args:
+            prices: Current price per product ID
+
+        Returns:
+            P&L details (net_pnl, pnl_pct, stop_loss_price) per product ID
+        """
+        positions = [pos for pos in list(self.positions.values()) if prices.get(pos.product_id)]
+        if not positions:
+            return {}
+
+        quantities = np.array([pos.quantity for pos in positions], dtype=float)
+        current_prices = np.array([prices[pos.product_id] for pos in positions], dtype=float)
+        taker_fee = self.config.get("coinbase_taker_fee", 0.008)
+
+        pnl = calculate_pnl_batch(
+            np.array([pos.entry_price for pos in positions], dtype=float),
+            current_prices,
+            quantities,
+            np.array([pos.entry_fee for pos in positions], dtype=float),
+            current_prices * quantities * taker_fee
+        )
+
+        return {
+            pos.product_id: {
+                "net_pnl": float(pnl["net_pnl"][i]),
+                "pnl_pct": float(pnl["pnl_pct"][i]) * 100,
+                "stop_loss_price": self.get_stop_loss_price(pos.product_id)
+            }
+            for i, pos in enumerate(positions)
+        }
+
     def get_all_positions(self) -> List[Dict]:
         """Get list of all open positions"""
         return [
@@ -453,7 +496,7 @@ class RiskManager:
                 "entry_fee": pos.entry_fee,
                 "timestamp": pos.timestamp.isoformat()
             }
-            for pos in self.positions.values()
+            for pos in list(self.positions.values())
         ]
 
     def reset_daily_metrics(self):
@@ -466,8 +509,8 @@ class RiskManager:
         """Load positions and capital state from disk"""
         try:
             if os.path.exists(self.positions_file):
-                with open(self.positions_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.positions_file, 'rb') as f:
+                    data = json_loads(f.read())
 
                 # Load metadata (capital state) if it exists
                 if '_metadata' in data:
@@ -500,13 +543,14 @@ class RiskManager:
                         timestamp=datetime.fromisoformat(pos_data['entry_time'])
                     )
                     self.positions[product_id] = position
+                    self.position_count = len(self.positions)
 
                     # Calculate total capital locked in positions
                     entry_value = position.quantity * position.entry_price
                     total_position_value += (entry_value + position.entry_fee)
 
                 # If loading legacy format, calculate current_capital
-                if '_metadata' not in data and len(self.positions) > 0:
+                if '_metadata' not in data and self.position_count > 0:
                     # Capital = initial_capital - money locked in positions
                     self.current_capital = self.initial_capital - total_position_value
                     self.logger.info(f"Migrated from legacy format: Initial=${self.initial_capital:.2f}, Locked in positions=${total_position_value:.2f}, Available=${self.current_capital:.2f}")
@@ -514,7 +558,7 @@ class RiskManager:
                     self._save_positions()
                     self.logger.info(f"Migrated to new format with metadata")
 
-                self.logger.info(f"Loaded {len(self.positions)} positions from {self.positions_file}")
+                self.logger.info(f"Loaded {self.position_count} positions from {self.positions_file}")
         except Exception as e:
             self.logger.error(f"Error loading positions: {e}")
 
@@ -543,8 +587,9 @@ class RiskManager:
                 }
 
             with open(self.positions_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(json_dumps(data, indent=True))
 
-            self.logger.debug(f"Saved {len(self.positions)} positions and capital state (${self.current_capital:.2f}) to {self.positions_file}")
+            self.logger.debug("Saved %d positions and capital state ($%.2f) to %s",
+                              self.position_count, self.current_capital, self.positions_file)
         except Exception as e:
             self.logger.error(f"Error saving positions: {e}")
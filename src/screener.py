@@ -13,6 +13,9 @@ from src.signals import SignalGenerator
 class MarketScreener:
     """Screens market for trading opportunities"""
 
+    # Pegged assets never produce momentum/mean-reversion setups
+    STABLECOINS = {"USDC", "USDT", "DAI", "PYUSD", "GUSD", "PAX", "TUSD", "EURC"}
+
     def __init__(self, config: Dict, data_collector, signal_generator: SignalGenerator, news_sentiment=None, coingecko=None, claude_analyst=None, bot=None):
         """
         Initialize market screener
@@ -35,12 +38,58 @@ class MarketScreener:
         self.bot = bot
         self.logger = logging.getLogger("CryptoBot.Screener")
 
-    def screen_coins(self, mode: Optional[str] = None) -> List[Dict]:
+        # Tradeable subset of screener_coins, resolved by build_universe()
+        self.universe: Optional[List[str]] = None
+        self._universe_source: Optional[tuple] = None
+
+    def build_universe(self) -> List[str]:
+        """
+        Resolve the configured screener coins against the exchange listing once
+
+        Drops stablecoins and products that are delisted or not currently
+        tradeable so screen_coins() doesn't spend candle requests on them.
+
+        Returns:
+            List of product IDs to screen
+        """
+        coins = list(self.config.get("screener_coins", []))
+        universe = [c for c in coins if c.split('-')[0] not in self.STABLECOINS]
+
+        try:
+            products = self.data_collector.coinbase.get_products()
+            if products:
+                tradeable = {
+                    p.get("product_id") for p in products
+                    if p.get("status") == "online"
+                    and not p.get("trading_disabled")
+                    and not p.get("is_disabled")
+                }
+                dropped = [c for c in universe if c not in tradeable]
+                if dropped:
+                    self.logger.info("Screener universe: skipping untradeable products %s", dropped)
+                universe = [c for c in universe if c in tradeable]
+        except Exception as e:
+            self.logger.warning(f"Could not resolve screener universe, using configured coins: {e}")
+
+        self.universe = universe
+        self._universe_source = tuple(coins)
+        self.logger.info("Screener universe: %d of %d configured coins", len(universe), len(coins))
+        return universe
+
+    def _get_universe(self) -> List[str]:
+        """Get the resolved universe, falling back to config if screener_coins changed since"""
+        coins = self.config.get("screener_coins", [])
+        if self.universe is not None and self._universe_source == tuple(coins):
+            return self.universe
+        return coins
+
+    def screen_coins(self, mode: Optional[str] = None, universe: Optional[List[str]] = None) -> List[Dict]:
         """
         Screen coins based on mode
 
         Args:
             mode: Screening mode (breakouts, oversold, support, trending, auto)
+            universe: Product IDs to screen (defaults to the resolved universe)
 
         Returns:
             List of opportunities sorted by score
@@ -77,8 +126,9 @@ class MarketScreener:
         if self.bot:
             self.bot.current_screener_mode = mode
             self.bot.last_screener_mode_update = datetime.now(timezone.utc)
+            self.bot.mark_status_changed()
 
-        coins = self.config.get("screener_coins", [])
+        coins = universe if universe is not None else self._get_universe()
 
         self.logger.info(f"Screening {len(coins)} coins in '{mode}' mode")
 
@@ -109,7 +159,7 @@ class MarketScreener:
                 # Get historical data for technical analysis
                 df = self.data_collector.get_historical_candles(product_id, granularity="ONE_HOUR", days=30)
                 if df is None or df.empty:
-                    self.logger.debug(f"{product_id} skipped: no historical data")
+                    self.logger.debug("%s skipped: no historical data", product_id)
                     continue
 
                 # Calculate indicators
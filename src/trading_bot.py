@@ -3,12 +3,13 @@ Main Trading Bot Engine for CryptoBot
 Orchestrates all components and executes trading logic
 """
 
-import os
 import time
+import asyncio
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
-import sys
+from typing import Callable, Dict, Optional, List
 import pytz
 
 from src import __version__
@@ -24,12 +25,33 @@ from src.news_sentiment import NewsSentiment
 from src.coingecko_data import CoinGeckoCollector
 from src.telegram_bot import TelegramNotifier
 from src.trade_validator import TradeValidator
-from src.utils import setup_logging
+from src.ws_ticker import PriceTicker
+from src.utils import setup_logging, shutdown_logging, json_dumps, json_loads
 
 
 class TradingBot:
     """Main trading bot orchestrator"""
 
+    # Benchmark coins included in every market snapshot
+    KEY_COINS = ["BTC-USD", "ETH-USD", "SOL-USD"]
+
+    # Minimum spacing between exit checks triggered by streamed ticks
+    WATCHDOG_MIN_INTERVAL_SEC = 5
+
+    # Minimum time between Claude analyses per schedule (seconds)
+    ANALYSIS_SCHEDULE_SECONDS = {
+        "hourly": 3600,
+        "two_hourly": 2 * 3600,
+        "four_hourly": 4 * 3600,
+        "six_hourly": 6 * 3600,
+        "twice_daily": 12 * 3600,
+        "daily": 24 * 3600
+    }
+
+    # Upper bound on waiting for each market-context fetch
+    CONTEXT_FETCH_TIMEOUT_SEC = 30
+    CONTEXT_SCREEN_TIMEOUT_SEC = 120
+
     def __init__(self, config_path: str = "data/config.json"):
         """
         Initialize trading bot
@@ -47,7 +69,7 @@ class TradingBot:
         self.logger = setup_logging(log_file, log_level)
 
         self.logger.info("=" * 80)
-        self.logger.info(f"CryptoBot v{__version__} Starting...")
+        self.logger.info("CryptoBot v%s Starting...", __version__)
         self.logger.info("=" * 80)
 
         # Validate config
@@ -60,15 +82,18 @@ class TradingBot:
         self.coinbase = CoinbaseClient(
             sandbox=(self.config.get("coinbase_env") == "sandbox")
         )
+        self.ticker = PriceTicker()
         self.data_collector = DataCollector(
             self.coinbase,
-            cache_minutes=self.config.get("screener_cache_minutes", 60)
+            cache_minutes=self.config.get("screener_cache_minutes", 60),
+            ticker=self.ticker
         )
         self.signal_generator = SignalGenerator(self.config)
         self.news_sentiment = NewsSentiment(self.config)
         self.coingecko = CoinGeckoCollector(self.config)
         self.claude_analyst = ClaudeAnalyst(self.config)
         self.screener = MarketScreener(self.config, self.data_collector, self.signal_generator, self.news_sentiment, self.coingecko, self.claude_analyst, self)
+        self.screener.build_universe()
         self.risk_manager = RiskManager(self.config, self.news_sentiment)
         self.performance_tracker = PerformanceTracker(self.config)
         self.telegram = TelegramNotifier(self.config)
@@ -85,15 +110,38 @@ class TradingBot:
         self.running = False
         self.dry_run = self.config.get("dry_run", True)
         self.last_analysis_time = None
+        self.last_analysis_monotonic: Optional[float] = None
         self.last_daily_reset = datetime.now().date()
         self.current_screener_mode = None  # Track what AUTO mode selects
         self.last_screener_mode_update = None
 
-        self.logger.info(f"Bot initialized in {'DRY RUN' if self.dry_run else 'LIVE'} mode")
+        # Bumped whenever something shown by get_status() changes (lets the
+        # dashboard reuse its last rendered status)
+        self.status_version = 0
+
+        # Serializes position opens/closes now that loop steps run concurrently
+        self._position_lock = threading.RLock()
+
+        # Scheduler state: stop() sets the event and wakes every sleeping task
+        self._stop_event = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_wakeup: Optional[asyncio.Event] = None
+        self._price_event: Optional[asyncio.Event] = None
+        self.ticker.add_listener(self._on_price_tick)
+
+        # Callbacks run after every main loop iteration (e.g. dashboard pushes)
+        self._tick_listeners: List[Callable[[], None]] = []
+
+        # Config values read on every iteration
+        self._apply_config()
+
+        self.logger.info("Bot initialized in %s mode", "DRY RUN" if self.dry_run else "LIVE")
 
     def start(self):
         """Start the trading bot"""
         self.running = True
+        self._stop_event.clear()
+        self.mark_status_changed()
         self.logger.info("Bot started")
 
         # Test connections
@@ -101,11 +149,13 @@ class TradingBot:
             self.logger.error("Connection tests failed - stopping bot")
             return
 
+        # Stream prices for open positions and key coins
+        if self.config.get("ws_ticker_enabled", True):
+            self.ticker.start(self._ticker_products())
+
         # Main loop
         try:
-            while self.running:
-                self._main_loop()
-                self._sleep_until_next_check()
+            asyncio.run(self._run_async())
 
         except KeyboardInterrupt:
             self.logger.info("Bot stopped by user")
@@ -120,8 +170,54 @@ class TradingBot:
     def stop(self):
         """Stop the trading bot"""
         self.running = False
+        self._stop_event.set()
+        loop, wakeup = self._loop, self._stop_wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # Event loop already closed
+        self.mark_status_changed()
+        self.ticker.stop()
         self.logger.info("Bot stopped")
 
+    def reload_config(self):
+        """Reload configuration from disk and refresh values cached from it"""
+        self.config_manager.load()
+        new_config = self.config_manager.get_all()
+
+        # Update in place so every component holding this dict sees the change
+        for key in set(self.config) - set(new_config):
+            del self.config[key]
+        self.config.update(new_config)
+
+        self._apply_config()
+        self.mark_status_changed()
+        self.logger.info("Configuration reloaded")
+
+    def mark_status_changed(self):
+        """Record that state reported by get_status() changed"""
+        self.status_version += 1
+
+    def _apply_config(self):
+        """Cache config values that are read on every loop iteration"""
+        self._claude_enabled = bool(self.config.get("claude_enabled"))
+        self._claude_schedule = self.config.get("claude_analysis_schedule", "daily")
+        self._claude_target_hour = int(self.config.get("claude_analysis_time_utc", "00:00").split(":")[0])
+        self._max_positions = int(self.config.get("max_positions", 3))
+        self._check_interval = int(self.config.get("check_interval_sec", 3600))
+        self._taker_fee = float(self.config.get("coinbase_taker_fee", 0.02))
+        self._claude_conf_thresh = float(self.config.get("claude_confidence_threshold", 80))
+
+    def _ticker_products(self) -> List[str]:
+        """Products the price feed should stream"""
+        return list(self.risk_manager.positions.keys()) + self.KEY_COINS
+
+    def _sync_ticker_products(self):
+        """Resubscribe the price feed after position membership changes"""
+        if self.ticker.running:
+            self.ticker.set_products(self._ticker_products())
+
     def _test_connections(self) -> bool:
         """Test API connections"""
         self.logger.info("Testing API connections...")
@@ -139,213 +235,397 @@ class TradingBot:
                 else:
                     self.logger.warning("⚠ Claude API not configured")
             except Exception as e:
-                self.logger.warning(f"⚠ Claude API test failed: {e}")
+                self.logger.warning("⚠ Claude API test failed: %s", e)
 
         return True
 
-    def _main_loop(self):
-        """Main bot loop iteration"""
+    async def _run_async(self):
+        """Run the scan loop, position watchdog and daily reset until stopped"""
+        self._price_event = asyncio.Event()
+        self._stop_wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(
+                self._scan_loop(),
+                self._position_watchdog(),
+                self._daily_reset_loop()
+            )
+        finally:
+            self._loop = None
+            self._price_event = None
+            self._stop_wakeup = None
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """
+        Sleep up to timeout seconds, waking early if the bot is stopped
+
+        Returns:
+            True if the bot was stopped
+        """
+        # Checked first in case stop() ran before the wakeup event existed
+        if self._stop_event.is_set():
+            return True
         try:
-            self.logger.info("=" * 80)
-            self.logger.info(f"Bot check at {datetime.now().isoformat()}")
-            self.logger.info("=" * 80)
+            await asyncio.wait_for(self._stop_wakeup.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
-            # Reset daily metrics if new day
+    async def _scan_loop(self):
+        """Run a full bot iteration every check interval"""
+        while self.running:
+            await self._main_loop_async()
+            if await self._sleep_until_next_check_async():
+                break
+
+    async def _position_watchdog(self):
+        """Check exit signals as soon as a streamed tick arrives for an open position"""
+        while self.running:
+            try:
+                await asyncio.wait_for(self._price_event.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                continue
+            self._price_event.clear()
+
+            open_positions = tuple(self.risk_manager.positions.items())
+            if open_positions:
+                prices = await asyncio.to_thread(
+                    self.data_collector.get_current_prices,
+                    [product_id for product_id, _position in open_positions],
+                    max_age_sec=DataCollector.TTL_POSITION
+                )
+                await asyncio.to_thread(self._check_positions, open_positions, prices, False)
+
+            # Coalesce bursts of ticks into one check per interval
+            if await self._wait_for_stop(self.WATCHDOG_MIN_INTERVAL_SEC):
+                break
+
+    async def _daily_reset_loop(self):
+        """Reset daily metrics at local midnight"""
+        while self.running:
+            now = datetime.now()
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            if await self._wait_for_stop((midnight - now).total_seconds() + 1):
+                break
             self._check_daily_reset()
 
-            # Check existing positions for exit signals
-            self._check_positions()
+    def add_tick_listener(self, callback: Callable[[], None]):
+        """
+        Register a callback invoked after every main loop iteration
 
-            # Run Claude analysis if scheduled
-            if self._should_run_analysis():
-                self._run_claude_analysis()
+        Args:
+            callback: Function taking no arguments (runs on a bot thread)
+        """
+        self._tick_listeners.append(callback)
 
-            # Look for new opportunities if we can open positions
-            if len(self.risk_manager.positions) < self.config.get("max_positions", 3):
-                self._scan_for_opportunities()
+    def _notify_tick(self):
+        """Invoke tick listeners, keeping their errors out of the main loop"""
+        for callback in self._tick_listeners:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error("Tick listener error: %s", e)
+
+    def _on_price_tick(self, product_id: str, price: float):
+        """Ticker listener (feed thread): wake the watchdog for open positions"""
+        loop, event = self._loop, self._price_event
+        if loop is None or event is None or product_id not in self.risk_manager.positions:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    async def _main_loop_async(self):
+        """
+        Main bot loop iteration with independent steps run concurrently
+
+        Position checks, Claude analysis and the opportunity scan are all
+        dominated by network I/O, so they run in worker threads and the tick
+        takes as long as the slowest step instead of the sum of all of them.
+        """
+        log = self.logger
+        try:
+            # One clock read per tick, shared by every step below
+            now = datetime.now()
+            now_iso = now.isoformat()
+
+            log.info("=" * 80)
+            log.info("Bot check at %s", now_iso)
+            log.info("=" * 80)
+
+            # One consistent view of open positions for this tick
+            open_positions = tuple(self.risk_manager.positions.items())
+            num_open = len(open_positions)
+
+            # One price request shared by position checks and market context
+            prices = await asyncio.to_thread(self._fetch_tick_prices, open_positions)
+
+            run_analysis = self._should_run_analysis(now)
+            run_scan = num_open < self._max_positions
+
+            # Position checks overlap the single screener pass shared by the other steps
+            steps = [asyncio.ensure_future(
+                asyncio.to_thread(self._check_positions, open_positions, prices)
+            )]
+            screener_results = None
+            if run_analysis or run_scan:
+                screener_results = await asyncio.to_thread(self._screen_for_tick)
+
+            if run_analysis:
+                steps.append(asyncio.to_thread(self._run_claude_analysis, prices, now_iso, screener_results))
+            if run_scan:
+                steps.append(asyncio.to_thread(self._scan_for_opportunities, screener_results))
+
+            # Steps catch their own errors; log anything that still escaped
+            for result in await asyncio.gather(*steps, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    log.error("Error in bot step: %s", result, exc_info=result)
 
             # Save performance snapshot
-            self.performance_tracker.save_performance_snapshot()
+            await asyncio.to_thread(self.performance_tracker.save_performance_snapshot)
+
+            await asyncio.to_thread(self._notify_tick)
 
         except Exception as e:
-            self.logger.error(f"Error in main loop: {e}", exc_info=True)
+            log.error("Error in main loop: %s", e, exc_info=True)
+
+    def _fetch_tick_prices(self, open_positions: tuple) -> Dict[str, Optional[float]]:
+        """Fetch fresh prices for open positions and key coins in one batch"""
+        product_ids = [product_id for product_id, _position in open_positions] + self.KEY_COINS
+        return self.data_collector.get_current_prices(product_ids, max_age_sec=DataCollector.TTL_POSITION)
+
+    def _screen_for_tick(self) -> Optional[List[Dict]]:
+        """
+        Run the screener once for this tick
 
-    def _check_daily_reset(self):
-        """Reset daily metrics if new day"""
-        today = datetime.now().date()
+        Returns:
+            Screener results, or None if the screener failed (callers then screen themselves)
+        """
+        try:
+            return self.screener.screen_coins()
+        except Exception as e:
+            self.logger.error("Error running screener: %s", e, exc_info=True)
+            return None
+
+    def _check_daily_reset(self, today=None):
+        """
+        Reset daily metrics if new day
+
+        Args:
+            today: Current local date (defaults to now)
+        """
+        today = today or datetime.now().date()
         if today > self.last_daily_reset:
             self.risk_manager.reset_daily_metrics()
             self.last_daily_reset = today
             self.logger.info("Daily metrics reset")
 
-    def _check_positions(self):
-        """Check all open positions for exit signals"""
-        for product_id in list(self.risk_manager.positions.keys()):
+            # Pick up listing changes once a day
+            self.screener.build_universe()
+
+    def _check_positions(self, open_positions: Optional[tuple] = None,
+                         prices: Optional[Dict[str, Optional[float]]] = None,
+                         log_pnl: bool = True):
+        """
+        Check all open positions for exit signals
+
+        Args:
+            open_positions: Snapshot of (product_id, Position) pairs taken at the start of the tick
+            prices: Prices already fetched for this tick
+            log_pnl: Log P&L for positions without an exit signal
+        """
+        log = self.logger
+        if open_positions is None:
+            open_positions = tuple(self.risk_manager.positions.items())
+
+        product_ids = [product_id for product_id, _position in open_positions]
+        if prices is None:
+            prices = self.data_collector.get_current_prices(product_ids, max_age_sec=DataCollector.TTL_POSITION)
+
+        held = []
+        for product_id in product_ids:
             try:
-                # Get current price
-                current_price = self.data_collector.get_current_price(product_id, use_cache=False)
+                current_price = prices.get(product_id)
                 if not current_price:
-                    self.logger.warning(f"Could not get price for {product_id}")
+                    log.warning("Could not get price for %s", product_id)
                     continue
 
                 # Check exit signals
-                exit_signal = self.risk_manager.check_exit_signals(product_id, current_price)
+                with self._position_lock:
+                    if product_id not in self.risk_manager.positions:
+                        continue  # Closed concurrently (e.g. by Claude or the web UI)
 
-                if exit_signal:
-                    action, reason = exit_signal
-                    self.logger.info(f"Exit signal for {product_id}: {action} - {reason}")
+                    exit_signal = self.risk_manager.check_exit_signals(product_id, current_price)
 
-                    # Execute exit
-                    self._close_position(product_id, current_price, reason)
+                    if exit_signal:
+                        action, reason = exit_signal
+                        log.info("Exit signal for %s: %s - %s", product_id, action, reason)
 
-                else:
-                    # Log current P&L
-                    pnl = self.risk_manager.get_position_pnl(product_id, current_price)
-                    if pnl:
-                        self.logger.info(
-                            f"{product_id}: ${pnl['net_pnl']:.2f} ({pnl['pnl_pct']:.2f}%) "
-                            f"| Price: ${current_price:.2f} | Stop: ${pnl['stop_loss_price']:.2f}"
-                        )
+                        # Execute exit
+                        self._close_position(product_id, current_price, reason)
+
+                if not exit_signal:
+                    held.append(product_id)
+
+            except Exception as e:
+                log.error("Error checking position %s: %s", product_id, e, exc_info=True)
 
+        # Log current P&L for positions still held, valued in one batch
+        if log_pnl and held and log.isEnabledFor(logging.DEBUG):
+            try:
+                pnls = self.risk_manager.get_positions_pnl({pid: prices[pid] for pid in held})
+                for product_id, pnl in pnls.items():
+                    log.debug(
+                        "%s: $%.2f (%.2f%%) | Price: $%.2f | Stop: $%.2f",
+                        product_id, pnl['net_pnl'], pnl['pnl_pct'],
+                        prices[product_id], pnl['stop_loss_price']
+                    )
             except Exception as e:
-                self.logger.error(f"Error checking position {product_id}: {e}")
+                log.error("Error calculating position P&L: %s", e, exc_info=True)
 
     def _close_position(self, product_id: str, current_price: float, reason: str):
         """Close a position"""
-        try:
-            position = self.risk_manager.positions.get(product_id)
-            if not position:
-                return
-
-            # Calculate fees
-            exit_value = current_price * position.quantity
-            taker_fee = self.config.get("coinbase_taker_fee", 0.02)
-            exit_fee = exit_value * taker_fee
-
-            if not self.dry_run:
-                # Execute market sell order
-                order = self.coinbase.place_market_order(
-                    product_id,
-                    "SELL",
-                    quantity=position.quantity
-                )
-
-                if not order:
-                    self.logger.error(f"Failed to place sell order for {product_id}")
+        with self._position_lock:
+            try:
+                position = self.risk_manager.positions.get(product_id)
+                if not position:
                     return
 
-            # Close position in risk manager
-            pnl_details = self.risk_manager.close_position(
-                product_id,
-                current_price,
-                exit_fee,
-                reason
-            )
+                # Calculate fees
+                exit_value = current_price * position.quantity
+                taker_fee = self._taker_fee
+                exit_fee = exit_value * taker_fee
+
+                if not self.dry_run:
+                    # Execute market sell order
+                    order = self.coinbase.place_market_order(
+                        product_id,
+                        "SELL",
+                        quantity=position.quantity
+                    )
 
-            # Log trade
-            if pnl_details:
-                self.performance_tracker.log_trade({
-                    "product_id": product_id,
-                    "side": "SELL",
-                    "quantity": pnl_details['quantity'],
-                    "price": current_price,
-                    "value_usd": pnl_details['exit_value'],
-                    "fee_usd": exit_fee,
-                    "net_pnl": pnl_details['net_pnl'],
-                    "pnl_pct": pnl_details['pnl_pct'],
-                    "hold_time_hours": pnl_details['hold_time'],
-                    "reason": reason,
-                    "notes": "DRY RUN" if self.dry_run else "LIVE"
-                })
+                    if not order:
+                        self.logger.error(f"Failed to place sell order for {product_id}")
+                        return
 
-                # Send Telegram notification
-                if self.telegram and self.config.get("telegram_notify_trades", True):
-                    self.telegram.notify_trade_exit(
-                        symbol=product_id,
-                        side="SELL",
-                        entry_price=pnl_details['entry_price'],
-                        exit_price=current_price,
-                        pnl=pnl_details['net_pnl'],
-                        pnl_pct=pnl_details['pnl_pct'],
-                        reason=reason
-                    )
+                    self.data_collector.invalidate_price(product_id)
 
-                # Send specific stop loss or take profit notification
-                if "stop loss" in reason.lower() and self.config.get("telegram_notify_stop_loss", True):
-                    if self.telegram:
-                        self.telegram.notify_stop_loss(
-                            symbol=product_id,
-                            entry_price=pnl_details['entry_price'],
-                            stop_price=current_price,
-                            loss=pnl_details['net_pnl']
-                        )
-                elif "take profit" in reason.lower() and self.config.get("telegram_notify_take_profit", True):
-                    if self.telegram:
-                        self.telegram.notify_take_profit(
+                # Close position in risk manager
+                pnl_details = self.risk_manager.close_position(
+                    product_id,
+                    current_price,
+                    exit_fee,
+                    reason
+                )
+
+                # Log trade
+                if pnl_details:
+                    self.performance_tracker.log_trade({
+                        "product_id": product_id,
+                        "side": "SELL",
+                        "quantity": pnl_details['quantity'],
+                        "price": current_price,
+                        "value_usd": pnl_details['exit_value'],
+                        "fee_usd": exit_fee,
+                        "net_pnl": pnl_details['net_pnl'],
+                        "pnl_pct": pnl_details['pnl_pct'],
+                        "hold_time_hours": pnl_details['hold_time'],
+                        "reason": reason,
+                        "notes": "DRY RUN" if self.dry_run else "LIVE"
+                    })
+
+                    self._sync_ticker_products()
+                    self.mark_status_changed()
+
+                    # Send Telegram notification
+                    if self.telegram and self.config.get("telegram_notify_trades", True):
+                        self.telegram.notify_trade_exit(
                             symbol=product_id,
+                            side="SELL",
                             entry_price=pnl_details['entry_price'],
-                            target_price=current_price,
-                            profit=pnl_details['net_pnl']
+                            exit_price=current_price,
+                            pnl=pnl_details['net_pnl'],
+                            pnl_pct=pnl_details['pnl_pct'],
+                            reason=reason
                         )
 
-        except Exception as e:
-            self.logger.error(f"Error closing position {product_id}: {e}")
+                    # Send specific stop loss or take profit notification
+                    if "stop loss" in reason.lower() and self.config.get("telegram_notify_stop_loss", True):
+                        if self.telegram:
+                            self.telegram.notify_stop_loss(
+                                symbol=product_id,
+                                entry_price=pnl_details['entry_price'],
+                                stop_price=current_price,
+                                loss=pnl_details['net_pnl']
+                            )
+                    elif "take profit" in reason.lower() and self.config.get("telegram_notify_take_profit", True):
+                        if self.telegram:
+                            self.telegram.notify_take_profit(
+                                symbol=product_id,
+                                entry_price=pnl_details['entry_price'],
+                                target_price=current_price,
+                                profit=pnl_details['net_pnl']
+                            )
 
-    def _should_run_analysis(self) -> bool:
-        """Check if Claude analysis should run"""
-        if not self.config.get("claude_enabled"):
-            return False
+            except Exception as e:
+                self.logger.error("Error closing position %s: %s", product_id, e, exc_info=True)
 
-        schedule = self.config.get("claude_analysis_schedule", "daily")
+    def _should_run_analysis(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if Claude analysis should run
 
+        Args:
+            now: Current local time for this tick (defaults to now)
+
+        Returns:
+            True if analysis is due
+        """
+        if not self._claude_enabled:
+            return False
+
+        schedule = self._claude_schedule
         if schedule == "disabled":
             return False
 
         # Check if enough time passed since last analysis
-        if self.last_analysis_time:
-            hours_since = (datetime.now() - self.last_analysis_time).total_seconds() / 3600
-
-            if schedule == "hourly" and hours_since < 1:
-                return False
-            elif schedule == "two_hourly" and hours_since < 2:
-                return False
-            elif schedule == "four_hourly" and hours_since < 4:
-                return False
-            elif schedule == "six_hourly" and hours_since < 6:
-                return False
-            elif schedule == "twice_daily" and hours_since < 12:
-                return False
-            elif schedule == "daily" and hours_since < 24:
+        if self.last_analysis_monotonic is not None:
+            elapsed = time.monotonic() - self.last_analysis_monotonic
+            if elapsed < self.ANALYSIS_SCHEDULE_SECONDS.get(schedule, 0):
                 return False
 
         # For time-based schedules (not daily with specific time), run if no previous analysis or enough time passed
-        if schedule in ["hourly", "two_hourly", "four_hourly", "six_hourly", "twice_daily"]:
-            if not self.last_analysis_time:
-                return True
-            # Time check already done above - if we got here, enough time has passed
+        if schedule in self.ANALYSIS_SCHEDULE_SECONDS and schedule != "daily":
             return True
 
         # Check if it's the scheduled time (for daily)
         if schedule == "daily":
-            target_time = self.config.get("claude_analysis_time_utc", "00:00")
-            target_hour = int(target_time.split(":")[0])
             current_hour = datetime.utcnow().hour
 
             # Run if we're in the target hour and haven't run today
-            if current_hour == target_hour:
-                today = datetime.now().date()
+            if current_hour == self._claude_target_hour:
+                today = (now or datetime.now()).date()
                 if not self.last_analysis_time or self.last_analysis_time.date() < today:
                     return True
 
         return False
 
-    def _run_claude_analysis(self):
-        """Run Claude AI market analysis"""
+    def _run_claude_analysis(self, prices: Optional[Dict[str, Optional[float]]] = None,
+                             now_iso: Optional[str] = None,
+                             screener_results: Optional[List[Dict]] = None):
+        """
+        Run Claude AI market analysis
+
+        Args:
+            prices: Prices already fetched for this tick
+            now_iso: Tick timestamp (ISO format) for the market snapshot
+            screener_results: Screener results already computed for this tick
+        """
         try:
             self.logger.info("Running Claude AI analysis...")
 
             # Build market context
-            context = self._build_market_context()
+            context = self._build_market_context(prices, now_iso, screener_results)
 
             # Get analysis
             analysis = self.claude_analyst.analyze_market(context)
@@ -359,7 +639,7 @@ class TradingBot:
 
             # Display analysis
             formatted = self.claude_analyst.format_analysis_for_display(analysis)
-            self.logger.info(f"\n{formatted}")
+            self.logger.info("\n%s", formatted)
 
             # Send Telegram notification
             if self.telegram and self.config.get("telegram_notify_claude", True):
@@ -378,48 +658,90 @@ class TradingBot:
                     self._process_claude_recommendation(recommendation)
 
             self.last_analysis_time = datetime.now()
+            self.last_analysis_monotonic = time.monotonic()
+            self.mark_status_changed()
 
         except Exception as e:
-            self.logger.error(f"Error running Claude analysis: {e}")
+            self.logger.error("Error running Claude analysis: %s", e, exc_info=True)
             # Send error notification
             if self.telegram and self.config.get("telegram_notify_errors", True):
                 self.telegram.notify_error(f"Claude analysis error: {str(e)}")
 
-    def _build_market_context(self) -> Dict:
-        """Build market context for Claude analysis"""
-        # Get portfolio
-        if self.dry_run:
-            balance = self.risk_manager.current_capital
-        else:
-            balance = self.coinbase.get_balance("USD")
+    def _build_market_context(self, prices: Optional[Dict[str, Optional[float]]] = None,
+                              now_iso: Optional[str] = None,
+                              screener_results: Optional[List[Dict]] = None) -> Dict:
+        """
+        Build market context for Claude analysis
+
+        Args:
+            prices: Prices already fetched for this tick (missing ones are fetched)
+            now_iso: Tick timestamp (ISO format) for the market snapshot (defaults to now)
+            screener_results: Screener results already computed for this tick (screens if None)
 
+        Returns:
+            Market context dictionary
+        """
+        log = self.logger
+        now_iso = now_iso or datetime.now().isoformat()
         positions = self.risk_manager.get_all_positions()
 
+        # Fresh prices for positions and key coins, reusing the tick's batch
+        prices = dict(prices or {})
+        missing = [
+            product_id for product_id in [pos["product_id"] for pos in positions] + self.KEY_COINS
+            if not prices.get(product_id)
+        ]
+
+        # The fetches below are independent, so run them concurrently
+        executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="context")
+        try:
+            f_balance = None if self.dry_run else executor.submit(self.coinbase.get_balance, "USD")
+            f_prices = executor.submit(
+                self.data_collector.get_current_prices, missing, max_age_sec=DataCollector.TTL_SNAPSHOT
+            ) if missing else None
+            f_screen = executor.submit(self.screener.screen_coins) if screener_results is None else None
+            f_fear_greed = executor.submit(self.data_collector.get_fear_greed_index)
+            f_btc_dom = executor.submit(self.data_collector.get_btc_dominance)
+            f_trades = executor.submit(self.performance_tracker.get_recent_trades, 10)
+            f_perf = executor.submit(self.performance_tracker.calculate_metrics)
+            f_trending = executor.submit(self.coingecko.get_trending_coins) \
+                if self.config.get("coingecko_enabled", False) else None
+
+            # Get portfolio
+            if self.dry_run:
+                balance = self.risk_manager.current_capital
+            else:
+                balance = self._context_result(f_balance, "USD balance")
+
+            if f_prices:
+                prices.update(self._context_result(f_prices, "prices", {}))
+
+            # Get market data
+            if f_screen:
+                screener_results = self._context_result(
+                    f_screen, "screener", [], timeout=self.CONTEXT_SCREEN_TIMEOUT_SEC
+                )
+            fear_greed = self._context_result(f_fear_greed, "fear & greed")
+            btc_dominance = self._context_result(f_btc_dom, "BTC dominance")
+            recent_trades = self._context_result(f_trades, "trades", [])
+            performance = self._context_result(f_perf, "performance", {})
+            trending_data = self._context_result(f_trending, "trending coins") if f_trending else None
+        finally:
+            # Don't hold the analysis up on fetches that timed out
+            executor.shutdown(wait=False)
+
         # Calculate total portfolio value (available capital + current position values)
         positions_value = 0.0
         for pos in positions:
-            # Get current price for this position
-            try:
-                current_price = self.data_collector.get_current_price(pos["product_id"], use_cache=False)
-                if current_price:
-                    positions_value += pos["quantity"] * current_price
-                else:
-                    # Fallback to entry price if current price unavailable
-                    positions_value += pos["quantity"] * pos["entry_price"]
-            except Exception as e:
-                self.logger.warning(f"Could not get current price for {pos['product_id']}, using entry price")
+            current_price = prices.get(pos["product_id"])
+            if current_price:
+                positions_value += pos["quantity"] * current_price
+            else:
+                # Fallback to entry price if current price unavailable
+                log.warning("Could not get current price for %s, using entry price", pos['product_id'])
                 positions_value += pos["quantity"] * pos["entry_price"]
 
-        total_portfolio_value = balance + positions_value
-
-        # Get market data
-        screener_results = self.screener.screen_coins()
-
-        # Get fear & greed
-        fear_greed = self.data_collector.get_fear_greed_index()
-
-        # Get BTC dominance
-        btc_dominance = self.data_collector.get_btc_dominance()
+        total_portfolio_value = (balance or 0) + positions_value
 
         # ===== STORE MARKET DATA FOR VALIDATION =====
         # Critical: Validator needs Fear & Greed to prevent bull trades in bear markets
@@ -451,56 +773,39 @@ class TradingBot:
                 # Get overall market sentiment summary
                 market_news_summary = self.news_sentiment.get_sentiment_summary()
             except Exception as e:
-                self.logger.error(f"Error fetching news sentiment: {e}")
+                log.error(f"Error fetching news sentiment: {e}")
                 market_news_summary = "News sentiment unavailable"
         else:
             market_news_summary = "News sentiment disabled"
 
-        # Get recent trades
-        recent_trades = self.performance_tracker.get_all_trades()[-10:]
-
-        # Get performance
-        performance = self.performance_tracker.calculate_metrics()
-
         # Build detailed market snapshot with key coins
         market_snapshot = {}
-        key_coins = ["BTC-USD", "ETH-USD", "SOL-USD"]
-
-        for product_id in key_coins:
-            try:
-                # Don't use cache - get fresh prices
-                price = self.data_collector.get_current_price(product_id, use_cache=False)
-                if price:
-                    market_snapshot[product_id] = {
-                        "price": price,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    self.logger.warning(f"Could not get price for {product_id} - returned None")
-            except Exception as e:
-                self.logger.error(f"Error fetching price for {product_id}: {e}")
+        for product_id in self.KEY_COINS:
+            price = prices.get(product_id)
+            if price:
+                market_snapshot[product_id] = {
+                    "price": price,
+                    "timestamp": now_iso
+                }
+            else:
+                log.warning("Could not get price for %s - returned None", product_id)
 
         # Get CoinGecko trending coins
         trending_coins = []
-        if self.config.get("coingecko_enabled", False):
-            try:
-                trending_data = self.coingecko.get_trending_coins()
-                if trending_data:
-                    trending_coins = [f"{coin['symbol']}" for coin in trending_data[:5]]
-            except Exception as e:
-                self.logger.error(f"Error fetching trending coins: {e}")
+        if trending_data:
+            trending_coins = [f"{coin['symbol']}" for coin in trending_data[:5]]
 
         return {
             "portfolio": {
                 "balance_usd": balance,
                 "positions": positions,
-                "position_count": len(positions),
+                "position_count": self.risk_manager.position_count,
                 "positions_value": positions_value,
                 "total_value": total_portfolio_value,
                 "initial_capital": self.risk_manager.initial_capital
             },
             "market_data": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso,
                 "key_prices": market_snapshot
             },
             "screener_results": screener_results,
@@ -513,6 +818,31 @@ class TradingBot:
             "performance": performance
         }
 
+    def _context_result(self, future: Future, name: str, default=None,
+                        timeout: Optional[float] = None):
+        """
+        Get the result of a market-context fetch without failing the analysis
+
+        Args:
+            future: Submitted fetch
+            name: Description used in log messages
+            default: Value returned on timeout or error
+            timeout: Seconds to wait (defaults to CONTEXT_FETCH_TIMEOUT_SEC)
+
+        Returns:
+            Fetch result, or default
+        """
+        try:
+            result = future.result(timeout=timeout or self.CONTEXT_FETCH_TIMEOUT_SEC)
+        except FutureTimeoutError:
+            self.logger.warning("Timed out fetching %s for market context", name)
+            return default
+        except Exception as e:
+            self.logger.error("Error fetching %s for market context: %s", name, e)
+            return default
+
+        return default if result is None else result
+
     def _process_claude_recommendation(self, recommendation: Dict):
         """Process a recommendation from Claude"""
         action = recommendation.get("action")
@@ -521,27 +851,34 @@ class TradingBot:
         if action == "buy":
             # Check if we should auto-execute
             if self.claude_analyst.should_execute_recommendation(recommendation):
-                self.logger.info(f"Auto-executing Claude recommendation: BUY {product_id}")
+                self.logger.info("Auto-executing Claude recommendation: BUY %s", product_id)
                 self._execute_buy(recommendation)
             else:
-                self.logger.info(f"Advisory mode - not auto-executing BUY {product_id}")
+                self.logger.info("Advisory mode - not auto-executing BUY %s", product_id)
 
         elif action == "sell":
             if product_id in self.risk_manager.positions:
                 if self.claude_analyst.should_execute_recommendation(recommendation):
-                    current_price = self.data_collector.get_current_price(product_id)
+                    current_price = self.data_collector.get_current_price(product_id, max_age_sec=DataCollector.TTL_POSITION)
                     if current_price:
                         self._close_position(product_id, current_price, "Claude recommendation")
                 else:
-                    self.logger.info(f"Advisory mode - not auto-executing SELL {product_id}")
+                    self.logger.info("Advisory mode - not auto-executing SELL %s", product_id)
 
-    def _scan_for_opportunities(self):
-        """Scan market for trading opportunities"""
+    def _scan_for_opportunities(self, opportunities: Optional[List[Dict]] = None):
+        """
+        Scan market for trading opportunities
+
+        Args:
+            opportunities: Screener results already computed for this tick (screens if None)
+        """
+        log = self.logger
         try:
-            self.logger.info("Scanning for opportunities...")
+            log.info("Scanning for opportunities...")
 
             # Run screener
-            opportunities = self.screener.screen_coins()
+            if opportunities is None:
+                opportunities = self.screener.screen_coins()
 
             # Save screener results to file for web dashboard
             self._save_screener_results(opportunities)
@@ -552,15 +889,15 @@ class TradingBot:
             # ===== END STORAGE =====
 
             if not opportunities:
-                self.logger.info("No opportunities found")
+                log.info("No opportunities found")
                 return
 
             # Log top opportunities
             for i, opp in enumerate(opportunities[:3], 1):
-                self.logger.info(
-                    f"{i}. {opp['product_id']}: Score {opp['score']:.1f} | "
-                    f"Signal: {opp['signal']} ({opp['confidence']:.0f}%) | "
-                    f"Price: ${opp['price']:.2f}"
+                log.info(
+                    "%d. %s: Score %.1f | Signal: %s (%.0f%%) | Price: $%.2f",
+                    i, opp['product_id'], opp['score'],
+                    opp['signal'], opp['confidence'], opp['price']
                 )
 
             # Consider top opportunity
@@ -568,19 +905,19 @@ class TradingBot:
 
             # Only act on strong signals
             if top['signal'] not in ['buy', 'strong_buy']:
-                self.logger.info(f"Top opportunity not a buy signal: {top['signal']}")
+                log.info("Top opportunity not a buy signal: %s", top['signal'])
                 return
 
             # Check confidence
-            if top['confidence'] < self.config.get("claude_confidence_threshold", 80):
-                self.logger.info(f"Confidence too low: {top['confidence']:.0f}%")
+            if top['confidence'] < self._claude_conf_thresh:
+                log.info("Confidence too low: %.0f%%", top['confidence'])
                 return
 
             # Execute if auto-trading enabled (would need Claude analysis first in real scenario)
-            self.logger.info(f"Found opportunity but waiting for Claude analysis: {top['product_id']}")
+            log.info("Found opportunity but waiting for Claude analysis: %s", top['product_id'])
 
         except Exception as e:
-            self.logger.error(f"Error scanning opportunities: {e}")
+            log.error("Error scanning opportunities: %s", e, exc_info=True)
 
     def _open_position(self, product_id: str, quantity: float, entry_price: float, reason: str = "Manual") -> tuple:
         """
@@ -595,93 +932,97 @@ class TradingBot:
         Returns:
             Tuple of (success: bool, message: str, details: dict)
         """
-        try:
-            # Get current balance
-            if self.dry_run:
-                balance = self.risk_manager.current_capital
-            else:
-                balance = self.coinbase.get_balance("USD")
-                if not balance:
-                    self.logger.error("Could not get USD balance")
-                    return False, "Could not get USD balance", {}
+        with self._position_lock:
+            try:
+                # Get current balance
+                if self.dry_run:
+                    balance = self.risk_manager.current_capital
+                else:
+                    balance = self.coinbase.get_balance("USD")
+                    if not balance:
+                        self.logger.error("Could not get USD balance")
+                        return False, "Could not get USD balance", {}
+
+                # Calculate position size
+                position_size_usd = quantity * entry_price
+
+                # Calculate fee (use taker fee for market orders)
+                taker_fee = self._taker_fee
+                entry_fee = position_size_usd * taker_fee
+                fee_pct = taker_fee * 100
+
+                # Check if can open position
+                can_open, check_reason = self.risk_manager.can_open_position(product_id, position_size_usd, balance)
+                if not can_open:
+                    self.logger.warning("Cannot open position: %s", check_reason)
+                    # Return detailed error info
+                    return False, check_reason, {
+                        "attempted_size_usd": position_size_usd,
+                        "attempted_fee_pct": fee_pct,
+                        "min_trade_usd": self.config.get("min_trade_usd", 0),
+                        "max_fee_pct": self.config.get("max_fee_pct", 0) * 100,  # Convert to percentage for display
+                        "max_positions": self.config.get("max_positions", 0),
+                        "current_balance": balance,
+                        "current_positions": self.risk_manager.position_count
+                    }
 
-            # Calculate position size
-            position_size_usd = quantity * entry_price
-
-            # Calculate fee (use taker fee for market orders)
-            taker_fee = self.config.get("coinbase_taker_fee", 0.02)
-            entry_fee = position_size_usd * taker_fee
-            fee_pct = taker_fee * 100
-
-            # Check if can open position
-            can_open, check_reason = self.risk_manager.can_open_position(product_id, position_size_usd, balance)
-            if not can_open:
-                self.logger.warning(f"Cannot open position: {check_reason}")
-                # Return detailed error info
-                return False, check_reason, {
-                    "attempted_size_usd": position_size_usd,
-                    "attempted_fee_pct": fee_pct,
-                    "min_trade_usd": self.config.get("min_trade_usd", 0),
-                    "max_fee_pct": self.config.get("max_fee_pct", 0) * 100,  # Convert to percentage for display
-                    "max_positions": self.config.get("max_positions", 0),
-                    "current_balance": balance,
-                    "current_positions": len(self.risk_manager.get_all_positions())
-                }
+                if not self.dry_run:
+                    # Place market buy order
+                    order = self.coinbase.place_market_order(
+                        product_id,
+                        "BUY",
+                        quantity=quantity
+                    )
 
-            if not self.dry_run:
-                # Place market buy order
-                order = self.coinbase.place_market_order(
-                    product_id,
-                    "BUY",
-                    quantity=quantity
-                )
+                    if not order:
+                        self.logger.error(f"Failed to place order for {product_id}")
+                        return False, "Failed to place order with exchange", {}
 
-                if not order:
-                    self.logger.error(f"Failed to place order for {product_id}")
-                    return False, "Failed to place order with exchange", {}
+                    self.data_collector.invalidate_price(product_id)
 
-            # Open position in risk manager
-            success = self.risk_manager.open_position(product_id, quantity, entry_price, entry_fee)
+                # Open position in risk manager
+                success = self.risk_manager.open_position(product_id, quantity, entry_price, entry_fee)
 
-            if not success:
-                self.logger.error(f"Risk manager rejected position")
-                return False, "Risk manager rejected position", {}
-
-            # Log trade
-            self.performance_tracker.log_trade({
-                "product_id": product_id,
-                "side": "BUY",
-                "quantity": quantity,
-                "price": entry_price,
-                "value_usd": position_size_usd,
-                "fee_usd": entry_fee,
-                "net_pnl": 0,
-                "pnl_pct": 0,
-                "hold_time_hours": 0,
-                "reason": reason,
-                "notes": "DRY RUN" if self.dry_run else "LIVE"
-            })
-
-            self.logger.info(f"✓ Opened position: {quantity:.6f} {product_id} @ ${entry_price:.2f} ({reason})")
+                if not success:
+                    self.logger.error(f"Risk manager rejected position")
+                    return False, "Risk manager rejected position", {}
 
-            # Send Telegram notification
-            if self.telegram and self.config.get("telegram_notify_trades", True):
-                self.telegram.notify_trade_entry(
-                    symbol=product_id,
-                    side="BUY",
-                    price=entry_price,
-                    size=quantity,
-                    reason=reason
-                )
+                # Log trade
+                self.performance_tracker.log_trade({
+                    "product_id": product_id,
+                    "side": "BUY",
+                    "quantity": quantity,
+                    "price": entry_price,
+                    "value_usd": position_size_usd,
+                    "fee_usd": entry_fee,
+                    "net_pnl": 0,
+                    "pnl_pct": 0,
+                    "hold_time_hours": 0,
+                    "reason": reason,
+                    "notes": "DRY RUN" if self.dry_run else "LIVE"
+                })
 
-            success_msg = f"Opened {quantity:.6f} {product_id} at ${entry_price:.2f} (${position_size_usd:.2f})"
-            return True, success_msg, {"quantity": quantity, "entry_price": entry_price, "size_usd": position_size_usd}
+                self.logger.info("✓ Opened position: %.6f %s @ $%.2f (%s)", quantity, product_id, entry_price, reason)
 
-        except Exception as e:
-            self.logger.error(f"Error opening position: {e}")
-            import traceback
-            traceback.print_exc()
-            return False, f"Error: {str(e)}", {}
+                self._sync_ticker_products()
+                self.mark_status_changed()
+
+                # Send Telegram notification
+                if self.telegram and self.config.get("telegram_notify_trades", True):
+                    self.telegram.notify_trade_entry(
+                        symbol=product_id,
+                        side="BUY",
+                        price=entry_price,
+                        size=quantity,
+                        reason=reason
+                    )
+
+                success_msg = f"Opened {quantity:.6f} {product_id} at ${entry_price:.2f} (${position_size_usd:.2f})"
+                return True, success_msg, {"quantity": quantity, "entry_price": entry_price, "size_usd": position_size_usd}
+
+            except Exception as e:
+                self.logger.error("Error opening position: %s", e, exc_info=True)
+                return False, f"Error: {str(e)}", {}
 
     def _execute_buy(self, recommendation: Dict):
         """Execute a buy order from Claude recommendation"""
@@ -723,7 +1064,7 @@ class TradingBot:
                     )
                 return
             else:
-                self.logger.info(f"✓ Trade validation passed: {reason}")
+                self.logger.info("✓ Trade validation passed: %s", reason)
             # ===== END VALIDATION =====
 
             # Calculate position size
@@ -735,16 +1076,42 @@ class TradingBot:
             # Use the new _open_position method
             success, message, details = self._open_position(product_id, quantity, target_price, "Claude recommendation")
             if not success:
-                self.logger.warning(f"Failed to execute Claude recommendation: {message}")
+                self.logger.warning("Failed to execute Claude recommendation: %s", message)
 
         except Exception as e:
-            self.logger.error(f"Error executing buy: {e}")
+            self.logger.error("Error executing buy: %s", e, exc_info=True)
+
+    def _seconds_until_next_check(self) -> float:
+        """
+        Seconds until the next check_interval boundary on the wall clock
+
+        Sleeping to an aligned boundary keeps the cadence fixed no matter how
+        long the iteration took, instead of drifting by the iteration time.
+        """
+        interval = self._check_interval
+        if interval <= 0:
+            self.logger.warning("Invalid check_interval_sec %s - using 3600s", interval)
+            interval = 3600
+        now = time.time()
+        next_t = (now // interval + 1) * interval
+        delay = max(0.0, next_t - now)
+
+        # How far past the boundary this iteration started from we are now
+        drift = now - (next_t - interval)
+        self.logger.info(
+            "Sleeping for %.0fs until next check at %s (drift %.1fs)...",
+            delay, datetime.fromtimestamp(next_t).strftime("%H:%M:%S"), drift
+        )
+        return delay
+
+    async def _sleep_until_next_check_async(self) -> bool:
+        """
+        Sleep until next check interval without blocking the event loop
 
-    def _sleep_until_next_check(self):
-        """Sleep until next check interval"""
-        interval = self.config.get("check_interval_sec", 3600)
-        self.logger.info(f"Sleeping for {interval}s until next check...")
-        time.sleep(interval)
+        Returns:
+            True if the bot was stopped while sleeping
+        """
+        return await self._wait_for_stop(self._seconds_until_next_check())
 
     def get_status(self) -> Dict:
         """Get current bot status"""
@@ -795,7 +1162,7 @@ class TradingBot:
             "balance_usd": balance,
             "initial_capital": self.config.get("initial_capital", 600),
             "positions": positions,
-            "position_count": len(positions),
+            "position_count": self.risk_manager.position_count,
             "performance": metrics,
             "last_analysis": self.last_analysis_time.isoformat() if self.last_analysis_time else None,
             "next_bot_check": check_interval,  # seconds until next check
@@ -827,14 +1194,13 @@ class TradingBot:
     def _get_claude_summary(self) -> Dict:
         """Get summary of latest Claude analysis"""
         try:
-            import json
             import os
 
             if not os.path.exists("data/latest_claude_analysis.json"):
                 return None
 
-            with open("data/latest_claude_analysis.json", "r") as f:
-                data = json.load(f)
+            with open("data/latest_claude_analysis.json", "rb") as f:
+                data = json_loads(f.read())
 
             analysis = data.get("analysis", {})
             timestamp = data.get("timestamp")
@@ -871,14 +1237,13 @@ class TradingBot:
     def _get_screener_summary(self) -> Dict:
         """Get summary of latest screener results"""
         try:
-            import json
             import os
 
             if not os.path.exists("data/latest_screener.json"):
                 return None
 
-            with open("data/latest_screener.json", "r") as f:
-                data = json.load(f)
+            with open("data/latest_screener.json", "rb") as f:
+                data = json_loads(f.read())
 
             opportunities = data.get("opportunities", [])
             timestamp = data.get("timestamp")
@@ -908,7 +1273,6 @@ class TradingBot:
     def _save_claude_analysis(self, analysis: Dict):
         """Save Claude analysis to file for web dashboard"""
         try:
-            import json
             import os
             from src.claude_analyst import convert_numpy_types
 
@@ -922,7 +1286,8 @@ class TradingBot:
 
             os.makedirs("data", exist_ok=True)
             with open("data/latest_claude_analysis.json", "w") as f:
-                json.dump(result, f, indent=2)
+                f.write(json_dumps(result, indent=True))
+            self.mark_status_changed()
 
             self.logger.info("Saved Claude analysis to data/latest_claude_analysis.json")
 
@@ -932,7 +1297,6 @@ class TradingBot:
     def _save_screener_results(self, opportunities: List[Dict]):
         """Save screener results to file for web dashboard"""
         try:
-            import json
             import os
             from src.claude_analyst import convert_numpy_types
 
@@ -948,9 +1312,10 @@ class TradingBot:
             # Save to data directory
             os.makedirs("data", exist_ok=True)
             with open("data/latest_screener.json", "w") as f:
-                json.dump(result, f, indent=2)
+                f.write(json_dumps(result, indent=True))
+            self.mark_status_changed()
 
-            self.logger.debug(f"Saved {len(opportunities)} screener results to data/latest_screener.json")
+            self.logger.debug("Saved %d screener results to data/latest_screener.json", len(opportunities))
 
         except Exception as e:
             self.logger.error(f"Error saving screener results: {e}")
@@ -958,7 +1323,6 @@ class TradingBot:
     def _save_claude_analysis(self, analysis: Dict):
         """Save Claude analysis to file for web dashboard"""
         try:
-            import json
             import os
 
             result = {
@@ -969,7 +1333,8 @@ class TradingBot:
             # Save to data directory
             os.makedirs("data", exist_ok=True)
             with open("data/latest_claude_analysis.json", "w") as f:
-                json.dump(result, f, indent=2)
+                f.write(json_dumps(result, indent=True))
+            self.mark_status_changed()
 
             self.logger.debug("Saved Claude analysis to data/latest_claude_analysis.json")
 
@@ -980,7 +1345,10 @@ class TradingBot:
 def main():
     """Main entry point"""
     bot = TradingBot()
-    bot.start()
+    try:
+        bot.start()
+    finally:
+        shutdown_logging(bot.logger)
 
 
 if __name__ == "__main__":
@@ -3,18 +3,30 @@ Utility functions for CryptoBot
 Includes rate limiter, logging setup, and helper functions
 """
 
+import copy
+import json
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import threading
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
-from collections import deque
+import numpy as np
 import pytz
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class RateLimiter:
     """
     Rate limiter to respect API limits
-    Tracks calls per minute and enforces delays
+    Token bucket refilled at calls_per_minute / 60 tokens per second
     """
 
     def __init__(self, calls_per_minute: int = 10):
@@ -25,42 +37,72 @@ class RateLimiter:
             calls_per_minute: Maximum API calls allowed per minute
         """
         self.calls_per_minute = calls_per_minute
-        self.calls = deque()
+        self.rate = calls_per_minute / 60.0
+        self.capacity = float(calls_per_minute)
+        self.tokens = float(calls_per_minute)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
 
     def wait_if_needed(self):
         """
         Wait if rate limit would be exceeded
-        Removes calls older than 1 minute from tracking
+        Takes one token, sleeping until it has been refilled if the bucket is empty
         """
-        now = time.time()
-
-        # Remove calls older than 1 minute
-        while self.calls and now - self.calls[0] > 60:
-            self.calls.popleft()
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
 
-        # If at limit, wait until oldest call expires
-        if len(self.calls) >= self.calls_per_minute:
-            sleep_time = 60 - (now - self.calls[0])
-            if sleep_time > 0:
-                logging.debug(f"[RATE_LIMIT] Sleeping {sleep_time:.2f}s to respect rate limit")
-                time.sleep(sleep_time)
-                # Remove expired call
-                self.calls.popleft()
+            # Reserve a token; a negative balance is the wait owed to the caller
+            self.tokens -= 1
+            sleep_time = -self.tokens / self.rate if self.tokens < 0 else 0
 
-        # Record this call
-        self.calls.append(time.time())
+        if sleep_time > 0:
+            logging.debug(f"[RATE_LIMIT] Sleeping {sleep_time:.2f}s to respect rate limit")
+            time.sleep(sleep_time)
 
 
 class EasternFormatter(logging.Formatter):
     """Custom formatter that uses US/Eastern timezone"""
 
+    EASTERN = pytz.timezone('US/Eastern')
+    DEFAULT_DATEFMT = '%Y-%m-%d %H:%M:%S %Z'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Timestamps have one-second resolution, so records within the
+        # same second reuse the formatted string
+        self._cache = (None, None)
+
     def formatTime(self, record, datefmt=None):
         """Override formatTime to use Eastern timezone"""
-        eastern = pytz.timezone('US/Eastern')
-        dt = datetime.fromtimestamp(record.created, eastern)
-        if datefmt:
-            return dt.strftime(datefmt)
-        return dt.strftime('%Y-%m-%d %H:%M:%S %Z')
+        second = int(record.created)
+        cached_second, cached_time = self._cache
+        if second == cached_second:
+            return cached_time
+
+        dt = datetime.fromtimestamp(second, self.EASTERN)
+        formatted = dt.strftime(datefmt or self.DEFAULT_DATEFMT)
+        self._cache = (second, formatted)
+        return formatted
+
+
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread"""
+
+    def prepare(self, record):
+        """
+        Merge the message and arguments without formatting the record
+
+        The base class runs the full formatter here, on the caller's thread.
+        The queue never leaves the process, so exc_info can stay on the
+        record for the listener's handlers to format.
+        """
+        record = copy.copy(record)
+        # Merge now so arguments mutated after the call can't change the message
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup_logging(log_file: str = "logs/bot.log", level: str = "INFO") -> logging.Logger:
@@ -78,8 +120,13 @@ def setup_logging(log_file: str = "logs/bot.log", level: str = "INFO") -> loggin
     logger = logging.getLogger("CryptoBot")
     logger.setLevel(getattr(logging, level.upper()))
 
+    # Re-initialising (e.g. bot restarted from the web UI) replaces the old pipeline
+    shutdown_logging(logger)
+
     # File handler
-    file_handler = logging.FileHandler(log_file)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10_000_000, backupCount=5, delay=True
+    )
     file_handler.setLevel(getattr(logging, level.upper()))
 
     # Console handler
@@ -94,13 +141,85 @@ def setup_logging(log_file: str = "logs/bot.log", level: str = "INFO") -> loggin
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; formatting and writes happen on the listener thread
+    log_queue = queue.Queue(-1)
+    queue_handler = DeferredFormatQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    logger.addHandler(queue_handler)
+    logger._listener = listener
+    logger._queue_handler = queue_handler
 
     return logger
 
 
+def shutdown_logging(logger: Optional[logging.Logger] = None):
+    """
+    Flush queued log records and stop the background listener
+
+    Args:
+        logger: Logger configured by setup_logging (defaults to "CryptoBot")
+    """
+    logger = logger or logging.getLogger("CryptoBot")
+
+    listener = getattr(logger, "_listener", None)
+    if listener is None:
+        return
+
+    logger.removeHandler(logger._queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+    logger._listener = None
+    logger._queue_handler = None
+
+
+# Flush anything still queued when the process exits
+atexit.register(shutdown_logging)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize to JSON, using orjson when installed
+
+    Args:
+        obj: Object to serialize (numpy values and datetimes are handled natively by orjson)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Parse JSON, using orjson when installed
+
+    Args:
+        data: JSON string or bytes
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by the stdlib may hold NaN/Infinity, which orjson rejects
+            pass
+    return json.loads(data)
+
+
 def calculate_fees(trade_size_usd: float, maker_fee: float, taker_fee: float,
                    is_limit_order: bool = True) -> Dict[str, float]:
     """
@@ -254,6 +373,40 @@ def get_timestamp() -> str:
     return datetime.utcnow().isoformat()
 
 
+def calculate_pnl_batch(entry_prices: np.ndarray, current_prices: np.ndarray, quantities: np.ndarray,
+                        entry_fees: np.ndarray, exit_fees: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate profit/loss for several positions at once (vectorized calculate_pnl)
+
+    Args:
+        entry_prices: Entry price per unit for each position
+        current_prices: Current price per unit for each position
+        quantities: Position quantities
+        entry_fees: Fees paid on entry
+        exit_fees: Fees paid on exit (or estimated)
+
+    Returns:
+        Dictionary of arrays with the same keys as calculate_pnl
+    """
+    entry_value = entry_prices * quantities
+    current_value = current_prices * quantities
+
+    gross_pnl = current_value - entry_value
+    net_pnl = gross_pnl - entry_fees - exit_fees
+
+    pnl_pct = np.divide(net_pnl, entry_value + entry_fees,
+                        out=np.zeros_like(net_pnl), where=entry_value > 0)
+
+    return {
+        "entry_value": entry_value,
+        "current_value": current_value,
+        "gross_pnl": gross_pnl,
+        "net_pnl": net_pnl,
+        "pnl_pct": pnl_pct,
+        "total_fees": entry_fees + exit_fees
+    }
+
+
 def calculate_pnl(entry_price: float, current_price: float, quantity: float,
                  entry_fee: float = 0, exit_fee: float = 0) -> Dict[str, float]:
     """
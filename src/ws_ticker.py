@@ -0,0 +1,195 @@
+"""
+WebSocket Ticker Feed for CryptoBot
+Streams live prices from the Coinbase Exchange public ticker channel
+"""
+
+import json
+import time
+import logging
+import asyncio
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+
+class PriceTicker:
+    """Maintains an in-memory latest-price table fed by a WebSocket subscription"""
+
+    FEED_URL = "wss://ws-feed.exchange.coinbase.com"
+    RECONNECT_DELAY_SEC = 5
+
+    def __init__(self):
+        """Initialize price ticker (call start() to connect)"""
+        self.logger = logging.getLogger("CryptoBot.WSTicker")
+
+        # product_id -> (price, time.monotonic() of the tick)
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+        self._products: set = set()
+        self._listeners: List[Callable[[str, float], None]] = []
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ws = None
+        self._running = False
+
+        if not WEBSOCKETS_AVAILABLE:
+            self.logger.warning("websockets not installed. Streaming prices disabled, using REST polling.")
+
+    @property
+    def running(self) -> bool:
+        """Whether the feed thread is active"""
+        return self._running
+
+    def start(self, product_ids: Iterable[str]):
+        """
+        Start the feed in a background thread
+
+        Args:
+            product_ids: Products to subscribe to
+        """
+        if not WEBSOCKETS_AVAILABLE or self._running:
+            return
+
+        self._products = set(product_ids)
+        self._running = True
+        self._thread = threading.Thread(target=self._thread_main, name="ws-ticker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the feed and close the connection"""
+        self._running = False
+        loop = self._loop
+        if loop and self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._ws.close(), loop)
+
+    def set_products(self, product_ids: Iterable[str]):
+        """
+        Update the subscribed products, (un)subscribing only the difference
+
+        Args:
+            product_ids: Products that should be streamed
+        """
+        wanted = set(product_ids)
+        added = wanted - self._products
+        removed = self._products - wanted
+        self._products = wanted
+
+        with self._lock:
+            for product_id in removed:
+                self._prices.pop(product_id, None)
+
+        loop = self._loop
+        if not (loop and self._ws is not None):
+            return  # Picked up on next (re)connect
+
+        if added:
+            asyncio.run_coroutine_threadsafe(self._send("subscribe", added), loop)
+        if removed:
+            asyncio.run_coroutine_threadsafe(self._send("unsubscribe", removed), loop)
+
+    def add_listener(self, callback: Callable[[str, float], None]):
+        """
+        Register a callback invoked from the feed thread on every tick
+
+        Args:
+            callback: Function taking (product_id, price)
+        """
+        self._listeners.append(callback)
+
+    def get_price(self, product_id: str, max_age_sec: float) -> Optional[float]:
+        """
+        Get latest streamed price if it is fresh enough
+
+        Args:
+            product_id: Product ID (e.g., BTC-USD)
+            max_age_sec: Maximum age of the tick in seconds
+
+        Returns:
+            Price, or None if not streamed or stale
+        """
+        entry = self._prices.get(product_id)
+        if entry is None:
+            return None
+
+        price, ts = entry
+        if time.monotonic() - ts > max_age_sec:
+            return None
+        return price
+
+    def _thread_main(self):
+        """Run the feed event loop in this thread"""
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._run())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    async def _run(self):
+        """Connect, subscribe and consume ticks; reconnect on failure"""
+        while self._running:
+            try:
+                async with websockets.connect(self.FEED_URL, ping_interval=20) as ws:
+                    self._ws = ws
+                    self.logger.info(f"Connected to ticker feed ({len(self._products)} products)")
+                    if self._products:
+                        await self._send("subscribe", self._products)
+
+                    async for message in ws:
+                        self._handle_message(message)
+
+            except Exception as e:
+                if self._running:
+                    self.logger.warning(f"Ticker feed disconnected: {e}")
+            finally:
+                self._ws = None
+
+            if self._running:
+                await asyncio.sleep(self.RECONNECT_DELAY_SEC)
+
+    async def _send(self, msg_type: str, product_ids: Iterable[str]):
+        """Send a subscribe/unsubscribe request for the ticker channel"""
+        ws = self._ws
+        if ws is None:
+            return
+        await ws.send(json.dumps({
+            "type": msg_type,
+            "product_ids": sorted(product_ids),
+            "channels": ["ticker"]
+        }))
+
+    def _handle_message(self, message: str):
+        """Store the price from a ticker message and notify listeners"""
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+
+        msg_type = data.get("type")
+        if msg_type == "error":
+            self.logger.warning(f"Ticker feed error: {data.get('message')} {data.get('reason', '')}")
+            return
+        if msg_type != "ticker":
+            return
+
+        product_id = data.get("product_id")
+        try:
+            price = float(data["price"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            self._prices[product_id] = (price, time.monotonic())
+
+        for callback in self._listeners:
+            try:
+                callback(product_id, price)
+            except Exception as e:
+                self.logger.error(f"Ticker listener error: {e}")
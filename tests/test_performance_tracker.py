@@ -0,0 +1,116 @@
+"""Tests for PerformanceTracker trade queries"""
+
+import csv
+import os
+from datetime import datetime, timedelta
+
+import pytz
+
+from src.performance_tracker import PerformanceTracker
+
+EASTERN = pytz.timezone('US/Eastern')
+
+
+def make_tracker(tmp_path):
+    """Tracker writing to a temporary trade log"""
+    return PerformanceTracker({
+        "trade_log_file": str(tmp_path / "trades.csv"),
+        "performance_file": str(tmp_path / "performance.json")
+    })
+
+
+def append_trade(tracker, timestamp, product_id, side="SELL", net_pnl=0.0, pnl_pct=0.0, notes=""):
+    """Append a row in the trade log's CSV layout"""
+    with open(tracker.trade_log_file, 'a', newline='') as f:
+        csv.writer(f).writerow([
+            timestamp.isoformat(), product_id, side, 1, 100, 100, 0.5,
+            net_pnl, pnl_pct, 1.0, "test", notes
+        ])
+
+
+def test_get_trades_since_returns_trades_at_or_after_cutoff(tmp_path):
+    tracker = make_tracker(tmp_path)
+    now = EASTERN.localize(datetime(2024, 3, 1, 12, 0, 0))
+    for hours, product_id in ((10, "A-USD"), (5, "B-USD"), (3, "C-USD"), (1, "D-USD")):
+        append_trade(tracker, now - timedelta(hours=hours), product_id)
+
+    # Naive cutoffs are Eastern wall time
+    cutoff = (now - timedelta(hours=5)).replace(tzinfo=None)
+    assert [t["product_id"] for t in tracker.get_trades_since(cutoff)] == ["B-USD", "C-USD", "D-USD"]
+
+    # Aware cutoffs in another zone select the same instant
+    assert [t["product_id"] for t in tracker.get_trades_since(now.astimezone(pytz.utc))] == []
+
+
+def test_get_trades_since_sees_appended_trades(tmp_path):
+    tracker = make_tracker(tmp_path)
+    now = EASTERN.localize(datetime(2024, 3, 1, 12, 0, 0))
+    append_trade(tracker, now - timedelta(hours=2), "A-USD")
+    cutoff = now - timedelta(hours=3)
+    assert len(tracker.get_trades_since(cutoff)) == 1
+
+    tracker.log_trade({"product_id": "B-USD", "side": "BUY"})
+    assert [t["product_id"] for t in tracker.get_trades_since(cutoff)] == ["A-USD", "B-USD"]
+
+
+def test_get_trades_since_handles_out_of_order_rows(tmp_path):
+    tracker = make_tracker(tmp_path)
+    now = EASTERN.localize(datetime(2024, 3, 1, 12, 0, 0))
+    append_trade(tracker, now - timedelta(hours=1), "LATE-USD")
+    append_trade(tracker, now - timedelta(hours=6), "EARLY-USD")
+
+    assert [t["product_id"] for t in tracker.get_trades_since(now - timedelta(hours=2))] == ["LATE-USD"]
+
+
+def test_summarize_closed_trades_counts_sell_rows(tmp_path):
+    tracker = make_tracker(tmp_path)
+    trades = [
+        {"side": "BUY", "net_pnl": "0", "pnl_pct": "0"},
+        {"side": "SELL", "net_pnl": "12.5", "pnl_pct": "2.5"},
+        {"side": "SELL", "net_pnl": "-10.0", "pnl_pct": "-2.0"},
+        {"side": "SELL", "net_pnl": "-20.0", "pnl_pct": "-4.0"},
+        {"side": "SELL", "net_pnl": "0", "pnl_pct": "0"},
+    ]
+
+    summary = tracker.summarize_closed_trades(trades)
+
+    assert summary == {"closed": 4, "wins": 1, "losses": 2, "avg_loss_pct": -3.0}
+
+
+def test_summarize_closed_trades_without_losses(tmp_path):
+    tracker = make_tracker(tmp_path)
+    summary = tracker.summarize_closed_trades([])
+    assert summary == {"closed": 0, "wins": 0, "losses": 0, "avg_loss_pct": 0.0}
+
+
+def test_get_recent_trades_when_block_starts_on_line_break(tmp_path):
+    tracker = make_tracker(tmp_path)
+    start = EASTERN.localize(datetime(2024, 3, 1))
+    for i in range(299):
+        append_trade(tracker, start + timedelta(minutes=i), f"T{i:03d}-USD")
+    with open(tracker.trade_log_file, 'rb') as f:
+        data = f.read()
+
+    # Pad the last row so the 8 KiB block read from the end starts on a line break
+    row_len = len(data) - data.rindex(b'\n', 0, len(data) - 1) - 1
+    boundary = len(data) + row_len - 8192
+    newline = data.index(b'\n', boundary)
+    append_trade(tracker, start + timedelta(minutes=299), "T299-USD", notes="x" * (newline - boundary))
+    assert os.path.getsize(tracker.trade_log_file) - 8192 == newline
+
+    # Ask for every complete row in that block
+    n = data[newline + 1:].count(b'\n') + 1
+    trades = tracker.get_recent_trades(n)
+
+    assert [t["product_id"] for t in trades] == [f"T{i:03d}-USD" for i in range(300 - n, 300)]
+
+
+def test_get_recent_trades_keeps_multiline_notes(tmp_path):
+    tracker = make_tracker(tmp_path)
+    start = EASTERN.localize(datetime(2024, 3, 1))
+    append_trade(tracker, start, "A-USD")
+    append_trade(tracker, start + timedelta(minutes=1), "B-USD", notes="line one\nline two")
+
+    trades = tracker.get_recent_trades(1)
+
+    assert [(t["product_id"], t["notes"]) for t in trades] == [("B-USD", "line one\nline two")]
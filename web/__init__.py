@@ -0,0 +1,4 @@
+"""
+CryptoBot Web Dashboard
+Flask application package (served as web.app:app)
+"""
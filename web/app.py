@@ -4,133 +4,605 @@ Provides web dashboard for monitoring and control
 """
 
 import os
+
+# Optional cooperative server: SOCKETIO_ASYNC_MODE=gevent (or eventlet)
+# multiplexes requests and socket clients on green threads, so waits on
+# Coinbase/Claude/CoinGecko don't each hold an OS thread. Monkey patching has
+# to happen before anything else imports threading/socket/requests, so it
+# lives at the very top. It is opt-in: the bot's asyncio pieces (WebSocket
+# price ticker, Telegram notifier, asyncio.to_thread workers) create threads
+# that become greenlets when threading is patched, and their event loops then
+# clash with the bot's own loop. The default stays "threading".
+ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "threading")
+if ASYNC_MODE == "gevent":
+    from gevent import monkey
+    monkey.patch_all()
+elif ASYNC_MODE == "eventlet":
+    import eventlet
+    eventlet.monkey_patch()
+
+import re
 import sys
-import json
+import time
+import functools
+import hashlib
+import uuid
+import shutil
+import tempfile
 import threading
+import traceback
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import logging
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+# Imported as web.app (gunicorn, python -m web.app) the project root is
+# already importable; only a direct `python web/app.py` needs it on the path
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.trading_bot import TradingBot
 from src.config_manager import ConfigManager
+from src.coinbase_client import CoinbaseClient
+from src.claude_analyst import ClaudeAnalyst, convert_numpy_types
+from src.coingecko_data import CoinGeckoCollector
+from src.news_sentiment import NewsSentiment
+from src.utils import EasternFormatter, json_dumps, json_loads
 from src import __version__
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson straight to bytes"""
+
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'cryptobot-secret-key-change-in-production'
-socketio = SocketIO(app, cors_allowed_origins="*")
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+if COMPRESS_AVAILABLE:
+    # Trade history, logs and screener results are large, highly compressible JSON
+    app.config.update(
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_MIN_SIZE=500,
+        COMPRESS_LEVEL=5,
+        COMPRESS_BR_LEVEL=5,
+        COMPRESS_MIMETYPES=['application/json', 'text/plain', 'text/html'],
+        # Compressing a streamed body buffers all of it first (get_data())
+        COMPRESS_STREAMS=False
+    )
+    Compress(app)
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode=ASYNC_MODE,
+    # e.g. redis://localhost:6379/0 to share emits between worker processes
+    message_queue=os.getenv("SOCKETIO_MESSAGE_QUEUE")
+)
+
+
+def run_blocking(fn, *args, **kwargs):
+    """
+    Run CPU-heavy work without stalling the cooperative server
+
+    Under gevent/eventlet the call is executed on a native OS thread pool so
+    the hub keeps serving /health and Socket.IO pings; in threading mode it
+    is a plain call.
+
+    Args:
+        fn: Function to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    if ASYNC_MODE == "gevent":
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+    if ASYNC_MODE == "eventlet":
+        from eventlet import tpool
+        return tpool.execute(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
+
+
+class _PooledThread:
+    """Thread-like handle for a long-running function on the hub's native thread pool"""
+
+    def __init__(self, target, name: str):
+        self.name = name
+        if ASYNC_MODE == "gevent":
+            import gevent
+            self._result = gevent.get_hub().threadpool.spawn(target)
+        else:
+            import eventlet
+            from eventlet import tpool
+            self._result = eventlet.spawn(tpool.execute, target)
+
+    def is_alive(self) -> bool:
+        """Whether the function is still running"""
+        if ASYNC_MODE == "gevent":
+            return not self._result.ready()
+        return not self._result.dead
+
+    def join(self, timeout: float = None):
+        """Wait (cooperatively) for the function to return, at most timeout seconds"""
+        if ASYNC_MODE == "gevent":
+            self._result.wait(timeout)
+            return
+        import eventlet
+        with eventlet.Timeout(timeout, False):
+            self._result.wait()
+
+
+def start_native_thread(target, name: str):
+    """
+    Run a long-lived function on a real OS thread
+
+    With gevent/eventlet, threading is monkey patched and a threading.Thread
+    is only a greenlet on the server's hub, so the function would share the
+    hub's OS thread with every request. The trading bot runs its own asyncio
+    loop and CPU-bound screener scoring, which must not run there.
+
+    Args:
+        target: Function to run
+        name: Thread name (used in threading mode)
+
+    Returns:
+        Started handle with is_alive() and join(timeout)
+    """
+    if ASYNC_MODE in ("gevent", "eventlet"):
+        return _PooledThread(target, name)
+
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+# Shared pool for slow outbound work (Claude jobs, API connection tests)
+IO_TIMEOUT_SEC = 30
+io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cb-io")
+
+
+def call_with_timeout(fn, *args, timeout: float = IO_TIMEOUT_SEC, **kwargs):
+    """
+    Run an outbound call on the shared I/O pool and wait at most timeout seconds
+
+    Args:
+        fn: Function to run
+        *args: Positional arguments for fn
+        timeout: Seconds to wait for the result
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+
+    Raises:
+        FutureTimeoutError: If fn didn't finish in time (it keeps running in the pool)
+    """
+    return io_executor.submit(fn, *args, **kwargs).result(timeout=timeout)
+
 
 # Set timezone to US Eastern
 EASTERN = pytz.timezone('US/Eastern')
 
-# Configure logging with Eastern timezone
-class EasternFormatter(logging.Formatter):
-    def formatTime(self, record, datefmt=None):
-        dt = datetime.fromtimestamp(record.created, EASTERN)
-        if datefmt:
-            return dt.strftime(datefmt)
-        return dt.strftime('%Y-%m-%d %H:%M:%S %Z')
+logger = logging.getLogger("CryptoBot.Web")
+
+# Log lines explaining why an opportunity was not traded
+REJECTION_RE = re.compile(r'rejected|skipped|blocked|failed|insufficient', re.IGNORECASE)
+
+
+class BotRegistry:
+    """Thread-safe holder for the dashboard's trading bot and its thread"""
+
+    # How long stop() waits for the bot thread to exit
+    STOP_JOIN_TIMEOUT_SEC = 10
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger("CryptoBot.Web")
+        self.bot = None
+        self.thread = None
+
+    def _is_active(self) -> bool:
+        """Whether the bot is running or its thread is still starting up"""
+        if self.bot is None:
+            return False
+        if self.bot.running:
+            return True
+        return self.thread is not None and self.thread.is_alive() and not self.bot._stop_event.is_set()
+
+    def start(self):
+        """
+        Create a new bot and start it in a background thread
+
+        Returns:
+            The started bot
+
+        Raises:
+            RuntimeError: If a bot is already running
+        """
+        with self._lock:
+            if self._is_active():
+                raise RuntimeError("Bot already running")
+            if self.thread is not None and self.thread.is_alive():
+                # A second loop would double the exchange API calls
+                raise RuntimeError("Previous bot is still shutting down")
+
+            bot = TradingBot()
+            # Emit from a background task so gathering the payloads never delays the trading loop
+            bot.add_tick_listener(functools.partial(socketio.start_background_task, push_dashboard_update, bot))
+            # Not a plain threading.Thread: with SOCKETIO_ASYNC_MODE=gevent/eventlet
+            # that would be a greenlet on the server's hub, and the bot's asyncio
+            # loop and screener scoring would then block every request
+            thread = start_native_thread(bot.start, name="trading-bot")
+            self.bot, self.thread = bot, thread
+            return bot
+
+    def stop(self):
+        """
+        Stop the running bot and wait (bounded) for its thread to exit
+
+        Raises:
+            RuntimeError: If no bot is running
+        """
+        with self._lock:
+            if not self._is_active():
+                raise RuntimeError("Bot not running")
+            self.bot.stop()
+            thread = self.thread
+
+        # Join outside the lock so readers aren't blocked while the loop winds down
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.STOP_JOIN_TIMEOUT_SEC)
+            if thread.is_alive():
+                self.logger.warning("Bot thread did not exit within "
+                                    f"{self.STOP_JOIN_TIMEOUT_SEC}s")
+
+    def snapshot(self):
+        """Get a stable reference to the current bot (or None)"""
+        with self._lock:
+            return self.bot
+
+
+bot_registry = BotRegistry()
+
+# Response cache TTLs (seconds) for read-only endpoints polled by the dashboard
+RESPONSE_CACHE_TTL = {
+    'balance': 5,
+    'positions': 3,
+    'performance': 30,
+    'config': 300,
+    'screener': 60
+}
+TRADING_CACHE_KEYS = ('balance', 'positions', 'performance')
+
+# Shared ConfigManager, re-parsed only when the config file changes on disk
+_config_manager = None
+_config_version = None
+_config_lock = threading.Lock()
+
+# (name, query string) -> (expires_at, body, mimetype)
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+
+def _cached_to_response(entry, cache_state):
+    """Build a response from a cache entry"""
+    _expires_at, body, mimetype = entry
+    response = app.response_class(body, mimetype=mimetype)
+    response.headers['X-Cache'] = cache_state
+    return response
+
+
+def cached_response(name):
+    """
+    Cache a read-only endpoint's successful response for RESPONSE_CACHE_TTL[name]
+
+    If the endpoint fails, the last good response is served with X-Cache: stale.
+
+    Args:
+        name: Cache policy name (also used for invalidation)
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (name, request.query_string)
+            with _response_cache_lock:
+                entry = _response_cache.get(key)
+
+            if entry and time.monotonic() < entry[0]:
+                return _cached_to_response(entry, 'hit')
+
+            try:
+                response = app.make_response(view(*args, **kwargs))
+            except Exception:
+                if entry:
+                    return _cached_to_response(entry, 'stale')
+                raise
+
+            if response.status_code == 200:
+                with _response_cache_lock:
+                    _response_cache[key] = (
+                        time.monotonic() + RESPONSE_CACHE_TTL[name],
+                        response.get_data(),
+                        response.mimetype
+                    )
+                response.headers['X-Cache'] = 'miss'
+            elif response.status_code >= 500 and entry:
+                return _cached_to_response(entry, 'stale')
+
+            return response
+        return wrapper
+    return decorator
+
+
+def get_config_manager(reload: bool = False) -> ConfigManager:
+    """
+    Get the shared ConfigManager, re-reading the config file only when its
+    modification time or size changed (e.g. the bot saved an update)
+
+    Args:
+        reload: Re-read the config file now (use before modifying and saving)
+
+    Returns:
+        Shared ConfigManager instance
+    """
+    global _config_manager, _config_version
+
+    with _config_lock:
+        if _config_manager is None:
+            _config_manager = ConfigManager()
+            _config_version = _config_file_version(_config_manager.config_path)
+            return _config_manager
+
+        version = _config_file_version(_config_manager.config_path)
+        if reload or version != _config_version:
+            _config_manager.load()
+            _config_version = version
+        return _config_manager
+
+
+# Parsed JSON data files: path -> ((mtime_ns, size), mtime, data)
+_json_file_cache = {}
+_json_file_cache_lock = threading.Lock()
+
+
+def load_json_cached(path: str):
+    """
+    Load a JSON data file, re-parsing it only when it changed on disk
+
+    The returned data is shared between callers and must not be modified.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Tuple of (data, modification time as a timestamp), or None if the file doesn't exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    version = (st.st_mtime_ns, st.st_size)
+    with _json_file_cache_lock:
+        entry = _json_file_cache.get(path)
+    if entry is not None and entry[0] == version:
+        return entry[2], entry[1]
 
-# Global bot instance
-bot = None
-bot_thread = None
+    with open(path, 'rb') as f:
+        data = json_loads(f.read())
+    with _json_file_cache_lock:
+        _json_file_cache[path] = (version, st.st_mtime, data)
+    return data, st.st_mtime
+
+
+def write_text_atomic(path: str, text: str):
+    """
+    Replace a file's contents in one step (temp file + os.replace)
+
+    Args:
+        path: Destination path
+        text: New file contents
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False) as f:
+        f.write(text)
+        tmp_path = f.name
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
+
+def _config_file_version(path: str):
+    """(mtime_ns, size) of the config file, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def invalidate_response_cache(*names):
+    """
+    Drop cached responses
+
+    Args:
+        names: Cache policy names to drop (all if none given)
+    """
+    with _response_cache_lock:
+        if not names:
+            _response_cache.clear()
+            return
+        for key in [key for key in _response_cache if key[0] in names]:
+            del _response_cache[key]
+
+
+# Rendered dashboard page, built once per process: (etag, body)
+_index_cache = None
 
 
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template('index.html', version=__version__)
+    global _index_cache
+    if _index_cache is None or app.debug:
+        # The page only changes between deploys; re-render per hit in debug mode
+        body = render_template('index.html', version=__version__).encode()
+        _index_cache = (hashlib.md5(body).hexdigest(), body)
+
+    etag, body = _index_cache
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    return with_etag(app.response_class(body, mimetype='text/html'), etag)
+
+
+# Preserialized /health body, rebuilt at most once per second: (second, body).
+# Only the timestamp changes, so the rest of the object is serialized once.
+_HEALTH_PREFIX = app.json.dumps({"status": "healthy", "version": __version__})[:-1].encode() + b',"timestamp":"'
+_health_cache = (None, b"")
 
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "timestamp": datetime.now(EASTERN).isoformat(), "version": __version__})
+    global _health_cache
+    second = int(time.time())
+    cached_second, body = _health_cache
+    if cached_second != second:
+        timestamp = datetime.fromtimestamp(second, EASTERN).isoformat()
+        body = _HEALTH_PREFIX + timestamp.encode() + b'"}'
+        _health_cache = (second, body)
+    return app.response_class(body, mimetype='application/json')
+
+
+# Serialized /api/status body: ((bot, status_version, config version), expires_at, body).
+# The age cap covers what the bot can't version, like a live exchange balance.
+STATUS_CACHE_MAX_AGE_SEC = 10
+_status_cache = (None, 0.0, b"")
+
+# Map screener to prompt (from claude_analyst.py logic)
+SCREENER_TO_PROMPT = MappingProxyType({
+    'breakouts': 'breakout_hunter',
+    'momentum': 'momentum_bull',
+    'trending': 'momentum_bull',
+    'oversold': 'dip_buying',
+    'bear_bounce': 'bear_survival',
+    'mean_reversion': 'bear_survival',
+    'scalping': 'range_scalping',
+    'range_trading': 'range_scalping',
+    'support': 'range_scalping',
+    'auto': 'momentum_bull',
+    'pending': 'momentum_bull'
+})
 
 
 @app.route('/api/status')
 def get_status():
-    """Get bot status"""
-    if bot:
-        status = bot.get_status()
-        status['version'] = __version__
-
-        # Add AUTO mode information to active_config
-        if 'active_config' in status:
-            config_manager = ConfigManager()
-            full_config = config_manager.get_all()
-
-            claude_prompt_strategy = full_config.get('claude_prompt_strategy', 'auto')
-
-            # Get the ACTUAL active screener mode, not the configured mode
-            # active_screener_mode is what's actually running (e.g., "mean_reversion")
-            # screener_mode might be "auto"
-            actual_screener_mode = status['active_config'].get('active_screener_mode', 'auto')
-            configured_screener_mode = status['active_config'].get('screener_mode', 'auto')
-
-            # Map screener to prompt (from claude_analyst.py logic)
-            screener_to_prompt_mapping = {
-                'breakouts': 'breakout_hunter',
-                'momentum': 'momentum_bull',
-                'trending': 'momentum_bull',
-                'oversold': 'dip_buying',
-                'bear_bounce': 'bear_survival',
-                'mean_reversion': 'bear_survival',
-                'scalping': 'range_scalping',
-                'range_trading': 'range_scalping',
-                'support': 'range_scalping',
-                'auto': 'momentum_bull',
-                'pending': 'momentum_bull'
-            }
+    """Get bot status (reused until the bot reports a change, at most STATUS_CACHE_MAX_AGE_SEC)"""
+    global _status_cache
+    bot = bot_registry.snapshot()
+    if not bot:
+        return jsonify({"running": False, "error": "Bot not initialized", "version": __version__})
 
-            # Determine actual Claude prompt being used
-            if claude_prompt_strategy == 'auto':
-                # Use the actual active screener mode for mapping
-                actual_claude_prompt = screener_to_prompt_mapping.get(actual_screener_mode, 'momentum_bull')
-                status['active_config']['auto_mode_active'] = True
-                status['active_config']['auto_mode_screener'] = actual_screener_mode
-                status['active_config']['auto_mode_claude_prompt'] = actual_claude_prompt
-            else:
-                status['active_config']['auto_mode_active'] = False
-                status['active_config']['auto_mode_screener'] = actual_screener_mode
-                status['active_config']['auto_mode_claude_prompt'] = claude_prompt_strategy
+    get_config_manager()  # Refreshes _config_version if the file changed
+    key = (id(bot), bot.status_version, _config_version)
+    cached_key, expires_at, body = _status_cache
+    if cached_key != key or time.monotonic() >= expires_at:
+        body = app.json.dumps(_status_payload(bot)).encode()
+        _status_cache = (key, time.monotonic() + STATUS_CACHE_MAX_AGE_SEC, body)
+    return app.response_class(body, mimetype='application/json')
 
-        return jsonify(status)
-    else:
-        return jsonify({"running": False, "error": "Bot not initialized", "version": __version__})
+
+def _status_payload(bot) -> dict:
+    """
+    Build the bot status shown in the dashboard header
+
+    Args:
+        bot: Trading bot
+
+    Returns:
+        Status dictionary including AUTO mode details
+    """
+    status = bot.get_status()
+    status['version'] = __version__
+
+    # Add AUTO mode information to active_config
+    if 'active_config' in status:
+        config_manager = get_config_manager()
+        full_config = config_manager.get_all()
+
+        claude_prompt_strategy = full_config.get('claude_prompt_strategy', 'auto')
+
+        # Get the ACTUAL active screener mode, not the configured mode
+        # active_screener_mode is what's actually running (e.g., "mean_reversion")
+        # screener_mode might be "auto"
+        actual_screener_mode = status['active_config'].get('active_screener_mode', 'auto')
+        configured_screener_mode = status['active_config'].get('screener_mode', 'auto')
+
+        # Determine actual Claude prompt being used
+        if claude_prompt_strategy == 'auto':
+            # Use the actual active screener mode for mapping
+            actual_claude_prompt = SCREENER_TO_PROMPT.get(actual_screener_mode, 'momentum_bull')
+            status['active_config']['auto_mode_active'] = True
+            status['active_config']['auto_mode_screener'] = actual_screener_mode
+            status['active_config']['auto_mode_claude_prompt'] = actual_claude_prompt
+        else:
+            status['active_config']['auto_mode_active'] = False
+            status['active_config']['auto_mode_screener'] = actual_screener_mode
+            status['active_config']['auto_mode_claude_prompt'] = claude_prompt_strategy
+
+    return status
 
 
 @app.route('/api/config', methods=['GET'])
+@cached_response('config')
 def get_config():
     """Get current configuration"""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     config = config_manager.get_all()
 
     # Add AUTO mode mapping information
     claude_prompt_strategy = config.get('claude_prompt_strategy', 'auto')
     screener_mode = config.get('screener_mode', 'auto')
 
-    # Map screener to prompt (from claude_analyst.py logic)
-    screener_to_prompt_mapping = {
-        'breakouts': 'breakout_hunter',
-        'momentum': 'momentum_bull',
-        'trending': 'momentum_bull',
-        'oversold': 'dip_buying',
-        'bear_bounce': 'bear_survival',
-        'mean_reversion': 'bear_survival',
-        'scalping': 'range_scalping',
-        'range_trading': 'range_scalping',
-        'support': 'range_scalping',
-        'auto': 'momentum_bull'
-    }
-
     # Determine actual Claude prompt being used
     if claude_prompt_strategy == 'auto':
-        actual_claude_prompt = screener_to_prompt_mapping.get(screener_mode, 'momentum_bull')
+        actual_claude_prompt = SCREENER_TO_PROMPT.get(screener_mode, 'momentum_bull')
         config['auto_mode_active'] = True
         config['auto_mode_screener'] = screener_mode
         config['auto_mode_claude_prompt'] = actual_claude_prompt
@@ -145,16 +617,19 @@ def get_config():
 @app.route('/api/config', methods=['POST'])
 def update_config():
     """Update configuration"""
+    bot = bot_registry.snapshot()
     try:
-        updates = request.json
-        config_manager = ConfigManager()
+        updates = request.get_json(silent=True)
+        if not isinstance(updates, dict):
+            return jsonify({"success": False, "error": "Expected a JSON object"}), 400
+        config_manager = get_config_manager(reload=True)
         config_manager.update(updates)
         config_manager.save()
+        invalidate_response_cache('config')
 
         # If bot is running, reload its config
         if bot:
-            bot.config_manager.load()
-            bot.config = bot.config_manager.get_all()
+            bot.reload_config()
 
         return jsonify({"success": True, "message": "Configuration updated"})
     except Exception as e:
@@ -164,8 +639,8 @@ def update_config():
 @app.route('/api/config/reset', methods=['POST'])
 def reset_config():
     """Reset configuration to defaults"""
+    bot = bot_registry.snapshot()
     try:
-        import os
         config_path = "data/config.json"
 
         # Backup old config
@@ -174,13 +649,14 @@ def reset_config():
             os.rename(config_path, backup_path)
 
         # Reload default config
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
+        config_manager.reset_to_defaults()
         config_manager.save()
+        invalidate_response_cache('config')
 
         # If bot is running, reload its config
         if bot:
-            bot.config_manager.load()
-            bot.config = bot.config_manager.get_all()
+            bot.reload_config()
 
         return jsonify({"success": True, "message": "Configuration reset to defaults"})
     except Exception as e:
@@ -191,11 +667,12 @@ def reset_config():
 def apply_preset(preset_name):
     """Apply configuration preset"""
     try:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager(reload=True)
         success = config_manager.apply_preset(preset_name)
 
         if success:
             config_manager.save()
+            invalidate_response_cache('config')
             return jsonify({"success": True, "message": f"Applied {preset_name} preset"})
         else:
             return jsonify({"success": False, "error": "Invalid preset"}), 400
@@ -207,21 +684,14 @@ def apply_preset(preset_name):
 @app.route('/api/bot/start', methods=['POST'])
 def start_bot():
     """Start the trading bot"""
-    global bot, bot_thread
-
-    if bot and bot.running:
-        return jsonify({"success": False, "error": "Bot already running"}), 400
-
     try:
-        bot = TradingBot()
-
-        # Start bot in separate thread
-        bot_thread = threading.Thread(target=bot.start)
-        bot_thread.daemon = True
-        bot_thread.start()
+        bot_registry.start()
+        invalidate_response_cache()
 
         return jsonify({"success": True, "message": "Bot started"})
 
+    except RuntimeError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -229,124 +699,261 @@ def start_bot():
 @app.route('/api/bot/stop', methods=['POST'])
 def stop_bot():
     """Stop the trading bot"""
-    global bot
-
-    if not bot or not bot.running:
-        return jsonify({"success": False, "error": "Bot not running"}), 400
-
     try:
-        bot.stop()
+        bot_registry.stop()
+        invalidate_response_cache()
+
+        bot = bot_registry.snapshot()
+        if bot and has_clients():
+            socketio.emit('status', _status_payload(bot))
         return jsonify({"success": True, "message": "Bot stopped"})
 
+    except RuntimeError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
 @app.route('/api/positions')
+@cached_response('positions')
 def get_positions():
     """Get all open positions"""
+    bot = bot_registry.snapshot()
     if bot:
-        positions = bot.risk_manager.get_all_positions()
+        return jsonify(_positions_with_pnl(bot))
+    else:
+        return jsonify([])
+
 
-        # Add current P&L for each position
-        positions_with_pnl = []
-        for pos in positions:
-            current_price = bot.data_collector.get_current_price(pos['product_id'])
-            if current_price:
-                pnl = bot.risk_manager.get_position_pnl(pos['product_id'], current_price)
-                if pnl:
-                    pos.update(pnl)
+def iter_json_array(rows, chunk_rows: int = 200):
+    """
+    Serialize an iterable as JSON array text, a chunk of items at a time
 
-            positions_with_pnl.append(pos)
+    Args:
+        rows: Iterable of JSON-serializable items
+        chunk_rows: Items serialized per yielded chunk
 
-        return jsonify(positions_with_pnl)
-    else:
-        return jsonify([])
+    Yields:
+        Pieces of the JSON array text
+    """
+    dumps = app.json.dumps
+    yield '['
+    chunk = []
+    first = True
+    for row in rows:
+        chunk.append(dumps(row))
+        if len(chunk) >= chunk_rows:
+            yield ('' if first else ',') + ','.join(chunk)
+            chunk, first = [], False
+    if chunk:
+        yield ('' if first else ',') + ','.join(chunk)
+    yield ']'
+
+
+def stream_json_array(rows, chunk_rows: int = 200):
+    """
+    Stream an iterable as a JSON array without building the whole body in memory
+
+    Args:
+        rows: Iterable of JSON-serializable items
+        chunk_rows: Items serialized per written chunk
+
+    Returns:
+        Streaming JSON response
+    """
+    return app.response_class(stream_with_context(iter_json_array(rows, chunk_rows)),
+                              mimetype='application/json')
 
 
 @app.route('/api/trades')
 def get_trades():
-    """Get trade history"""
-    if bot:
-        trades = bot.performance_tracker.get_all_trades()
-        return jsonify(trades)
-    else:
+    """Get trade history (streamed; revalidated against the trade log's ETag)"""
+    bot = bot_registry.snapshot()
+    if not bot:
+        return jsonify([])
+
+    tracker = bot.performance_tracker
+    try:
+        etag = file_etag(tracker.trade_log_file)
+    except OSError:
         return jsonify([])
 
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    return with_etag(stream_json_array(tracker.iter_trades()), etag)
+
 
 @app.route('/api/performance')
+@cached_response('performance')
 def get_performance():
     """Get performance metrics"""
+    bot = bot_registry.snapshot()
     if bot:
-        metrics = bot.performance_tracker.calculate_metrics()
+        metrics = run_blocking(bot.performance_tracker.calculate_metrics)
         return jsonify(metrics)
     else:
         return jsonify({})
 
 
 @app.route('/api/balance')
+@cached_response('balance')
 def get_balance():
     """Get account balance"""
+    bot = bot_registry.snapshot()
     if bot:
-        # In dry run mode, use simulated capital
-        if bot.dry_run:
-            # Get current capital from risk manager (tracks simulated balance)
-            balance = bot.risk_manager.current_capital
-        else:
-            # Live mode - get actual Coinbase balance
-            balance = bot.coinbase.get_balance("USD")
-
-        return jsonify({
-            "balance_usd": balance,
-            "dry_run": bot.dry_run
-        })
+        return jsonify(_balance_payload(bot))
     else:
         return jsonify({"balance_usd": 0, "dry_run": True})
 
 
+def _positions_with_pnl(bot) -> list:
+    """Open positions with current price and P&L"""
+    positions = bot.risk_manager.get_all_positions()
+
+    # Fetch all current prices in one batch instead of one request per position
+    prices = bot.data_collector.get_current_prices([pos['product_id'] for pos in positions]) if positions else {}
+
+    def with_pnl(pos):
+        """New dict with the position's current P&L merged in (when priced)"""
+        current_price = prices.get(pos['product_id'])
+        pnl = bot.risk_manager.get_position_pnl(pos['product_id'], current_price) if current_price else None
+        return {**pos, **pnl} if pnl else pos
+
+    return [with_pnl(pos) for pos in positions]
+
+
+def _balance_payload(bot) -> dict:
+    """Account balance (simulated capital in dry run mode)"""
+    # In dry run mode, use simulated capital
+    if bot.dry_run:
+        # Get current capital from risk manager (tracks simulated balance)
+        balance = bot.risk_manager.current_capital
+    else:
+        # Live mode - get actual Coinbase balance
+        balance = bot.coinbase.get_balance("USD")
+
+    return {
+        "balance_usd": balance,
+        "dry_run": bot.dry_run
+    }
+
+
+# Connected dashboard sockets; pushes are skipped when nobody is watching
+_client_count = 0
+_client_count_lock = threading.Lock()
+
+
+@socketio.on('connect')
+def on_client_connect():
+    """Track a newly connected dashboard"""
+    global _client_count
+    with _client_count_lock:
+        _client_count += 1
+
+
+@socketio.on('disconnect')
+def on_client_disconnect():
+    """Track a disconnected dashboard"""
+    global _client_count
+    with _client_count_lock:
+        _client_count = max(0, _client_count - 1)
+
+
+def has_clients() -> bool:
+    """Whether any dashboard is connected over Socket.IO"""
+    return _client_count > 0
+
+
+def push_dashboard_update(bot):
+    """
+    Push status, balance, positions and performance to connected dashboards
+
+    Registered as a bot tick listener, so metrics are computed once per bot
+    iteration rather than once per polling client. Nothing is fetched or
+    computed when no dashboard is connected.
+    """
+    if not has_clients():
+        return
+    socketio.emit('status', _status_payload(bot))
+    socketio.emit('balance', _balance_payload(bot))
+    socketio.emit('positions', _positions_with_pnl(bot))
+    socketio.emit('performance', run_blocking(bot.performance_tracker.calculate_metrics))
+
+
+# Single-flight for manual screener runs: concurrent requests share one scan
+SCREENER_WAIT_TIMEOUT_SEC = 120
+_screener_future = None
+_screener_lock = threading.Lock()
+
+
+def _screen_coins_shared(bot):
+    """
+    Run the screener, letting concurrent callers wait on the in-flight scan
+
+    Args:
+        bot: Trading bot whose screener to run
+
+    Returns:
+        Screener results
+    """
+    global _screener_future
+
+    with _screener_lock:
+        future = _screener_future
+        owner = future is None
+        if owner:
+            future = _screener_future = Future()
+
+    if not owner:
+        return future.result(timeout=SCREENER_WAIT_TIMEOUT_SEC)
+
+    try:
+        result = run_blocking(bot.screener.screen_coins)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _screener_lock:
+            _screener_future = None
+
+
 @app.route('/api/screener')
+@cached_response('screener')
 def run_screener():
     """Run market screener or get latest automated results"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify([])
 
     try:
-        import logging
-        import json
-        import os
-        from src.claude_analyst import convert_numpy_types
-        logger = logging.getLogger("CryptoBot.Web")
 
         # Check if we have recent automated results (within last hour)
-        automated_file = "data/latest_screener.json"
-        if os.path.exists(automated_file):
-            from datetime import datetime, timedelta
-            file_time = datetime.fromtimestamp(os.path.getmtime(automated_file))
-            if datetime.now() - file_time < timedelta(hours=1):
+        cached = load_json_cached("data/latest_screener.json")
+        if cached is not None:
+            data, mtime = cached
+            if datetime.now() - datetime.fromtimestamp(mtime) < timedelta(hours=1):
                 # Return automated results
-                with open(automated_file, 'r') as f:
-                    data = json.load(f)
                 logger.info(f"Returning automated screener results from {data['timestamp']}")
                 return jsonify(data['opportunities'])
 
         # Otherwise run manual screener
         logger.info("Running screener via API...")
-        opportunities = bot.screener.screen_coins()
+        opportunities = _screen_coins_shared(bot)
         logger.info(f"Screener found {len(opportunities)} opportunities")
 
         if opportunities:
             for i, opp in enumerate(opportunities[:3], 1):
                 logger.info(f"  {i}. {opp['product_id']}: {opp['signal']} (score: {opp['score']:.1f}, confidence: {opp['confidence']:.0f}%)")
 
-        # Convert numpy types to native Python types for JSON serialization
-        clean_opportunities = convert_numpy_types(opportunities)
-
-        return jsonify(clean_opportunities)
+        # orjson serializes numpy scalars/arrays natively; the stdlib provider needs them converted
+        if ORJSON_AVAILABLE:
+            return jsonify(opportunities)
+        return jsonify(convert_numpy_types(opportunities))
 
     except Exception as e:
-        import traceback
-        import logging
-        logger = logging.getLogger("CryptoBot.Web")
         error_details = traceback.format_exc()
         logger.error(f"Screener error: {e}")
         logger.error(f"Traceback:\n{error_details}")
@@ -357,34 +964,79 @@ def run_screener():
 def get_latest_claude_analysis():
     """Get latest automated Claude analysis"""
     try:
-        import json
-        import os
-        from datetime import datetime, timedelta
-
-        automated_file = "data/latest_claude_analysis.json"
-        if os.path.exists(automated_file):
-            with open(automated_file, 'r') as f:
-                data = json.load(f)
+
+        cached = load_json_cached("data/latest_claude_analysis.json")
+        if cached is not None:
+            data, _mtime = cached
             return jsonify({"success": True, "analysis": data['analysis'], "timestamp": data['timestamp']})
         else:
             return jsonify({"success": False, "error": "No automated analysis available yet"}), 404
 
     except Exception as e:
-        import logging
-        logger = logging.getLogger("CryptoBot.Web")
         logger.error(f"Error loading latest Claude analysis: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Manual Claude analyses run as background jobs: job_id -> job state
+ANALYSIS_JOBS_KEPT = 20
+analysis_jobs = OrderedDict()
+_analysis_jobs_lock = threading.Lock()
+
+
+def _set_analysis_job(job_id: str, job: dict):
+    """Store a job's state, dropping the oldest finished jobs (running ones are kept)"""
+    with _analysis_jobs_lock:
+        analysis_jobs[job_id] = job
+        analysis_jobs.move_to_end(job_id)
+
+        excess = len(analysis_jobs) - ANALYSIS_JOBS_KEPT
+        if excess > 0:
+            finished = [key for key, value in analysis_jobs.items() if value.get("status") != "running"]
+            for key in finished[:excess]:
+                del analysis_jobs[key]
+
+
 @app.route('/api/claude/analyze', methods=['POST'])
 def run_claude_analysis():
-    """Trigger manual Claude AI analysis"""
+    """Start a manual Claude AI analysis; the result arrives via 'claude_analysis' or polling"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
+    job_id = uuid.uuid4().hex
+    _set_analysis_job(job_id, {"status": "running"})
+    io_executor.submit(_run_claude_analysis_job, bot, job_id)
+
+    return jsonify({"success": True, "job_id": job_id, "status": "running"}), 202
+
+
+@app.route('/api/claude/analyze/<job_id>', methods=['GET'])
+def get_claude_analysis_job(job_id):
+    """Get the state of a manual Claude analysis job"""
+    with _analysis_jobs_lock:
+        job = analysis_jobs.get(job_id)
+
+    if job is None:
+        return jsonify({"success": False, "error": "Unknown job"}), 404
+
+    return jsonify({"success": job["status"] != "error", "job_id": job_id, **job})
+
+
+def _run_claude_analysis_job(bot, job_id: str):
+    """Run a manual Claude analysis and publish the result"""
+    job = _claude_analysis(bot)
+    _set_analysis_job(job_id, job)
+    socketio.emit('claude_analysis', {"success": job["status"] != "error", "job_id": job_id, **job})
+
+
+def _claude_analysis(bot) -> dict:
+    """
+    Build market context and ask Claude for an analysis
+
+    Returns:
+        Job state: {"status": "done", "analysis": ...} or {"status": "error", "error": ...}
+    """
     try:
-        import logging
-        logger = logging.getLogger("CryptoBot.Web")
 
         logger.info("Building market context for Claude analysis...")
         context = bot._build_market_context()
@@ -407,34 +1059,34 @@ def run_claude_analysis():
 
         if analysis:
             logger.info("✓ Claude analysis completed successfully")
-            return jsonify({"success": True, "analysis": analysis})
+            return {"status": "done", "analysis": convert_numpy_types(analysis)}
         else:
             logger.error("✗ Claude analysis returned None")
-            return jsonify({"success": False, "error": "Analysis returned empty result"}), 500
+            return {"status": "error", "error": "Analysis returned empty result"}
 
     except Exception as e:
-        import traceback
         error_details = traceback.format_exc()
-        logger = logging.getLogger("CryptoBot.Web")
         logger.error(f"Claude analysis error: {e}")
         logger.error(f"Traceback:\n{error_details}")
-        return jsonify({"success": False, "error": f"{str(e)} - Check logs for details"}), 500
+        return {"status": "error", "error": f"{str(e)} - Check logs for details"}
 
 
 @app.route('/api/trade/execute', methods=['POST'])
 def execute_trade():
     """Execute a Claude-recommended trade"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
     try:
-        data = request.json
+        data = request.get_json(silent=True) or {}
         product_id = data.get('product_id')
         position_size_pct = data.get('position_size_pct')
         stop_loss = data.get('stop_loss')
         take_profit = data.get('take_profit')
 
-        if not all([product_id, position_size_pct, stop_loss, take_profit]):
+        # A 0 stop loss / take profit is a valid value, only missing ones are rejected
+        if not product_id or not position_size_pct or None in (stop_loss, take_profit):
             return jsonify({"success": False, "error": "Missing required fields"}), 400
 
         # Get current price
@@ -451,6 +1103,7 @@ def execute_trade():
 
         # Open position
         success, message, details = bot._open_position(product_id, quantity, current_price, "Claude recommendation")
+        invalidate_response_cache(*TRADING_CACHE_KEYS)
 
         if success:
             return jsonify({
@@ -465,7 +1118,6 @@ def execute_trade():
             }), 400
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -473,17 +1125,18 @@ def execute_trade():
 @app.route('/api/trade/preview', methods=['POST'])
 def preview_trade():
     """Preview a manual trade with full breakdown"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
     try:
-        data = request.json
+        data = request.get_json(silent=True) or {}
         product_id = data.get('product_id')
         size_usd = data.get('size_usd')
         stop_loss_pct = data.get('stop_loss_pct')
         take_profit_pct = data.get('take_profit_pct')
 
-        if not all([product_id, size_usd]):
+        if not product_id or not size_usd:
             return jsonify({"success": False, "error": "Missing required fields"}), 400
 
         # Get current price
@@ -491,8 +1144,8 @@ def preview_trade():
         if not current_price:
             return jsonify({"success": False, "error": "Could not get current price"}), 400
 
-        # Calculate trade breakdown
-        taker_fee_rate = bot.config.get("coinbase_taker_fee", 0.008)
+        # Calculate trade breakdown (same fee rate the bot charges when executing)
+        taker_fee_rate = bot._taker_fee
         fee_amount = size_usd * taker_fee_rate
         quantity = size_usd / current_price
 
@@ -521,7 +1174,6 @@ def preview_trade():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -529,17 +1181,19 @@ def preview_trade():
 @app.route('/api/trade/manual', methods=['POST'])
 def manual_trade():
     """Execute a manual trade"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
     try:
-        data = request.json
+        data = request.get_json(silent=True) or {}
         product_id = data.get('product_id')
         size_usd = data.get('size_usd')
         stop_loss_pct = data.get('stop_loss_pct')
         take_profit_pct = data.get('take_profit_pct')
 
-        if not all([product_id, size_usd, stop_loss_pct, take_profit_pct]):
+        # A 0 stop loss / take profit is a valid value, only missing ones are rejected
+        if not product_id or not size_usd or None in (stop_loss_pct, take_profit_pct):
             return jsonify({"success": False, "error": "Missing required fields"}), 400
 
         # Get current price
@@ -552,6 +1206,7 @@ def manual_trade():
 
         # Open position
         success, message, details = bot._open_position(product_id, quantity, current_price, "Manual entry")
+        invalidate_response_cache(*TRADING_CACHE_KEYS)
 
         if success:
             return jsonify({
@@ -566,7 +1221,6 @@ def manual_trade():
             }), 400
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -574,6 +1228,7 @@ def manual_trade():
 @app.route('/api/position/close/<product_id>', methods=['POST'])
 def close_position(product_id):
     """Manually close a position"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
@@ -583,6 +1238,7 @@ def close_position(product_id):
             return jsonify({"success": False, "error": "Could not get current price"}), 400
 
         bot._close_position(product_id, current_price, "Manual close")
+        invalidate_response_cache(*TRADING_CACHE_KEYS)
 
         return jsonify({"success": True, "message": f"Closed {product_id}"})
 
@@ -590,17 +1246,54 @@ def close_position(product_id):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Past recommendations, newest first; loaded from disk once and kept in memory.
+# The file is JSON Lines, oldest first: saves append one line and the file is
+# compacted back to PAST_RECS_KEPT lines once it grows past twice that.
+PAST_RECS_FILE = "data/past_recommendations.jsonl"
+PAST_RECS_LEGACY_FILE = "data/past_recommendations.json"
+PAST_RECS_KEPT = 50
+_past_recs = None
+_past_recs_file_lines = 0
+_past_recs_lock = threading.Lock()
+
+
+def _get_past_recs() -> deque:
+    """Get the in-memory past recommendations, loading the file on first use (hold _past_recs_lock)"""
+    global _past_recs, _past_recs_file_lines
+    if _past_recs is not None:
+        return _past_recs
+
+    try:
+        with open(PAST_RECS_FILE, 'rb') as f:
+            records = [json_loads(line) for line in f if line.strip()]
+        _past_recs = deque(reversed(records[-PAST_RECS_KEPT:]), maxlen=PAST_RECS_KEPT)
+        _past_recs_file_lines = len(records)
+    except FileNotFoundError:
+        # Migrate the old newest-first JSON array, if any
+        try:
+            with open(PAST_RECS_LEGACY_FILE, 'rb') as f:
+                records = json_loads(f.read())
+        except FileNotFoundError:
+            records = []
+        _past_recs = deque(records, maxlen=PAST_RECS_KEPT)
+        _write_past_recs()
+    return _past_recs
+
+
+def _write_past_recs():
+    """Rewrite the past recommendations file from memory (hold _past_recs_lock)"""
+    global _past_recs_file_lines
+    write_text_atomic(PAST_RECS_FILE, "".join(json_dumps(rec) + "\n" for rec in reversed(_past_recs)))
+    _past_recs_file_lines = len(_past_recs)
+
+
 @app.route('/api/recommendations/past', methods=['GET'])
 def get_past_recommendations():
-    """Get past recommendations from file"""
+    """Get past recommendations"""
     try:
-        past_recs_file = "data/past_recommendations.json"
-        if os.path.exists(past_recs_file):
-            with open(past_recs_file, 'r') as f:
-                data = json.load(f)
-            return jsonify({"success": True, "recommendations": data})
-        else:
-            return jsonify({"success": True, "recommendations": []})
+        with _past_recs_lock:
+            recommendations = list(_get_past_recs())
+        return jsonify({"success": True, "recommendations": recommendations})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -608,30 +1301,23 @@ def get_past_recommendations():
 @app.route('/api/recommendations/past', methods=['POST'])
 def save_past_recommendation():
     """Save a past recommendation to file"""
+    global _past_recs_file_lines
     try:
-        data = request.json
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({"success": False, "error": "No data provided"}), 400
 
-        past_recs_file = "data/past_recommendations.json"
-
-        # Load existing recommendations
-        if os.path.exists(past_recs_file):
-            with open(past_recs_file, 'r') as f:
-                past_recs = json.load(f)
-        else:
-            past_recs = []
-
-        # Add new recommendation at the beginning
-        past_recs.insert(0, data)
-
-        # Keep only last 50
-        past_recs = past_recs[:50]
+        with _past_recs_lock:
+            past_recs = _get_past_recs()
 
-        # Save back to file
-        os.makedirs("data", exist_ok=True)
-        with open(past_recs_file, 'w') as f:
-            json.dump(past_recs, f, indent=2)
+            # Add new recommendation at the beginning (oldest beyond PAST_RECS_KEPT drop off)
+            past_recs.appendleft(data)
+            if _past_recs_file_lines >= 2 * PAST_RECS_KEPT:
+                _write_past_recs()
+            else:
+                with open(PAST_RECS_FILE, 'a') as f:
+                    f.write(json_dumps(data) + "\n")
+                _past_recs_file_lines += 1
 
         return jsonify({"success": True})
 
@@ -643,12 +1329,9 @@ def save_past_recommendation():
 def clear_past_recommendations():
     """Clear all past recommendations"""
     try:
-        past_recs_file = "data/past_recommendations.json"
-
-        # Write empty array to file
-        os.makedirs("data", exist_ok=True)
-        with open(past_recs_file, 'w') as f:
-            json.dump([], f, indent=2)
+        with _past_recs_lock:
+            _get_past_recs().clear()
+            _write_past_recs()
 
         return jsonify({"success": True})
 
@@ -656,17 +1339,65 @@ def clear_past_recommendations():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Standalone API clients used while no bot is running: bot attribute -> (config version, client)
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(attr: str, factory):
+    """
+    Get an API client, reusing the running bot's instance (and its warm
+    connections and caches) when there is one
+
+    Without a bot, one standalone client per kind is kept and rebuilt only
+    when the config file changes.
+
+    Args:
+        attr: TradingBot attribute holding the client (e.g. "coingecko")
+        factory: Function building a client from the config dictionary
+
+    Returns:
+        Client instance
+    """
+    bot = bot_registry.snapshot()
+    if bot:
+        return getattr(bot, attr)
+
+    config_manager = get_config_manager()
+    with _shared_clients_lock:
+        entry = _shared_clients.get(attr)
+        if entry is None or entry[0] != _config_version:
+            entry = (_config_version, factory(config_manager.get_all()))
+            _shared_clients[attr] = entry
+        return entry[1]
+
+
+def get_coinbase_client():
+    """
+    Get a Coinbase client with warm pooled connections
+
+    Returns:
+        The running bot's client, or a lazily created shared one
+    """
+    return get_shared_client("coinbase", lambda config: CoinbaseClient())
+
+
 @app.route('/api/test/coinbase', methods=['POST'])
 def test_coinbase():
     """Test Coinbase API connection"""
     try:
-        from src.coinbase_client import CoinbaseClient
+        client = get_coinbase_client()
+
+        def check():
+            """Connection test result and, when it passes, the USD balance"""
+            if not client.test_connection():
+                return False, None
+            return True, client.get_balance("USD")
 
-        client = CoinbaseClient()
-        success = client.test_connection()
+        # Both calls share one bound so a hung exchange can't pin the request thread
+        success, balance = call_with_timeout(check)
 
         if success:
-            balance = client.get_balance("USD")
             return jsonify({
                 "success": True,
                 "message": "Coinbase connection successful",
@@ -675,6 +1406,8 @@ def test_coinbase():
         else:
             return jsonify({"success": False, "error": "Connection test failed"}), 500
 
+    except FutureTimeoutError:
+        return jsonify({"success": False, "error": f"Coinbase did not respond within {IO_TIMEOUT_SEC}s"}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -683,10 +1416,7 @@ def test_coinbase():
 def test_claude():
     """Test Claude API connection"""
     try:
-        config_manager = ConfigManager()
-        from src.claude_analyst import ClaudeAnalyst
-
-        analyst = ClaudeAnalyst(config_manager.get_all())
+        analyst = get_shared_client("claude_analyst", ClaudeAnalyst)
 
         if analyst.client:
             return jsonify({
@@ -705,13 +1435,10 @@ def test_claude():
 def test_coingecko():
     """Test CoinGecko API connection"""
     try:
-        config_manager = ConfigManager()
-        from src.coingecko_data import CoinGeckoCollector
-
-        client = CoinGeckoCollector(config_manager.get_all())
+        client = get_shared_client("coingecko", CoinGeckoCollector)
 
         # Test by fetching trending coins
-        trending = client.get_trending_coins()
+        trending = call_with_timeout(client.get_trending_coins)
 
         if trending:
             trending_list = [f"{coin['symbol'].upper()}" for coin in trending[:5]]
@@ -729,6 +1456,8 @@ def test_coingecko():
                 "error": "Could not fetch trending coins from CoinGecko. API may be rate limited."
             }), 500
 
+    except FutureTimeoutError:
+        return jsonify({"success": False, "error": f"CoinGecko did not respond within {IO_TIMEOUT_SEC}s"}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -737,7 +1466,7 @@ def test_coingecko():
 def test_news_sentiment():
     """Test News Sentiment (Crypto Panic) API connection"""
     try:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         config = config_manager.get_all()
 
         if not config.get("news_sentiment_enabled", False):
@@ -746,9 +1475,7 @@ def test_news_sentiment():
                 "error": "News Sentiment is disabled in configuration. Enable it first to test."
             }), 400
 
-        from src.news_sentiment import NewsSentiment
-
-        analyzer = NewsSentiment(config)
+        analyzer = get_shared_client("news_sentiment", NewsSentiment)
 
         if not analyzer.enabled:
             return jsonify({
@@ -757,7 +1484,7 @@ def test_news_sentiment():
             }), 400
 
         # Test by getting BTC sentiment
-        sentiment = analyzer.get_sentiment("BTC-USD")
+        sentiment = call_with_timeout(analyzer.get_sentiment, "BTC-USD")
 
         if sentiment:
             return jsonify({
@@ -776,6 +1503,8 @@ def test_news_sentiment():
                 "error": "Could not fetch news sentiment. API may be rate limited (429 errors common on free tier)."
             }), 500
 
+    except FutureTimeoutError:
+        return jsonify({"success": False, "error": f"News sentiment API did not respond within {IO_TIMEOUT_SEC}s"}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -783,25 +1512,23 @@ def test_news_sentiment():
 @app.route('/api/debug/reset-account', methods=['POST'])
 def reset_account():
     """Reset account for testing - delete all positions and trades"""
+    bot = bot_registry.snapshot()
     try:
         deleted_files = []
 
-        # Delete positions file
-        positions_file = "data/positions.json"
-        if os.path.exists(positions_file):
-            os.remove(positions_file)
-            deleted_files.append(positions_file)
-
-        # Delete trades file
-        trades_file = "logs/trades.csv"
-        if os.path.exists(trades_file):
-            os.remove(trades_file)
-            deleted_files.append(trades_file)
+        # Delete positions and trades files
+        for path in ("data/positions.json", "logs/trades.csv"):
+            try:
+                os.remove(path)
+                deleted_files.append(path)
+            except FileNotFoundError:
+                pass
 
         # Reset bot state if running
         if bot:
             # Clear all positions
             bot.risk_manager.positions.clear()
+            bot.risk_manager.position_count = len(bot.risk_manager.positions)
 
             # Reset capital to initial
             bot.risk_manager.current_capital = bot.config.get("initial_capital", 600.0)
@@ -814,10 +1541,13 @@ def reset_account():
 
             # Save empty positions file
             bot.risk_manager._save_positions()
+            bot.mark_status_changed()
 
             # Recreate empty trades CSV
             bot.performance_tracker._initialize_trade_log()
 
+        invalidate_response_cache(*TRADING_CACHE_KEYS)
+
         return jsonify({
             "success": True,
             "message": "Account reset successfully! All positions and trades deleted.",
@@ -825,7 +1555,6 @@ def reset_account():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -833,30 +1562,32 @@ def reset_account():
 @app.route('/api/debug/reset-config', methods=['POST'])
 def reset_configuration():
     """Reset configuration to defaults - backs up current config first"""
+    bot = bot_registry.snapshot()
     try:
-        import shutil
-        from datetime import datetime
 
         config_file = "data/config.json"
         backup_file = f"data/config.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         # Backup existing config if it exists
-        if os.path.exists(config_file):
+        try:
             shutil.copy2(config_file, backup_file)
+        except FileNotFoundError:
+            backup_file = None
 
         # Reset bot config to defaults
         if bot:
             bot.config_manager.reset_to_defaults()
             bot.config_manager.save()
-            bot.config = bot.config_manager.get_all()
 
-            # Reinitialize components that depend on config
-            bot.screener.config = bot.config
+            # Reload in place so components that depend on config see the defaults
+            bot.reload_config()
+            get_config_manager(reload=True)
+            invalidate_response_cache('config')
 
             return jsonify({
                 "success": True,
                 "message": "Configuration reset to defaults! Backup saved.",
-                "backup_file": backup_file if os.path.exists(config_file) else None,
+                "backup_file": backup_file,
                 "coin_count": len(bot.config.get("screener_coins", [])),
                 "coins": bot.config.get("screener_coins", [])[:10]  # Show first 10
             })
@@ -864,46 +1595,168 @@ def reset_configuration():
             return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_log_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse a log line's "YYYY-MM-DD HH:MM:SS" prefix (US/Eastern wall time)
+
+    The format is fixed, so fields are sliced and converted directly instead of
+    going through strptime. Log lines share timestamps at one-second
+    resolution, so results are memoized.
+
+    Args:
+        timestamp_str: First 19 characters of a log line
+
+    Returns:
+        Naive datetime in Eastern wall time
+
+    Raises:
+        ValueError: If the prefix is not a timestamp
+    """
+    ts = timestamp_str
+    return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                    int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+
+
+def read_lines_reverse(path: str, chunk_size: int = 65536):
+    """
+    Yield a file's lines newest-first, reading backwards from the end in chunks
+
+    Args:
+        path: File path
+        chunk_size: Bytes read per seek
+
+    Yields:
+        Decoded lines (with their trailing newline)
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        remainder = b''
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + remainder).splitlines(keepends=True)
+            # First line may continue in the previous chunk
+            remainder = lines.pop(0) if lines else b''
+            for line in reversed(lines):
+                yield line.decode('utf-8', 'replace')
+        if remainder:
+            yield remainder.decode('utf-8', 'replace')
+
+
+def read_tail(path: str, max_bytes: int = 65536) -> str:
+    """
+    Read the last max_bytes of a file, starting at a line boundary
+
+    Args:
+        path: File path
+        max_bytes: Maximum number of bytes to read
+
+    Returns:
+        Decoded tail of the file
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        data = f.read()
+
+    if size > max_bytes:
+        # Drop the partial first line
+        data = data[data.find(b'\n') + 1:]
+    return data.decode('utf-8', 'replace')
+
+
+def tail_lines(path: str, n: int, max_bytes: int = 1_048_576) -> list:
+    """
+    Get the last n lines of a file without reading the whole file
+
+    Args:
+        path: File path
+        n: Number of lines to return
+        max_bytes: Maximum number of bytes to read from the end of the file
+
+    Returns:
+        Up to n lines, oldest first
+    """
+    return read_tail(path, max_bytes).split('\n')[-n:]
+
+
+def file_etag(path: str) -> str:
+    """ETag for a file derived from its modification time and size"""
+    st = os.stat(path)
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+# flask-compress rewrites the ETag of compressed responses to "<etag>:<algorithm>"
+ETAG_ENCODING_SUFFIXES = ('', ':br', ':gzip')
+
+
+def not_modified(etag: str):
+    """Header-only 304 response if the client already has this version"""
+    if_none_match = request.if_none_match
+    if any(if_none_match.contains(etag + suffix) for suffix in ETAG_ENCODING_SUFFIXES):
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def with_etag(response, etag: str):
+    """Attach a revalidation ETag to a response"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
 @app.route('/api/logs/bot')
 def get_bot_logs():
     """Get bot logs (last 2 days)"""
     try:
-        from datetime import datetime, timedelta
         log_file = "logs/bot.log"
 
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
+        try:
+            etag = file_etag(log_file)
+        except FileNotFoundError:
+            return jsonify({"logs": []})
 
-            # Filter for last 2 days
-            cutoff_time = datetime.now(EASTERN) - timedelta(days=2)
-            filtered_lines = []
+        # Polling clients get a 304 until the log is written again
+        cached = not_modified(etag)
+        if cached:
+            return cached
 
-            for line in lines:
-                # Try to parse timestamp from line (format: YYYY-MM-DD HH:MM:SS EST)
-                try:
-                    if len(line) > 19:
-                        timestamp_str = line[:19]  # Extract "YYYY-MM-DD HH:MM:SS"
-                        log_time = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                        log_time = EASTERN.localize(log_time)
+        # Filter for last 2 days (naive Eastern, to compare with log timestamps)
+        cutoff_time = datetime.now(EASTERN).replace(tzinfo=None) - timedelta(days=2)
+        filtered_lines = []
 
-                        if log_time >= cutoff_time:
-                            filtered_lines.append(line)
-                except:
-                    # If timestamp parsing fails, include the line anyway
-                    filtered_lines.append(line)
+        # Read newest first and stop at the first line older than the cutoff
+        for line in read_lines_reverse(log_file):
+            # Try to parse timestamp from line (format: YYYY-MM-DD HH:MM:SS EST)
+            if len(line) <= 19:
+                continue
+            if line[4] != '-' or line[7] != '-':
+                # Continuation line (e.g. traceback) without a timestamp, include it
+                filtered_lines.append(line)
+                continue
 
-            # Reverse so newest is first
-            filtered_lines.reverse()
+            try:
+                log_time = parse_log_timestamp(line[:19])  # "YYYY-MM-DD HH:MM:SS"
+            except ValueError:
+                # If timestamp parsing fails, include the line anyway
+                filtered_lines.append(line)
+                continue
 
-            return jsonify({"logs": filtered_lines})
-        else:
-            return jsonify({"logs": []})
+            if log_time < cutoff_time:
+                break
+            filtered_lines.append(line)
+
+        return with_etag(jsonify({"logs": filtered_lines}), etag)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -911,16 +1764,19 @@ def get_bot_logs():
 
 @app.route('/api/logs/claude')
 def get_claude_logs():
-    """Get Claude analysis logs"""
+    """Get Claude analysis logs (last 64 KiB)"""
     try:
         log_file = "logs/claude_analysis.log"
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                content = f.read()
-                return jsonify({"logs": content})
-        else:
+        try:
+            etag = file_etag(log_file)
+        except FileNotFoundError:
             return jsonify({"logs": "No Claude analysis logs available"})
 
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        return with_etag(jsonify({"logs": read_tail(log_file)}), etag)
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -928,6 +1784,7 @@ def get_claude_logs():
 @app.route('/api/debug/export-all', methods=['GET'])
 def export_all_data():
     """Export all system data for analysis"""
+    bot = bot_registry.snapshot()
     try:
         export_data = {
             "export_timestamp": datetime.now().isoformat(),
@@ -940,10 +1797,9 @@ def export_all_data():
 
         # 1. Configuration Settings
         try:
-            config_file = "data/config.json"
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    export_data["configuration"] = json.load(f)
+            cached = load_json_cached("data/config.json")
+            if cached:
+                export_data["configuration"] = cached[0]
             else:
                 export_data["configuration"] = {"error": "No config file found"}
         except Exception as e:
@@ -951,32 +1807,20 @@ def export_all_data():
 
         # 2. Open Positions
         try:
-            positions_file = "data/positions.json"
-            if os.path.exists(positions_file):
-                with open(positions_file, 'r') as f:
-                    positions_data = json.load(f)
-                    export_data["positions"] = positions_data
+            cached = load_json_cached("data/positions.json")
+            if cached:
+                export_data["positions"] = cached[0]
             else:
                 export_data["positions"] = {"_metadata": {}, "positions": {}}
         except Exception as e:
             export_data["positions"] = {"error": str(e)}
 
-        # 3. All Trades (from CSV)
-        try:
-            if bot and hasattr(bot, 'performance_tracker'):
-                trades = bot.performance_tracker.get_all_trades()
-                export_data["trades"] = trades
-                export_data["trade_count"] = len(trades)
-            else:
-                export_data["trades"] = []
-                export_data["trade_count"] = 0
-        except Exception as e:
-            export_data["trades"] = {"error": str(e)}
+        # 3. All Trades (from CSV) are streamed after the other sections, see below
 
         # 4. Performance Metrics
         try:
             if bot and hasattr(bot, 'performance_tracker'):
-                metrics = bot.performance_tracker.calculate_metrics()
+                metrics = run_blocking(bot.performance_tracker.calculate_metrics)
                 export_data["performance_metrics"] = metrics
             else:
                 export_data["performance_metrics"] = {"error": "Bot not running"}
@@ -992,7 +1836,7 @@ def export_all_data():
                     "daily_pnl": bot.risk_manager.daily_pnl,
                     "daily_trades": bot.risk_manager.daily_trades,
                     "total_drawdown": bot.risk_manager.total_drawdown,
-                    "open_positions_count": len(bot.risk_manager.positions)
+                    "open_positions_count": bot.risk_manager.position_count
                 }
             else:
                 export_data["capital_state"] = {"error": "Bot not running"}
@@ -1022,10 +1866,9 @@ def export_all_data():
 
         # 7. Recent Screener Results (if available)
         try:
-            screener_cache_file = "data/screener_cache.json"
-            if os.path.exists(screener_cache_file):
-                with open(screener_cache_file, 'r') as f:
-                    export_data["screener_results"] = json.load(f)
+            cached = load_json_cached("data/screener_cache.json")
+            if cached:
+                export_data["screener_results"] = cached[0]
             else:
                 export_data["screener_results"] = {"note": "No cached screener results"}
         except Exception as e:
@@ -1033,16 +1876,10 @@ def export_all_data():
 
         # 8. Claude Analysis History (recent logs)
         try:
-            claude_log_file = "logs/claude_analysis.log"
-            if os.path.exists(claude_log_file):
-                with open(claude_log_file, 'r') as f:
-                    content = f.read()
-                    # Get last 50 lines or 5000 characters, whichever is smaller
-                    lines = content.split('\n')
-                    recent_lines = lines[-50:] if len(lines) > 50 else lines
-                    export_data["claude_analysis_log"] = '\n'.join(recent_lines)
-            else:
-                export_data["claude_analysis_log"] = "No Claude analysis logs available"
+            recent_lines = tail_lines("logs/claude_analysis.log", 50)
+            export_data["claude_analysis_log"] = '\n'.join(recent_lines)
+        except FileNotFoundError:
+            export_data["claude_analysis_log"] = "No Claude analysis logs available"
         except Exception as e:
             export_data["claude_analysis_log"] = {"error": str(e)}
 
@@ -1057,13 +1894,13 @@ def export_all_data():
 
             bot_log_content = None
             for log_file in possible_log_files:
-                if log_file and os.path.exists(log_file):
-                    with open(log_file, 'r') as f:
-                        content = f.read()
-                        lines = content.split('\n')
-                        recent_lines = lines[-100:] if len(lines) > 100 else lines
-                        bot_log_content = '\n'.join(recent_lines)
+                if not log_file:
+                    continue
+                try:
+                    bot_log_content = '\n'.join(tail_lines(log_file, 100))
                     break
+                except FileNotFoundError:
+                    continue
 
             if bot_log_content:
                 export_data["bot_logs"] = bot_log_content
@@ -1082,15 +1919,42 @@ def export_all_data():
         except Exception as e:
             export_data["bot_status"] = {"error": str(e)}
 
-        return jsonify(export_data)
+        # The trade log can be long, so it is written row by row at the end of
+        # the object instead of being loaded into export_data
+        if bot and hasattr(bot, 'performance_tracker'):
+            trades = bot.performance_tracker.iter_trades()
+        else:
+            trades = ()
+        trade_count = 0
+
+        def counted(rows):
+            nonlocal trade_count
+            for row in rows:
+                trade_count += 1
+                yield row
+
+        def generate():
+            yield app.json.dumps(export_data)[:-1] + ',"trades":'
+            yield from iter_json_array(counted(trades))
+            yield f',"trade_count":{trade_count}}}'
+
+        return app.response_class(stream_with_context(generate()), mimetype='application/json')
 
     except Exception as e:
         return jsonify({"error": f"Export failed: {str(e)}"}), 500
 
 
+def autostart_bot():
+    """Create the trading bot and start it in a background thread"""
+    try:
+        bot_registry.start()
+        print("✓ Trading bot auto-started")
+    except Exception as e:
+        print(f"✗ Failed to auto-start bot: {e}")
+
+
 def main():
-    """Run Flask server"""
-    global bot, bot_thread
+    """Run Flask server (development; production uses gunicorn_conf.py)"""
 
     # Configure Flask/Werkzeug logger to use Eastern timezone
     werkzeug_logger = logging.getLogger('werkzeug')
@@ -1104,19 +1968,28 @@ def main():
     print("Dashboard will be available at http://localhost:8779")
     print("=" * 80)
 
-    # Auto-start the bot
-    try:
-        bot = TradingBot()
-        bot_thread = threading.Thread(target=bot.start)
-        bot_thread.daemon = True
-        bot_thread.start()
-        print("✓ Trading bot auto-started")
-    except Exception as e:
-        print(f"✗ Failed to auto-start bot: {e}")
+    autostart_bot()
 
     print("=" * 80)
 
-    socketio.run(app, host='0.0.0.0', port=8779, debug=False, allow_unsafe_werkzeug=True)
+    run_kwargs = {}
+    if ASYNC_MODE == "threading":
+        # Werkzeug's dev server is only used in the default threading mode
+        run_kwargs['allow_unsafe_werkzeug'] = True
+
+    socketio.run(app, host='0.0.0.0', port=8779, debug=False, **run_kwargs)
+
+
+# Files the intelligence bundle is built from, besides config.json and the trade log
+INTELLIGENCE_INPUT_FILES = (
+    "data/latest_screener.json",
+    "data/latest_claude_analysis.json",
+    "logs/claude_analysis.log",
+    "logs/cryptobot.log",
+)
+# Live prices and market context in the bundle go stale even when no file changes
+INTELLIGENCE_CACHE_MAX_AGE_SEC = 30
+_intelligence_cache = (None, 0.0, "", b"")
 
 
 @app.route('/api/debug/intelligence-export', methods=['POST'])
@@ -1125,19 +1998,34 @@ def intelligence_export():
     Comprehensive intelligence export for AI analysis
     Returns complete snapshot of bot state, decisions, and results
     """
+    global _intelligence_cache
+    bot = bot_registry.snapshot()
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         time_range_hours = int(data.get('time_range', 24))
         output_format = data.get('format', 'json')  # 'json' or 'markdown'
 
-        from datetime import timedelta
-
-        # Calculate cutoff time
-        cutoff_time = datetime.now() - timedelta(hours=time_range_hours)
+        # Reuse the last bundle while none of its inputs changed
+        get_config_manager()  # Refreshes _config_version if the file changed
+        input_files = INTELLIGENCE_INPUT_FILES
+        if bot and hasattr(bot, 'performance_tracker'):
+            input_files += (bot.performance_tracker.trade_log_file,)
+        key = (
+            time_range_hours, output_format, id(bot), bot.status_version if bot else None,
+            _config_version, tuple(_config_file_version(path) for path in input_files)
+        )
+        cached_key, expires_at, etag, body = _intelligence_cache
+        if cached_key == key and time.monotonic() < expires_at:
+            return not_modified(etag) or with_etag(
+                app.response_class(body, mimetype='application/json'), etag)
+
+        # Calculate cutoff time (naive Eastern wall time, like trade timestamps)
+        now_eastern = datetime.now(EASTERN)
+        cutoff_time = now_eastern.replace(tzinfo=None) - timedelta(hours=time_range_hours)
 
         intelligence_data = {
             "meta": {
-                "export_timestamp": datetime.now(EASTERN).strftime('%Y-%m-%d %H:%M:%S %Z'),
+                "export_timestamp": now_eastern.strftime('%Y-%m-%d %H:%M:%S %Z'),
                 "bot_version": __version__,
                 "time_range_hours": time_range_hours,
                 "time_range_start": cutoff_time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -1147,44 +2035,43 @@ def intelligence_export():
 
         # === 1. CURRENT CONFIGURATION & STRATEGY ===
         try:
-            config_file = "data/config.json"
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    intelligence_data["configuration"] = {
-                        "trading_parameters": {
-                            "initial_capital": config.get("initial_capital"),
-                            "max_positions": config.get("max_positions"),
-                            "position_size_pct": config.get("position_size_pct"),
-                            "stop_loss_pct": config.get("stop_loss_pct"),
-                            "take_profit_pct": config.get("take_profit_pct"),
-                            "max_daily_loss_pct": config.get("max_daily_loss_pct"),
-                            "max_drawdown_pct": config.get("max_drawdown_pct"),
-                            "trailing_stop_enabled": config.get("trailing_stop_enabled"),
-                            "trailing_stop_activation_pct": config.get("trailing_stop_activation_pct"),
-                            "trailing_stop_distance_pct": config.get("trailing_stop_distance_pct")
-                        },
-                        "screener_settings": {
-                            "mode": config.get("screener_mode"),
-                            "max_results": config.get("screener_max_results"),
-                            "monitored_coins": config.get("screener_coins", []),
-                            "coin_count": len(config.get("screener_coins", []))
-                        },
-                        "claude_ai_settings": {
-                            "enabled": config.get("claude_enabled"),
-                            "analysis_mode": config.get("claude_analysis_mode"),
-                            "prompt_strategy": config.get("claude_prompt_strategy"),
-                            "confidence_threshold": config.get("claude_confidence_threshold"),
-                            "risk_tolerance": config.get("claude_risk_tolerance"),
-                            "analysis_schedule": config.get("claude_analysis_schedule"),
-                            "max_trade_suggestions": config.get("claude_max_trade_suggestions")
-                        },
-                        "data_sources": {
-                            "news_sentiment_enabled": config.get("news_sentiment_enabled"),
-                            "coingecko_enabled": config.get("coingecko_enabled")
-                        },
-                        "mode": "DRY_RUN" if config.get("dry_run") else "LIVE_TRADING"
-                    }
+            cached = load_json_cached("data/config.json")
+            if cached:
+                config = cached[0]
+                intelligence_data["configuration"] = {
+                    "trading_parameters": {
+                        "initial_capital": config.get("initial_capital"),
+                        "max_positions": config.get("max_positions"),
+                        "position_size_pct": config.get("position_size_pct"),
+                        "stop_loss_pct": config.get("stop_loss_pct"),
+                        "take_profit_pct": config.get("take_profit_pct"),
+                        "max_daily_loss_pct": config.get("max_daily_loss_pct"),
+                        "max_drawdown_pct": config.get("max_drawdown_pct"),
+                        "trailing_stop_enabled": config.get("trailing_stop_enabled"),
+                        "trailing_stop_activation_pct": config.get("trailing_stop_activation_pct"),
+                        "trailing_stop_distance_pct": config.get("trailing_stop_distance_pct")
+                    },
+                    "screener_settings": {
+                        "mode": config.get("screener_mode"),
+                        "max_results": config.get("screener_max_results"),
+                        "monitored_coins": config.get("screener_coins", []),
+                        "coin_count": len(config.get("screener_coins", []))
+                    },
+                    "claude_ai_settings": {
+                        "enabled": config.get("claude_enabled"),
+                        "analysis_mode": config.get("claude_analysis_mode"),
+                        "prompt_strategy": config.get("claude_prompt_strategy"),
+                        "confidence_threshold": config.get("claude_confidence_threshold"),
+                        "risk_tolerance": config.get("claude_risk_tolerance"),
+                        "analysis_schedule": config.get("claude_analysis_schedule"),
+                        "max_trade_suggestions": config.get("claude_max_trade_suggestions")
+                    },
+                    "data_sources": {
+                        "news_sentiment_enabled": config.get("news_sentiment_enabled"),
+                        "coingecko_enabled": config.get("coingecko_enabled")
+                    },
+                    "mode": "DRY_RUN" if config.get("dry_run") else "LIVE_TRADING"
+                }
         except Exception as e:
             intelligence_data["configuration"] = {"error": str(e)}
 
@@ -1192,6 +2079,28 @@ def intelligence_export():
         try:
             if bot and hasattr(bot, 'risk_manager'):
                 rm = bot.risk_manager
+                positions = list(rm.positions.values())
+                # One batched price fetch for every open position
+                prices = bot.data_collector.get_current_prices(
+                    [pos.product_id for pos in positions]
+                ) if positions else {}
+
+                def position_entry(pos):
+                    """Export entry for a position, with P&L when it could be priced"""
+                    current_price = prices.get(pos.product_id)
+                    pnl = rm.get_position_pnl(pos.product_id, current_price) if current_price else None
+                    return {
+                        "product_id": pos.product_id,
+                        "quantity": pos.quantity,
+                        "entry_price": pos.entry_price,
+                        "current_price": current_price,
+                        "unrealized_pnl": pnl["net_pnl"] if pnl else None,
+                        "unrealized_pnl_pct": pnl["pnl_pct"] if pnl else None,
+                        "entry_time": pos.timestamp.isoformat(),
+                        "stop_loss": rm.get_stop_loss_price(pos.product_id),
+                        "take_profit": rm.get_take_profit_price(pos.product_id)
+                    }
+
                 intelligence_data["portfolio_state"] = {
                     "current_capital": rm.current_capital,
                     "initial_capital": rm.initial_capital,
@@ -1200,21 +2109,8 @@ def intelligence_export():
                     "daily_pnl": rm.daily_pnl,
                     "daily_trades": rm.daily_trades,
                     "total_drawdown": rm.total_drawdown,
-                    "open_positions_count": len(rm.positions),
-                    "open_positions": [
-                        {
-                            "product_id": pos["product_id"],
-                            "quantity": pos["quantity"],
-                            "entry_price": pos["entry_price"],
-                            "current_price": pos.get("current_price"),
-                            "unrealized_pnl": pos.get("unrealized_pnl"),
-                            "unrealized_pnl_pct": pos.get("unrealized_pnl_pct"),
-                            "entry_time": pos.get("entry_time"),
-                            "stop_loss": pos.get("stop_loss"),
-                            "take_profit": pos.get("take_profit")
-                        }
-                        for pos in rm.get_all_positions()
-                    ]
+                    "open_positions_count": rm.position_count,
+                    "open_positions": [position_entry(pos) for pos in positions]
                 }
             else:
                 intelligence_data["portfolio_state"] = {"error": "Bot not running"}
@@ -1224,11 +2120,7 @@ def intelligence_export():
         # === 3. TRADE HISTORY (filtered by time range) ===
         try:
             if bot and hasattr(bot, 'performance_tracker'):
-                all_trades = bot.performance_tracker.get_all_trades()
-                recent_trades = [
-                    trade for trade in all_trades
-                    if datetime.fromisoformat(trade.get("entry_time", "1970-01-01")) >= cutoff_time
-                ]
+                recent_trades = bot.performance_tracker.get_trades_since(cutoff_time)
                 intelligence_data["trade_history"] = {
                     "total_trades_in_range": len(recent_trades),
                     "trades": recent_trades
@@ -1241,7 +2133,7 @@ def intelligence_export():
         # === 4. PERFORMANCE METRICS ===
         try:
             if bot and hasattr(bot, 'performance_tracker'):
-                metrics = bot.performance_tracker.calculate_metrics()
+                metrics = run_blocking(bot.performance_tracker.calculate_metrics)
                 intelligence_data["performance_metrics"] = metrics
             else:
                 intelligence_data["performance_metrics"] = {"error": "Bot not running"}
@@ -1251,16 +2143,15 @@ def intelligence_export():
         # === 5. SCREENER RESULTS & DECISIONS ===
         try:
             # Get latest screener results
-            screener_file = "data/latest_screener.json"
-            if os.path.exists(screener_file):
-                with open(screener_file, 'r') as f:
-                    screener_data = json.load(f)
-                    intelligence_data["screener_results"] = {
-                        "timestamp": screener_data.get("timestamp"),
-                        "active_mode": screener_data.get("mode"),
-                        "opportunity_count": len(screener_data.get("opportunities", [])),
-                        "opportunities": screener_data.get("opportunities", [])
-                    }
+            cached = load_json_cached("data/latest_screener.json")
+            if cached:
+                screener_data = cached[0]
+                intelligence_data["screener_results"] = {
+                    "timestamp": screener_data.get("timestamp"),
+                    "active_mode": screener_data.get("mode"),
+                    "opportunity_count": len(screener_data.get("opportunities", [])),
+                    "opportunities": screener_data.get("opportunities", [])
+                }
             else:
                 intelligence_data["screener_results"] = {"note": "No recent screener results"}
         except Exception as e:
@@ -1269,29 +2160,26 @@ def intelligence_export():
         # === 6. CLAUDE AI ANALYSIS & RECOMMENDATIONS ===
         try:
             # Get latest Claude analysis
-            claude_file = "data/latest_claude_analysis.json"
-            if os.path.exists(claude_file):
-                with open(claude_file, 'r') as f:
-                    claude_data = json.load(f)
-                    analysis = claude_data.get("analysis", {})
-                    intelligence_data["claude_analysis"] = {
-                        "timestamp": claude_data.get("timestamp"),
-                        "market_assessment": analysis.get("market_assessment"),
-                        "recommended_actions": analysis.get("recommended_actions", []),
-                        "risk_warnings": analysis.get("risk_warnings", []),
-                        "config_suggestions": analysis.get("config_suggestions", [])
-                    }
+            cached = load_json_cached("data/latest_claude_analysis.json")
+            if cached:
+                claude_data = cached[0]
+                analysis = claude_data.get("analysis", {})
+                intelligence_data["claude_analysis"] = {
+                    "timestamp": claude_data.get("timestamp"),
+                    "market_assessment": analysis.get("market_assessment"),
+                    "recommended_actions": analysis.get("recommended_actions", []),
+                    "risk_warnings": analysis.get("risk_warnings", []),
+                    "config_suggestions": analysis.get("config_suggestions", [])
+                }
             else:
                 intelligence_data["claude_analysis"] = {"note": "No recent Claude analysis"}
 
             # Get Claude analysis logs (recent)
-            claude_log = "logs/claude_analysis.log"
-            if os.path.exists(claude_log):
-                with open(claude_log, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    recent_lines = lines[-100:]
-                    intelligence_data["claude_analysis_log"] = '\n'.join(recent_lines)
+            try:
+                recent_lines = tail_lines("logs/claude_analysis.log", 100)
+                intelligence_data["claude_analysis_log"] = '\n'.join(recent_lines)
+            except FileNotFoundError:
+                pass
         except Exception as e:
             intelligence_data["claude_analysis"] = {"error": str(e)}
 
@@ -1321,46 +2209,48 @@ def intelligence_export():
         except Exception as e:
             intelligence_data["market_context"] = {"error": str(e)}
 
+        # Sections 8 and 9 both work on the end of the bot log, so read it once
+        bot_log_tail = None
+        try:
+            bot_log_tail = tail_lines("logs/cryptobot.log", 500)  # Last 500 lines
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            intelligence_data["rejected_opportunities"] = {"error": str(e)}
+            intelligence_data["bot_decision_log"] = {"error": str(e)}
+
         # === 8. REJECTED OPPORTUNITIES (Why didn't we trade?) ===
         try:
-            # Parse bot logs for rejected opportunities
-            bot_log_file = "logs/cryptobot.log"
-            if os.path.exists(bot_log_file):
-                with open(bot_log_file, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                    # Look for rejection reasons in recent logs
-                    rejection_keywords = ["rejected", "skipped", "blocked", "failed", "insufficient"]
-                    rejections = []
-                    for line in lines[-500:]:  # Last 500 lines
-                        if any(keyword in line.lower() for keyword in rejection_keywords):
-                            rejections.append(line)
-
-                    intelligence_data["rejected_opportunities"] = {
-                        "count": len(rejections),
-                        "reasons": rejections[-50:]  # Last 50 rejections
-                    }
+            if bot_log_tail is not None:
+                # Look for rejection reasons in recent logs
+                rejections = [line for line in bot_log_tail if REJECTION_RE.search(line)]
+
+                intelligence_data["rejected_opportunities"] = {
+                    "count": len(rejections),
+                    "reasons": rejections[-50:]  # Last 50 rejections
+                }
         except Exception as e:
             intelligence_data["rejected_opportunities"] = {"error": str(e)}
 
         # === 9. BOT DECISION LOG (Recent actions) ===
         try:
-            bot_log_file = "logs/cryptobot.log"
-            if os.path.exists(bot_log_file):
-                with open(bot_log_file, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    intelligence_data["bot_decision_log"] = '\n'.join(lines[-200:])
+            if bot_log_tail is not None:
+                intelligence_data["bot_decision_log"] = '\n'.join(bot_log_tail[-200:])
         except Exception as e:
             intelligence_data["bot_decision_log"] = {"error": str(e)}
 
         # === Convert to Markdown if requested ===
         if output_format == 'markdown':
-            markdown_content = _convert_to_markdown(intelligence_data)
-            return jsonify({"format": "markdown", "content": markdown_content})
+            markdown_content = run_blocking(_convert_to_markdown, intelligence_data)
+            result = {"format": "markdown", "content": markdown_content}
         else:
-            return jsonify({"format": "json", "content": intelligence_data})
+            result = {"format": "json", "content": intelligence_data}
+
+        body = app.json.dumps(result).encode()
+        etag = hashlib.md5(body).hexdigest()
+        _intelligence_cache = (key, time.monotonic() + INTELLIGENCE_CACHE_MAX_AGE_SEC, etag, body)
+        return not_modified(etag) or with_etag(
+            app.response_class(body, mimetype='application/json'), etag)
 
     except Exception as e:
         return jsonify({"error": f"Intelligence export failed: {str(e)}"}), 500
@@ -1369,13 +2259,16 @@ def intelligence_export():
 def _convert_to_markdown(data: dict) -> str:
     """Convert intelligence data to markdown format"""
     md = []
+    meta = data['meta']
 
-    md.append("# 🧠 CryptoBot Intelligence Export\n")
-    md.append(f"**Generated:** {data['meta']['export_timestamp']}")
-    md.append(f"**Bot Version:** {data['meta']['bot_version']}")
-    md.append(f"**Time Range:** Last {data['meta']['time_range_hours']} hours")
-    md.append(f"**Analysis Period:** {data['meta']['time_range_start']} to present\n")
-    md.append("---\n")
+    md.extend([
+        "# 🧠 CryptoBot Intelligence Export\n",
+        f"**Generated:** {meta['export_timestamp']}",
+        f"**Bot Version:** {meta['bot_version']}",
+        f"**Time Range:** Last {meta['time_range_hours']} hours",
+        f"**Analysis Period:** {meta['time_range_start']} to present\n",
+        "---\n"
+    ])
 
     # Configuration
     if "configuration" in data:
@@ -1385,94 +2278,116 @@ def _convert_to_markdown(data: dict) -> str:
         if "trading_parameters" in config:
             md.append("### Trading Parameters")
             tp = config["trading_parameters"]
-            md.append(f"- **Initial Capital:** ${tp.get('initial_capital', 0):,.2f}")
-            md.append(f"- **Max Positions:** {tp.get('max_positions')}")
-            md.append(f"- **Position Size:** {tp.get('position_size_pct', 0)*100:.1f}%")
-            md.append(f"- **Stop Loss:** {tp.get('stop_loss_pct', 0)*100:.1f}%")
-            md.append(f"- **Take Profit:** {tp.get('take_profit_pct', 0)*100:.1f}%")
-            md.append(f"- **Max Daily Loss:** {tp.get('max_daily_loss_pct', 0)*100:.1f}%")
-            md.append(f"- **Max Drawdown:** {tp.get('max_drawdown_pct', 0)*100:.1f}%")
-            md.append(f"- **Trailing Stop:** {'Enabled' if tp.get('trailing_stop_enabled') else 'Disabled'}\n")
+            md.extend([
+                f"- **Initial Capital:** ${tp.get('initial_capital', 0):,.2f}",
+                f"- **Max Positions:** {tp.get('max_positions')}",
+                f"- **Position Size:** {tp.get('position_size_pct', 0)*100:.1f}%",
+                f"- **Stop Loss:** {tp.get('stop_loss_pct', 0)*100:.1f}%",
+                f"- **Take Profit:** {tp.get('take_profit_pct', 0)*100:.1f}%",
+                f"- **Max Daily Loss:** {tp.get('max_daily_loss_pct', 0)*100:.1f}%",
+                f"- **Max Drawdown:** {tp.get('max_drawdown_pct', 0)*100:.1f}%",
+                f"- **Trailing Stop:** {'Enabled' if tp.get('trailing_stop_enabled') else 'Disabled'}\n"
+            ])
 
         if "screener_settings" in config:
             md.append("### Screener Settings")
             ss = config["screener_settings"]
-            md.append(f"- **Mode:** {ss.get('mode')}")
-            md.append(f"- **Max Results:** {ss.get('max_results')}")
-            md.append(f"- **Monitored Coins:** {ss.get('coin_count')} coins\n")
+            md.extend([
+                f"- **Mode:** {ss.get('mode')}",
+                f"- **Max Results:** {ss.get('max_results')}",
+                f"- **Monitored Coins:** {ss.get('coin_count')} coins\n"
+            ])
 
         if "claude_ai_settings" in config:
             md.append("### Claude AI Settings")
             cs = config["claude_ai_settings"]
-            md.append(f"- **Enabled:** {cs.get('enabled')}")
-            md.append(f"- **Mode:** {cs.get('analysis_mode')}")
-            md.append(f"- **Prompt Strategy:** {cs.get('prompt_strategy')}")
-            md.append(f"- **Confidence Threshold:** {cs.get('confidence_threshold')}%")
-            md.append(f"- **Risk Tolerance:** {cs.get('risk_tolerance')}")
-            md.append(f"- **Schedule:** {cs.get('analysis_schedule')}\n")
+            md.extend([
+                f"- **Enabled:** {cs.get('enabled')}",
+                f"- **Mode:** {cs.get('analysis_mode')}",
+                f"- **Prompt Strategy:** {cs.get('prompt_strategy')}",
+                f"- **Confidence Threshold:** {cs.get('confidence_threshold')}%",
+                f"- **Risk Tolerance:** {cs.get('risk_tolerance')}",
+                f"- **Schedule:** {cs.get('analysis_schedule')}\n"
+            ])
 
     # Portfolio State
-    if "portfolio_state" in data and "error" not in data["portfolio_state"]:
+    ps = data.get("portfolio_state")
+    if ps is not None and "error" not in ps:
         md.append("## 💰 Current Portfolio State\n")
-        ps = data["portfolio_state"]
-        md.append(f"- **Current Capital:** ${ps.get('current_capital', 0):,.2f}")
-        md.append(f"- **Initial Capital:** ${ps.get('initial_capital', 0):,.2f}")
-        md.append(f"- **Total P&L:** ${ps.get('total_pnl', 0):+,.2f} ({ps.get('total_pnl_pct', 0):+.2f}%)")
-        md.append(f"- **Daily P&L:** ${ps.get('daily_pnl', 0):+,.2f}")
-        md.append(f"- **Daily Trades:** {ps.get('daily_trades', 0)}")
-        md.append(f"- **Total Drawdown:** {ps.get('total_drawdown', 0):.2f}%")
-        md.append(f"- **Open Positions:** {ps.get('open_positions_count', 0)}\n")
+        md.extend([
+            f"- **Current Capital:** ${ps.get('current_capital', 0):,.2f}",
+            f"- **Initial Capital:** ${ps.get('initial_capital', 0):,.2f}",
+            f"- **Total P&L:** ${ps.get('total_pnl', 0):+,.2f} ({ps.get('total_pnl_pct', 0):+.2f}%)",
+            f"- **Daily P&L:** ${ps.get('daily_pnl', 0):+,.2f}",
+            f"- **Daily Trades:** {ps.get('daily_trades', 0)}",
+            f"- **Total Drawdown:** {ps.get('total_drawdown', 0):.2f}%",
+            f"- **Open Positions:** {ps.get('open_positions_count', 0)}\n"
+        ])
 
         if ps.get('open_positions'):
             md.append("### Open Positions")
             for pos in ps['open_positions']:
-                md.append(f"\n**{pos['product_id']}:**")
-                md.append(f"- Entry: ${pos['entry_price']:,.2f}")
-                md.append(f"- Current: ${pos.get('current_price', 0):,.2f}")
-                md.append(f"- P&L: ${pos.get('unrealized_pnl', 0):+,.2f} ({pos.get('unrealized_pnl_pct', 0):+.2f}%)")
+                current_price = pos.get('current_price')
+                pnl = pos.get('unrealized_pnl')
+                md.extend([
+                    f"\n**{pos['product_id']}:**",
+                    f"- Entry: ${pos['entry_price']:,.2f}",
+                    f"- Current: ${current_price:,.2f}" if current_price is not None else "- Current: N/A",
+                    f"- P&L: ${pnl:+,.2f} ({pos.get('unrealized_pnl_pct') or 0:+.2f}%)" if pnl is not None
+                    else "- P&L: N/A"
+                ])
 
     # Trade History
-    if "trade_history" in data and "error" not in data["trade_history"]:
-        md.append(f"\n## 📊 Trade History ({data['trade_history'].get('total_trades_in_range', 0)} trades)\n")
-        trades = data["trade_history"].get("trades", [])
+    th = data.get("trade_history")
+    if th is not None and "error" not in th:
+        md.append(f"\n## 📊 Trade History ({th.get('total_trades_in_range', 0)} trades)\n")
+        trades = th.get("trades", [])
         for i, trade in enumerate(trades[:10], 1):  # Show first 10
-            md.append(f"\n### Trade #{i}: {trade.get('product_id')}")
-            md.append(f"- **Action:** {trade.get('action')}")
-            md.append(f"- **Entry:** ${trade.get('entry_price', 0):,.2f} @ {trade.get('entry_time')}")
-            md.append(f"- **Exit:** ${trade.get('exit_price', 0):,.2f} @ {trade.get('exit_time')}")
-            md.append(f"- **P&L:** ${trade.get('pnl', 0):+,.2f} ({trade.get('pnl_pct', 0):+.2f}%)")
-            md.append(f"- **Reason:** {trade.get('exit_reason', 'N/A')}")
+            md.extend([
+                f"\n### Trade #{i}: {trade.get('product_id')}",
+                f"- **Action:** {trade.get('action')}",
+                f"- **Entry:** ${trade.get('entry_price', 0):,.2f} @ {trade.get('entry_time')}",
+                f"- **Exit:** ${trade.get('exit_price', 0):,.2f} @ {trade.get('exit_time')}",
+                f"- **P&L:** ${trade.get('pnl', 0):+,.2f} ({trade.get('pnl_pct', 0):+.2f}%)",
+                f"- **Reason:** {trade.get('exit_reason', 'N/A')}"
+            ])
 
     # Screener Results
-    if "screener_results" in data and "error" not in data["screener_results"]:
+    sr = data.get("screener_results")
+    if sr is not None and "error" not in sr:
         md.append(f"\n## 🔍 Latest Screener Results\n")
-        sr = data["screener_results"]
-        md.append(f"- **Timestamp:** {sr.get('timestamp')}")
-        md.append(f"- **Active Mode:** {sr.get('active_mode')}")
-        md.append(f"- **Opportunities Found:** {sr.get('opportunity_count')}\n")
+        md.extend([
+            f"- **Timestamp:** {sr.get('timestamp')}",
+            f"- **Active Mode:** {sr.get('active_mode')}",
+            f"- **Opportunities Found:** {sr.get('opportunity_count')}\n"
+        ])
 
         if sr.get('opportunities'):
             md.append("### Top Opportunities")
             for opp in sr['opportunities'][:5]:
-                md.append(f"\n**{opp.get('product_id')}:**")
-                md.append(f"- Score: {opp.get('score', 0):.1f}")
-                md.append(f"- Signal: {opp.get('signal')}")
-                md.append(f"- Confidence: {opp.get('confidence', 0)}%")
-                md.append(f"- Price: ${opp.get('price', 0):,.2f}")
-                md.append(f"- 24h Change: {opp.get('price_change_24h', 0):+.2f}%")
+                md.extend([
+                    f"\n**{opp.get('product_id')}:**",
+                    f"- Score: {opp.get('score', 0):.1f}",
+                    f"- Signal: {opp.get('signal')}",
+                    f"- Confidence: {opp.get('confidence', 0)}%",
+                    f"- Price: ${opp.get('price', 0):,.2f}",
+                    f"- 24h Change: {opp.get('price_change_24h', 0):+.2f}%"
+                ])
 
     # Claude Analysis
-    if "claude_analysis" in data and "error" not in data["claude_analysis"]:
+    ca = data.get("claude_analysis")
+    if ca is not None and "error" not in ca:
         md.append("\n## 🤖 Claude AI Analysis\n")
-        ca = data["claude_analysis"]
         md.append(f"- **Timestamp:** {ca.get('timestamp')}\n")
 
-        if "market_assessment" in ca and ca["market_assessment"]:
-            ma = ca["market_assessment"]
-            md.append("### Market Assessment")
-            md.append(f"- **Regime:** {ma.get('regime', 'N/A').upper()}")
-            md.append(f"- **Confidence:** {ma.get('confidence', 0)}%")
-            md.append(f"- **Risk Level:** {ma.get('risk_level', 'N/A').upper()}\n")
+        ma = ca.get("market_assessment")
+        if ma:
+            md.extend([
+                "### Market Assessment",
+                f"- **Regime:** {ma.get('regime', 'N/A').upper()}",
+                f"- **Confidence:** {ma.get('confidence', 0)}%",
+                f"- **Risk Level:** {ma.get('risk_level', 'N/A').upper()}\n"
+            ])
 
             if ma.get('key_factors'):
                 md.append("**Key Factors:**")
@@ -1482,14 +2397,16 @@ def _convert_to_markdown(data: dict) -> str:
         if ca.get('recommended_actions'):
             md.append("\n### Recommended Actions")
             for i, rec in enumerate(ca['recommended_actions'], 1):
-                md.append(f"\n**Recommendation #{i}:**")
-                md.append(f"- **Coin:** {rec.get('coin')}")
-                md.append(f"- **Action:** {rec.get('action').upper()}")
-                md.append(f"- **Conviction:** {rec.get('conviction', 0)}%")
-                md.append(f"- **Entry:** ${rec.get('target_entry', 0):,.2f}")
-                md.append(f"- **Stop Loss:** ${rec.get('stop_loss', 0):,.2f}")
-                md.append(f"- **Take Profit:** {rec.get('take_profit', [])}")
-                md.append(f"- **Reasoning:** {rec.get('reasoning', 'N/A')}")
+                md.extend([
+                    f"\n**Recommendation #{i}:**",
+                    f"- **Coin:** {rec.get('coin')}",
+                    f"- **Action:** {rec.get('action').upper()}",
+                    f"- **Conviction:** {rec.get('conviction', 0)}%",
+                    f"- **Entry:** ${rec.get('target_entry', 0):,.2f}",
+                    f"- **Stop Loss:** ${rec.get('stop_loss', 0):,.2f}",
+                    f"- **Take Profit:** {rec.get('take_profit', [])}",
+                    f"- **Reasoning:** {rec.get('reasoning', 'N/A')}"
+                ])
 
         if ca.get('risk_warnings'):
             md.append("\n### ⚠️ Risk Warnings")
@@ -1497,33 +2414,39 @@ def _convert_to_markdown(data: dict) -> str:
                 md.append(f"- {warning}")
 
     # Market Context
-    if "market_context" in data and "error" not in data["market_context"]:
+    mc = data.get("market_context")
+    if mc is not None and "error" not in mc:
         md.append("\n## 🌍 Market Context\n")
-        mc = data["market_context"]
 
-        if "fear_greed_index" in mc and mc["fear_greed_index"]:
-            fg = mc["fear_greed_index"]
+        fg = mc.get("fear_greed_index")
+        if fg:
             md.append(f"- **Fear & Greed Index:** {fg.get('value')} ({fg.get('classification')})")
 
-        if "btc_data" in mc and mc["btc_data"]:
-            btc = mc["btc_data"]
-            md.append(f"- **BTC Price:** ${btc.get('price', 0):,.2f}")
-            md.append(f"- **BTC 24h Change:** {btc.get('price_change_24h', 0):+.2f}%")
-            md.append(f"- **BTC 7d Change:** {btc.get('price_change_7d', 0):+.2f}%")
+        btc = mc.get("btc_data")
+        if btc:
+            md.extend([
+                f"- **BTC Price:** ${btc.get('price', 0):,.2f}",
+                f"- **BTC 24h Change:** {btc.get('price_change_24h', 0):+.2f}%",
+                f"- **BTC 7d Change:** {btc.get('price_change_7d', 0):+.2f}%"
+            ])
 
     # Performance Metrics
-    if "performance_metrics" in data and "error" not in data["performance_metrics"]:
+    pm = data.get("performance_metrics")
+    if pm is not None and "error" not in pm:
         md.append("\n## 📈 Performance Metrics\n")
-        pm = data["performance_metrics"]
-        md.append(f"- **Total Trades:** {pm.get('total_trades', 0)}")
-        md.append(f"- **Win Rate:** {pm.get('win_rate', 0):.1f}%")
-        md.append(f"- **Average Win:** {pm.get('avg_win', 0):.2f}%")
-        md.append(f"- **Average Loss:** {pm.get('avg_loss', 0):.2f}%")
-        md.append(f"- **Profit Factor:** {pm.get('profit_factor', 0):.2f}")
-        md.append(f"- **Sharpe Ratio:** {pm.get('sharpe_ratio', 0):.2f}")
-
-    md.append("\n---\n")
-    md.append("*Generated by CryptoBot Intelligence Export*")
+        md.extend([
+            f"- **Total Trades:** {pm.get('total_trades', 0)}",
+            f"- **Win Rate:** {pm.get('win_rate', 0):.1f}%",
+            f"- **Average Win:** {pm.get('avg_win', 0):.2f}%",
+            f"- **Average Loss:** {pm.get('avg_loss', 0):.2f}%",
+            f"- **Profit Factor:** {pm.get('profit_factor', 0):.2f}",
+            f"- **Sharpe Ratio:** {pm.get('sharpe_ratio', 0):.2f}"
+        ])
+
+    md.extend([
+        "\n---\n",
+        "*Generated by CryptoBot Intelligence Export*"
+    ])
 
     return '\n'.join(md)
 
@@ -1534,19 +2457,19 @@ def bot_health_check():
     Automated bot health check - analyzes logic consistency and performance
     Checks last N hours of data for problems, strategy alignment, and trade quality
     """
+    bot = bot_registry.snapshot()
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         time_range_hours = int(data.get('time_range', 6))  # Default 6 hours
         include_recommendations = data.get('include_recommendations', True)
 
-        from datetime import timedelta
-        import logging
         logger = logging.getLogger("CryptoBot.HealthCheck")
 
-        cutoff_time = datetime.now() - timedelta(hours=time_range_hours)
+        now_eastern = datetime.now(EASTERN)
+        cutoff_time = now_eastern.replace(tzinfo=None) - timedelta(hours=time_range_hours)
 
         health_report = {
-            "timestamp": datetime.now(EASTERN).strftime('%Y-%m-%d %H:%M:%S %Z'),
+            "timestamp": now_eastern.strftime('%Y-%m-%d %H:%M:%S %Z'),
             "time_range_hours": time_range_hours,
             "overall_health": "OK",  # Will be updated to WARNING or CRITICAL
             "issues": [],
@@ -1570,20 +2493,22 @@ def bot_health_check():
         except Exception as e:
             logger.warning(f"Could not get bot status: {e}")
 
-        # Force bot to refresh its Fear & Greed Index
+        # Force bot to refresh its Fear & Greed Index (used by CHECK 2 below)
+        fear_greed = None
         try:
             if bot and hasattr(bot, 'data_collector'):
-                bot.data_collector.get_fear_greed_index(use_cache=False)
+                fear_greed = bot.data_collector.get_fear_greed_index(use_cache=False)
         except Exception as e:
             logger.warning(f"Could not refresh Fear & Greed: {e}")
 
-        # Force bot to refresh current prices for all positions
+        # Force bot to refresh current prices for all positions in one batch
+        # (used by CHECK 5 and CHECK 6 below)
+        prices = {}
         try:
-            if bot and hasattr(bot, 'risk_manager'):
+            if bot and hasattr(bot, 'risk_manager') and hasattr(bot, 'data_collector'):
                 positions = bot.risk_manager.get_all_positions()
-                for pos in positions:
-                    if hasattr(bot, 'data_collector'):
-                        bot.data_collector.get_current_price(pos['product_id'], use_cache=False)
+                prices = bot.data_collector.get_current_prices(
+                    [pos['product_id'] for pos in positions], use_cache=False)
         except Exception as e:
             logger.warning(f"Could not refresh position prices: {e}")
 
@@ -1608,7 +2533,6 @@ def bot_health_check():
             config = bot.config
 
             # Check market regime vs strategy alignment
-            fear_greed = bot.data_collector.get_fear_greed_index()
             if fear_greed:
                 fg_value = fear_greed.get('value', 50)
                 screener_mode = config.get('screener_mode', 'auto')
@@ -1716,22 +2640,20 @@ def bot_health_check():
         # === CHECK 3: Recent Trade Quality ===
         try:
             if hasattr(bot, 'performance_tracker'):
-                all_trades = bot.performance_tracker.get_all_trades()
-                recent_trades = [
-                    t for t in all_trades
-                    if datetime.fromisoformat(t.get("entry_time", "1970-01-01")) >= cutoff_time
-                ]
+                tracker = bot.performance_tracker
+                summary = tracker.summarize_closed_trades(tracker.get_trades_since(cutoff_time))
+                closed_count = summary["closed"]
+                winning_count = summary["wins"]
 
-                if recent_trades:
+                if closed_count:
                     # Calculate win rate
-                    winning_trades = [t for t in recent_trades if t.get('pnl', 0) > 0]
-                    win_rate = (len(winning_trades) / len(recent_trades)) * 100
+                    win_rate = (winning_count / closed_count) * 100
 
                     if win_rate < 30:
                         health_report["issues"].append({
                             "severity": "CRITICAL",
                             "category": "Trade Quality",
-                            "issue": f"Win rate very low: {win_rate:.1f}% ({len(winning_trades)}/{len(recent_trades)} trades)",
+                            "issue": f"Win rate very low: {win_rate:.1f}% ({winning_count}/{closed_count} trades)",
                             "impact": "Strategy not working in current market",
                             "current_value": f"{win_rate:.1f}%",
                             "expected_value": ">40%"
@@ -1746,7 +2668,7 @@ def bot_health_check():
                         health_report["warnings"].append({
                             "severity": "WARNING",
                             "category": "Trade Quality",
-                            "issue": f"Win rate below target: {win_rate:.1f}% ({len(winning_trades)}/{len(recent_trades)} trades)",
+                            "issue": f"Win rate below target: {win_rate:.1f}% ({winning_count}/{closed_count} trades)",
                             "impact": "Suboptimal performance",
                             "current_value": f"{win_rate:.1f}%",
                             "target_value": ">45%"
@@ -1756,13 +2678,12 @@ def bot_health_check():
                     else:
                         health_report["ok_checks"].append({
                             "category": "Trade Quality",
-                            "check": f"Win rate healthy: {win_rate:.1f}% ({len(winning_trades)}/{len(recent_trades)} trades)"
+                            "check": f"Win rate healthy: {win_rate:.1f}% ({winning_count}/{closed_count} trades)"
                         })
 
                     # Check average loss size
-                    losing_trades = [t for t in recent_trades if t.get('pnl', 0) < 0]
-                    if losing_trades:
-                        avg_loss_pct = sum(t.get('pnl_pct', 0) for t in losing_trades) / len(losing_trades)
+                    if summary["losses"]:
+                        avg_loss_pct = summary["avg_loss_pct"]
                         if avg_loss_pct < -8:
                             health_report["warnings"].append({
                                 "severity": "WARNING",
@@ -1878,13 +2799,16 @@ def bot_health_check():
                 positions = bot.risk_manager.get_all_positions()
 
                 if positions:
+                    screener_cached = load_json_cached("data/latest_screener.json")
+                    screener_opportunities = screener_cached[0].get('opportunities', []) if screener_cached else []
+
                     # Check each position for problems
                     for pos in positions:
                         product_id = pos['product_id']
                         entry_price = pos['entry_price']
 
                         # Get current price
-                        current_price = bot.data_collector.get_current_price(product_id)
+                        current_price = prices.get(product_id)
                         if current_price:
                             pnl_pct = ((current_price - entry_price) / entry_price) * 100
 
@@ -1905,29 +2829,25 @@ def bot_health_check():
                                     })
 
                             # Check if screener now says SELL
-                            screener_file = "data/latest_screener.json"
-                            if os.path.exists(screener_file):
-                                with open(screener_file, 'r') as f:
-                                    screener_data = json.load(f)
-                                    for opp in screener_data.get('opportunities', []):
-                                        if opp.get('product_id') == product_id:
-                                            signal = opp.get('signal', '').lower()
-                                            if 'sell' in signal:
-                                                health_report["warnings"].append({
-                                                    "severity": "WARNING",
-                                                    "category": "Open Positions",
-                                                    "issue": f"{product_id} now has {signal.upper()} signal",
-                                                    "impact": "Holding position contradicting current analysis",
-                                                    "current_pnl": f"{pnl_pct:.1f}%",
-                                                    "signal": signal
-                                                })
-                                                if health_report["overall_health"] == "OK":
-                                                    health_report["overall_health"] = "WARNING"
-                                                if include_recommendations:
-                                                    health_report["recommendations"].append({
-                                                        "priority": "MEDIUM",
-                                                        "action": f"Consider closing {product_id} - signals turned bearish"
-                                                    })
+                            for opp in screener_opportunities:
+                                if opp.get('product_id') == product_id:
+                                    signal = opp.get('signal', '').lower()
+                                    if 'sell' in signal:
+                                        health_report["warnings"].append({
+                                            "severity": "WARNING",
+                                            "category": "Open Positions",
+                                            "issue": f"{product_id} now has {signal.upper()} signal",
+                                            "impact": "Holding position contradicting current analysis",
+                                            "current_pnl": f"{pnl_pct:.1f}%",
+                                            "signal": signal
+                                        })
+                                        if health_report["overall_health"] == "OK":
+                                            health_report["overall_health"] = "WARNING"
+                                        if include_recommendations:
+                                            health_report["recommendations"].append({
+                                                "priority": "MEDIUM",
+                                                "action": f"Consider closing {product_id} - signals turned bearish"
+                                            })
                 else:
                     health_report["ok_checks"].append({
                         "category": "Open Positions",
@@ -1953,7 +2873,7 @@ def bot_health_check():
                         quantity = pos['quantity']
 
                         # Get current price for this position
-                        current_price = bot.data_collector.get_current_price(product_id)
+                        current_price = prices.get(product_id)
                         if current_price:
                             position_value = quantity * current_price
                             total_position_value += position_value
@@ -2092,7 +3012,6 @@ def bot_health_check():
         return jsonify(health_report)
 
     except Exception as e:
-        import traceback
         logger = logging.getLogger("CryptoBot.HealthCheck")
         logger.error(f"Health check failed: {e}")
         logger.error(traceback.format_exc())
@@ -2118,6 +3037,7 @@ def tradingview_webhook():
         "message": "Signal details" (optional)
     }
     """
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
@@ -2127,7 +3047,7 @@ def tradingview_webhook():
             return jsonify({"success": False, "error": "TradingView webhooks are disabled"}), 403
 
         # Get request data
-        data = request.json
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({"success": False, "error": "No JSON data received"}), 400
 
@@ -2229,6 +3149,7 @@ def tradingview_webhook():
                 current_price,
                 f"TradingView: {message}" if message else "TradingView signal"
             )
+            invalidate_response_cache(*TRADING_CACHE_KEYS)
 
             return jsonify({
                 "success": success,
@@ -2263,6 +3184,7 @@ def tradingview_webhook():
                 current_price,
                 f"TradingView: {message}" if message else "TradingView signal"
             )
+            invalidate_response_cache(*TRADING_CACHE_KEYS)
 
             return jsonify({
                 "success": success,
@@ -2275,7 +3197,6 @@ def tradingview_webhook():
             })
 
     except Exception as e:
-        import traceback
         logging.error(f"TradingView webhook error: {e}")
         logging.error(traceback.format_exc())
         return jsonify({"success": False, "error": str(e)}), 500
@@ -2284,11 +3205,11 @@ def tradingview_webhook():
 @app.route('/api/charts/position-history/<product_id>', methods=['GET'])
 def get_position_history(product_id):
     """Get 7-day price history for an open position"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
     try:
-        from datetime import datetime, timedelta
 
         # Get position info
         positions = bot.risk_manager.get_all_positions()
@@ -2323,11 +3244,11 @@ def get_position_history(product_id):
 @app.route('/api/charts/screener-momentum', methods=['GET'])
 def get_screener_momentum():
     """Get momentum data for top 10 screener results"""
+    bot = bot_registry.snapshot()
     if not bot:
         return jsonify({"success": False, "error": "Bot not initialized"}), 400
 
     try:
-        from datetime import datetime, timedelta
 
         # Get latest screener results from localStorage (frontend will send this)
         # For now, run screener to get current top 10
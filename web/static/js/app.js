@@ -1,6 +1,7 @@
 // CryptoBot Dashboard JavaScript
 
 let refreshInterval = null;
+let socket = null;
 
 // Initialize dashboard on load
 document.addEventListener('DOMContentLoaded', function() {
@@ -19,6 +20,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // Setup auto-refresh
     startAutoRefresh();
 
+    // Live updates pushed by the bot after each check
+    setupLiveUpdates();
+
     // Setup event listeners
     setupEventListeners();
 });
@@ -138,6 +142,20 @@ function startAutoRefresh() {
     }, 300000); // Refresh every 5 minutes
 }
 
+// Live Updates (Socket.IO push; REST polling remains the fallback)
+function setupLiveUpdates() {
+    if (typeof io === 'undefined') {
+        console.warn('Socket.IO client not loaded - using polling only');
+        return;
+    }
+
+    socket = io();
+    socket.on('status', updateStatusDisplay);
+    socket.on('balance', renderBalance);
+    socket.on('positions', renderPositions);
+    socket.on('performance', renderPerformanceSummary);
+}
+
 function stopAutoRefresh() {
     if (refreshInterval) {
         clearInterval(refreshInterval);
@@ -524,30 +542,15 @@ async function loadDashboard() {
     try {
         // Load balance
         const balanceResponse = await fetch('/api/balance');
-        const balanceData = await balanceResponse.json();
-        document.getElementById('balance-usd').textContent = formatUSD(balanceData.balance_usd);
+        renderBalance(await balanceResponse.json());
 
         // Load positions
         const positionsResponse = await fetch('/api/positions');
-        const positions = await positionsResponse.json();
-        document.getElementById('position-count').textContent = positions.length;
-        displayPositions(positions);
+        renderPositions(await positionsResponse.json());
 
         // Load performance
         const perfResponse = await fetch('/api/performance');
-        const perf = await perfResponse.json();
-        document.getElementById('total-pnl').textContent = formatUSD(perf.total_pnl || 0);
-        document.getElementById('win-rate').textContent = (perf.win_rate || 0).toFixed(1) + '%';
-
-        // Apply color to P&L
-        const pnlElement = document.getElementById('total-pnl');
-        if (perf.total_pnl > 0) {
-            pnlElement.classList.add('positive');
-            pnlElement.classList.remove('negative');
-        } else if (perf.total_pnl < 0) {
-            pnlElement.classList.add('negative');
-            pnlElement.classList.remove('positive');
-        }
+        renderPerformanceSummary(await perfResponse.json());
 
         // Load recent trades
         const tradesResponse = await fetch('/api/trades');
@@ -565,6 +568,30 @@ async function loadDashboard() {
     }
 }
 
+function renderBalance(balanceData) {
+    document.getElementById('balance-usd').textContent = formatUSD(balanceData.balance_usd);
+}
+
+function renderPositions(positions) {
+    document.getElementById('position-count').textContent = positions.length;
+    displayPositions(positions);
+}
+
+function renderPerformanceSummary(perf) {
+    document.getElementById('total-pnl').textContent = formatUSD(perf.total_pnl || 0);
+    document.getElementById('win-rate').textContent = (perf.win_rate || 0).toFixed(1) + '%';
+
+    // Apply color to P&L
+    const pnlElement = document.getElementById('total-pnl');
+    if (perf.total_pnl > 0) {
+        pnlElement.classList.add('positive');
+        pnlElement.classList.remove('negative');
+    } else if (perf.total_pnl < 0) {
+        pnlElement.classList.add('negative');
+        pnlElement.classList.remove('positive');
+    }
+}
+
 function displayPositions(positions) {
     const container = document.getElementById('positions-container');
 
@@ -958,7 +985,12 @@ async function runClaudeAnalysis() {
         document.getElementById('claude-recommendations-container').innerHTML = '<p>Analyzing market...</p>';
 
         const response = await fetch('/api/claude/analyze', {method: 'POST'});
-        const result = await response.json();
+        let result = await response.json();
+
+        // Analysis runs as a background job; wait for its result
+        if (result.success && result.job_id) {
+            result = await waitForClaudeJob(result.job_id);
+        }
 
         if (result.success) {
             // Add timestamp to analysis
@@ -995,6 +1027,43 @@ async function runClaudeAnalysis() {
     }
 }
 
+// Resolve with a Claude job's result, pushed over Socket.IO or polled as a fallback
+function waitForClaudeJob(jobId) {
+    return new Promise((resolve) => {
+        let pollTimer = null;
+
+        const finish = (result) => {
+            clearInterval(pollTimer);
+            if (socket) {
+                socket.off('claude_analysis', onPush);
+            }
+            resolve(result);
+        };
+
+        const onPush = (result) => {
+            if (result.job_id === jobId) {
+                finish(result);
+            }
+        };
+
+        if (socket) {
+            socket.on('claude_analysis', onPush);
+        }
+
+        pollTimer = setInterval(async () => {
+            try {
+                const response = await fetch(`/api/claude/analyze/${jobId}`);
+                const result = await response.json();
+                if (result.status !== 'running') {
+                    finish(result);
+                }
+            } catch (error) {
+                console.error('Error polling Claude analysis job:', error);
+            }
+        }, 5000);
+    });
+}
+
 // Load saved Claude analysis on page load
 // Load latest automated Claude analysis from server
 async function loadLatestClaudeAnalysis() {